@@ -1,26 +1,617 @@
+import os
+
 import pytest
 
+from local_app.server import LocalSauceDemo
+from pages.base_page import BasePage
+from utils import instrumentation, visual
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.cart_page import CartPage
+from utils.context_pool import ContextPool
+from utils.duration_scheduler import DurationRecorder, make_scheduler
+from utils.failure_trace import FailureTracer, trace_dir
+from utils.har_cache import HarRecorder, har_path
+from utils.journeys import JourneySnapshots, restore_snapshot
+from utils.profiles import DEFAULT_PROFILE, PROFILES
+from utils.resource_policy import ResourcePolicy
+from utils.retries import HISTORY_PATH, OutcomeRecorder, RetryPlugin, load_history, quarantined
+from utils.test_impact import IMPACT_DIR, DependencyIndex, ImpactSink, changed_symbols, load_runtime_coverage, select
+from utils.web_vitals import DEFAULT_BUDGETS_PATH, WebVitalsCollector, load_budgets
+
+# All SauceDemo accounts share the same password.
+PASSWORD = "secret_sauce"
+
+# Command line options for this project.
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "SauceDemo test suite")
+    # --profile picks browser launch/context settings, see utils/profiles.py.
+    group.addoption(
+        "--profile",
+        choices=sorted(PROFILES),
+        default=os.environ.get("PW_PROFILE", DEFAULT_PROFILE),
+        help=f"Execution profile (env: PW_PROFILE, default: {DEFAULT_PROFILE}).",
+    )
+    # --app=local serves the bundled stand-in from localhost, for offline agents and stable timings.
+    group.addoption(
+        "--app",
+        choices=["live", "local"],
+        default=os.environ.get("SAUCEDEMO_APP", "live"),
+        help="Run against the live SauceDemo site or the bundled local stand-in (env: SAUCEDEMO_APP).",
+    )
+    # --network=record saves the traffic of passing tests to tests/hars/<module>.har,
+    # --network=replay serves it back (unmatched requests still go to the network).
+    group.addoption(
+        "--network",
+        choices=["live", "record", "replay"],
+        default=os.environ.get("SAUCEDEMO_NETWORK", "live"),
+        help="Use the live network, record HAR files, or replay them (env: SAUCEDEMO_NETWORK).",
+    )
+    # --resources=fast blocks images, fonts, media and third-party requests;
+    # tests marked @pytest.mark.needs_assets always get everything.
+    group.addoption(
+        "--resources",
+        choices=["fast", "full"],
+        default=os.environ.get("SAUCEDEMO_RESOURCES", "fast"),
+        help="Block non-essential resources (fast) or load everything (full) (env: SAUCEDEMO_RESOURCES).",
+    )
+    # --reuse-contexts serves logged_in_context/logged_in_page from a pool of warm contexts.
+    group.addoption(
+        "--reuse-contexts",
+        action="store_true",
+        default=False,
+        help="Recycle browser contexts between tests instead of creating one per test.",
+    )
+    # --instrument times every page-object method and SmartLocator lookup.
+    # Repeat it to use several sinks: --instrument=spans.jsonl --instrument=allure
+    group.addoption(
+        "--instrument",
+        action="append",
+        default=[],
+        metavar="SINK",
+        help="Record page-object timings to a JSONL file path or to 'allure' attachments.",
+    )
+    # --web-vitals captures load performance after navigations, logins and cart visits,
+    # attaches it to Allure and fails tests that exceed the budgets in perf_budgets.json.
+    group.addoption(
+        "--web-vitals",
+        action="store_true",
+        default=os.environ.get("SAUCEDEMO_WEB_VITALS") == "1",
+        help="Collect web vitals and enforce performance budgets (env: SAUCEDEMO_WEB_VITALS=1).",
+    )
+    # --duration-schedule packs tests onto xdist workers by their recorded durations
+    # (.test_durations.json, updated at the end of every run that uses the option).
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="Schedule pytest-xdist workers by historical test durations (longest first, grouped by browser and role).",
+    )
+    # --changed-since runs only the tests whose page objects, locators, fixtures or own code
+    # changed since a git ref; --record-impact adds the code each test really ran to the index.
+    group.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Only run tests affected by changes since this git ref (e.g. origin/main).",
+    )
+    group.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Record which page-object code every test runs, to make --changed-since more precise.",
+    )
+    group.addoption(
+        "--perf-budgets",
+        default=DEFAULT_BUDGETS_PATH,
+        help="JSON file with performance budgets for --web-vitals (default: perf_budgets.json).",
+    )
+    # --trace-failures records a Playwright trace of every test but only saves those of failed tests.
+    group.addoption(
+        "--trace-failures",
+        action="store_true",
+        default=os.environ.get("SAUCEDEMO_TRACE_FAILURES") == "1",
+        help="Trace every test and save the trace only when it fails (env: SAUCEDEMO_TRACE_FAILURES=1).",
+    )
+    # --retries re-runs a failed test right away in the same worker, with a fresh context
+    # but the warm browser and saved logins (see utils/retries.py).
+    group.addoption(
+        "--retries",
+        type=int,
+        default=int(os.environ.get("SAUCEDEMO_RETRIES", "0")),
+        help="Re-run a failed test up to this many times (env: SAUCEDEMO_RETRIES, default: 0).",
+    )
+    # Runs with --retries or --test-history append the outcome of each test (passed, flaky
+    # or failed) to the history file; plain local runs only read it.
+    # Tests whose history is flakier than --flaky-threshold are quarantined:
+    #   --quarantine=last  run them after everything else (default; with -n and --duration-schedule,
+    #                      after everything else on the same worker)
+    #   --quarantine=skip  leave them out, e.g. for the critical path of a CI build
+    #   --quarantine=only  run only them, e.g. in a separate low-priority CI phase
+    #   --quarantine=off   treat them like any other test
+    group.addoption(
+        "--test-history",
+        default=None,
+        help="Record outcomes in this file and read the quarantine from it (default: .test_history.json, "
+             "recorded only with --retries).",
+    )
+    group.addoption(
+        "--flaky-threshold",
+        type=float,
+        default=0.2,
+        help="Quarantine tests with at least this share of flaky runs in their history (default: 0.2).",
+    )
+    group.addoption(
+        "--quarantine",
+        choices=["last", "skip", "only", "off"],
+        default="last",
+        help="What to do with quarantined flaky tests (default: last).",
+    )
+    # --update-snapshots rewrites the baselines of the visual checks that run (tests/snapshots/<browser>/).
+    group.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Save the current screenshots as the new baselines of assert_snapshot instead of comparing.",
+    )
+    # --missing-snapshots decides what a visual check without a baseline does:
+    #   save  save the current screenshot as the baseline and skip (default)
+    #   fail  fail with the screenshot attached, for CI once the baselines are committed
+    #         (a baseline saved there would be lost with the checkout)
+    group.addoption(
+        "--missing-snapshots",
+        choices=["save", "fail"],
+        default="save",
+        help="What assert_snapshot does without a baseline (default: save).",
+    )
+
+# With --duration-schedule the controller (or the only process without xdist) records test durations.
+# The same process keeps the pass/fail history; retries happen wherever the tests run.
+def pytest_configure(config):
+    if config.getoption("--duration-schedule") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(), "duration_recorder")
+    recording = config.getoption("--retries") > 0 or config.getoption("--test-history")
+    if recording and not hasattr(config, "workerinput") and not config.getoption("collectonly"):
+        config.pluginmanager.register(OutcomeRecorder(_history_path(config)), "outcome_recorder")
+    if config.getoption("--retries") > 0:
+        config.pluginmanager.register(RetryPlugin(config.getoption("--retries")), "retries")
+
+# Tag every test with the expensive fixtures it needs (browser and logged-in role),
+# so the duration scheduler can keep tests sharing them on the same worker.
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--changed-since"):
+        _select_changed_tests(config, items)
+    if config.getoption("--quarantine") != "off":
+        _apply_quarantine(config, items)
+    if not config.getoption("--duration-schedule"):
+        return
+    for item in items:
+        browser = item.callspec.params.get("browser_name", "") if hasattr(item, "callspec") else ""
+        marker = item.get_closest_marker("user")
+        if "logged_in_context" in item.fixturenames:
+            role = marker.args[0] if marker else "standard_user"
+        else:
+            role = "anonymous"
+        item.user_properties.append(("schedule_group", f"{browser}/{role}"))
+
+def _select_changed_tests(config, items):
+    """Deselect the tests that do not depend on anything changed since --changed-since."""
+    changed = changed_symbols(config.getoption("--changed-since"), str(config.rootpath))
+    if changed is None:
+        # A global file (pytest.ini, requirements, hooks, ...) changed: run everything.
+        return
+    index = DependencyIndex(str(config.rootpath))
+    selected, deselected = select(items, changed, index, load_runtime_coverage(index))
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+def _history_path(config):
+    """The --test-history file, or the default one."""
+    return config.getoption("--test-history") or HISTORY_PATH
+
+def _quarantined(config):
+    """Node ids of the tests quarantined for flakiness."""
+    if config.getoption("--quarantine") == "off":
+        return set()
+    return quarantined(load_history(_history_path(config)), config.getoption("--flaky-threshold"))
+
+def _apply_quarantine(config, items):
+    """Mark quarantined tests, then move them last or (de)select them per --quarantine."""
+    flaky = _quarantined(config)
+    if not flaky:
+        return
+    for item in items:
+        if item.nodeid in flaky:
+            item.add_marker(pytest.mark.quarantine)
+    mode = config.getoption("--quarantine")
+    if mode == "last":
+        items.sort(key=lambda item: item.nodeid in flaky)
+        return
+    keep = [item for item in items if (item.nodeid in flaky) == (mode == "only")]
+    deselected = [item for item in items if (item.nodeid in flaky) != (mode == "only")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = keep
+
+# pytest-xdist asks this hook for its scheduler; only called when xdist is installed and -n is used.
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("--duration-schedule"):
+        return make_scheduler(config, log, deferred=_quarantined(config))
+    return None
+
+# Keep each phase's report on the test item, so fixtures can check in their teardown
+# whether the test passed (item.rep_setup, item.rep_call, item.rep_teardown).
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+def _test_failed(item):
+    """True if the setup or call phase of the test failed."""
+    return any(getattr(item, f"rep_{when}", None) is not None and getattr(item, f"rep_{when}").failed
+               for when in ("setup", "call"))
+
+# This fixture decides which application the tests talk to and points every page object at it.
+# Priority: --app=local, then --base-url, then the live site.
+@pytest.fixture(scope="session", autouse=True)
+def app_base_url(pytestconfig, base_url):
+    if pytestconfig.getoption("--app") == "local":
+        with LocalSauceDemo() as url:
+            BasePage.base_url = url
+            yield url
+        return
+    if base_url:
+        BasePage.base_url = base_url
+    yield BasePage.base_url
+
+# This fixture switches instrumentation on for the session when --instrument or --record-impact is given.
+# It returns the Allure sink (or None), so the per-test fixture below can attach its spans.
+@pytest.fixture(scope="session", autouse=True)
+def instrumentation_sinks(pytestconfig):
+    targets = pytestconfig.getoption("--instrument")
+    record_impact = pytestconfig.getoption("--record-impact")
+    if not targets and not record_impact:
+        yield None
+        return
+    sinks = [instrumentation.AllureSink() if t == "allure" else instrumentation.JsonlSink(t) for t in targets]
+    if record_impact:
+        # One coverage file per xdist worker, so workers never write the same file.
+        worker = getattr(pytestconfig, "workerinput", {}).get("workerid", "main")
+        sinks.append(ImpactSink(os.path.join(IMPACT_DIR, f"{worker}.json")))
+    instrumentation.enable(*sinks)
+    instrumentation.instrument_subclasses(BasePage)
+    yield next((s for s in sinks if isinstance(s, instrumentation.AllureSink)), None)
+    instrumentation.disable()
+    for sink in sinks:
+        if isinstance(sink, instrumentation.JsonlSink):
+            sink.close()
+        elif isinstance(sink, ImpactSink):
+            sink.save()
+
+# This fixture tags every span with the running test and attaches the test's spans to Allure.
+@pytest.fixture(autouse=True)
+def instrumented_test(request, instrumentation_sinks):
+    if not instrumentation.enabled:
+        yield
+        return
+    token = instrumentation.current_test.set(request.node.nodeid)
+    yield
+    instrumentation.current_test.reset(token)
+    if instrumentation_sinks:
+        instrumentation_sinks.flush()
+
+# This fixture gives every test its own web vitals collector when --web-vitals is given.
+# The user starts as the @pytest.mark.user role (if any) and follows LoginPage.login.
+@pytest.fixture(autouse=True)
+def web_vitals(request):
+    if not request.config.getoption("--web-vitals"):
+        yield None
+        return
+    marker = request.node.get_closest_marker("user")
+    collector = WebVitalsCollector(load_budgets(request.config.getoption("--perf-budgets")),
+                                   user=marker.args[0] if marker else None)
+    BasePage.web_vitals = collector
+    yield collector
+    BasePage.web_vitals = None
+
+# This fixture collects recorded traffic in --network=record mode and writes the HAR files at the end.
+@pytest.fixture(scope="session")
+def har_recorder(pytestconfig):
+    if pytestconfig.getoption("--network") != "record":
+        yield None
+        return
+    if hasattr(pytestconfig, "workerinput"):
+        # Workers would overwrite each other's module files.
+        raise pytest.UsageError("--network=record cannot be combined with pytest-xdist (-n).")
+    recorder = HarRecorder()
+    yield recorder
+    recorder.save()
+
+# This fixture returns the resource policy for the current test, or None to load everything.
+@pytest.fixture
+def resource_policy(request):
+    if request.config.getoption("--resources") == "full" or request.node.get_closest_marker("needs_assets"):
+        return None
+    return ResourcePolicy()
+
+# This fixture returns the failure tracer of the current test with --trace-failures, else None.
+# pytest-playwright's own --tracing takes precedence (a context can only be traced once).
+# Traces of failed tests go to test-results/<test>/ (pytest-playwright's --output) and to Allure.
+@pytest.fixture
+def failure_tracer(request):
+    if not request.config.getoption("--trace-failures") or request.config.getoption("--tracing") != "off":
+        yield None
+        return
+    tracer = FailureTracer(title=request.node.nodeid)
+    yield tracer
+    _finish_trace(request, tracer)
+
+def _finish_trace(request, tracer):
+    """Save (failed test) or drop (passed test) the trace chunks of the current test."""
+    directory = trace_dir(request.config.getoption("--output"), request.node.nodeid)
+    attempt = getattr(request.node, "attempt", 1)
+    tracer.finish(_test_failed(request.node), directory if attempt == 1 else f"{directory}-attempt{attempt}")
+
+def _replay_har(request):
+    """The HAR file the current test's contexts are served from, or None."""
+    path = har_path(request.node.path.stem)
+    return path if request.config.getoption("--network") == "replay" and os.path.exists(path) else None
+
+# This fixture wraps pytest-playwright's context factory, so every context a test
+# creates (including the one behind the 'page' fixture) goes through the network cache,
+# the resource policy and the failure tracer.
+@pytest.fixture
+def new_context(new_context, request, har_recorder, resource_policy, app_base_url, tmp_path, failure_tracer):
+    mode = request.config.getoption("--network")
+    module_name = request.node.path.stem
+    har = _replay_har(request)
+    recordings = []
+
+    def _new_context(**kwargs):
+        context = new_context(**kwargs)
+        if failure_tracer:
+            failure_tracer.watch(context)
+        if har:
+            # Serve recorded responses; anything not in the HAR goes to the network.
+            context.route_from_har(har, not_found="fallback")
+        elif mode == "record":
+            recording = str(tmp_path / f"context-{len(recordings)}.har")
+            context.route_from_har(recording, update=True, update_content="embed")
+            recordings.append((context, recording))
+            context.on("close", lambda ctx: closed.append(ctx))
+        if resource_policy:
+            # Installed last so its routes run before the HAR routes.
+            resource_policy.apply(context, app_base_url)
+        return context
+
+    closed = []
+    yield _new_context
+
+    if failure_tracer and recordings:
+        # Recording contexts are closed below, so their traces are saved first.
+        _finish_trace(request, failure_tracer)
+    # Playwright writes a recorded HAR when its context closes.
+    passed = getattr(request.node, "rep_call", None) is not None and request.node.rep_call.passed
+    for context, recording in recordings:
+        if context not in closed:
+            context.close()
+        if passed:
+            har_recorder.add(module_name, recording)
+
+# This fixture returns the execution profile selected with --profile.
+@pytest.fixture(scope="session")
+def execution_profile(pytestconfig):
+    return PROFILES[pytestconfig.getoption("--profile")]
+
 # This fixture configures the browser context arguments.
 # scope="session" means this fixture is created once per test session.
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
-    return {
+def browser_context_args(browser_context_args, app_base_url, execution_profile):
+    args = {
         # Inherit existing arguments.
         **browser_context_args,
+        # Lets page.goto() take paths relative to the application under test.
+        "base_url": app_base_url,
+    }
+    if execution_profile.viewport:
+        # A fixed viewport makes layouts (and screenshots) identical on every machine.
+        args["viewport"] = execution_profile.viewport
+    else:
         # Set no_viewport to True to disable the default viewport size.
         # This is necessary to allow the browser to be maximized fully.
-        "no_viewport": True,
-    }
+        args["no_viewport"] = True
+    if execution_profile.reduced_motion:
+        # Skip CSS animations and transitions instead of waiting for them.
+        args["reduced_motion"] = execution_profile.reduced_motion
+    return args
 
 # This fixture configures the browser launch arguments.
 @pytest.fixture(scope="session")
-def browser_type_launch_args(browser_type_launch_args):
-    return {
+def browser_type_launch_args(browser_type_launch_args, execution_profile, browser_name, pytestconfig):
+    args = {
         # Inherit existing arguments.
         **browser_type_launch_args,
-        # Add the '--start-maximized' argument to the browser launch command.
-        # This tells the browser to start in maximized mode.
-        "args": ["--start-maximized", *browser_type_launch_args.get("args", [])],
+        # --headed on the command line still wins over a headless profile.
+        "headless": execution_profile.headless and not pytestconfig.getoption("--headed"),
     }
+    if execution_profile.slow_mo and not pytestconfig.getoption("--slowmo"):
+        args["slow_mo"] = execution_profile.slow_mo
+    if browser_name == "chromium":
+        # Chromium-only switches, e.g. '--start-maximized' or '--disable-gpu'.
+        args["args"] = [*execution_profile.chromium_args, *browser_type_launch_args.get("args", [])]
+    return args
+
+# This fixture logs in once per user role and saves the session to disk.
+# It returns a function: auth_state("problem_user") -> path of the saved storage state.
+# With pytest-xdist every worker has its own session, so each worker logs in once per role.
+@pytest.fixture(scope="session")
+def auth_state(browser, browser_context_args, tmp_path_factory):
+    auth_dir = tmp_path_factory.mktemp("auth")
+    states = {}
+
+    def _auth_state(username):
+        if username not in states:
+            context = browser.new_context(**browser_context_args)
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.load()
+            login_page.login(username, PASSWORD)
+            # Only save the state once the login has really gone through.
+            page.wait_for_url(InventoryPage.url())
+            states[username] = str(auth_dir / f"{username}.json")
+            context.storage_state(path=states[username])
+            context.close()
+        return states[username]
+
+    return _auth_state
+
+# This fixture keeps a pool of warm browser contexts for the whole session (one per xdist worker).
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args):
+    pool = ContextPool(browser, browser_context_args)
+    yield pool
+    pool.close()
+
+def _poolable(config):
+    """
+    Whether pooled contexts behave like the ones of new_context. HAR recording and
+    pytest-playwright's --tracing/--video/--screenshot need a context of their own per test.
+    """
+    return config.getoption("--network") != "record" and all(
+        config.getoption(option) == "off" for option in ("--tracing", "--video", "--screenshot"))
+
+# This fixture lends a pooled context to one test and hands it back (reset) afterwards.
+# It returns a function so the caller can choose the storage state.
+# Pooled contexts get the same HAR replay and resource policy as the ones from new_context;
+# when the run needs per-test contexts (see _poolable) it falls back to new_context.
+@pytest.fixture
+def pooled_context_factory(context_pool, resource_policy, app_base_url, request, failure_tracer):
+    borrowed = []
+    har = _replay_har(request)
+
+    def prepare(context):
+        if har:
+            context.route_from_har(har, not_found="fallback")
+        if resource_policy:
+            # Installed last so its routes run before the HAR routes.
+            resource_policy.apply(context, app_base_url)
+
+    def _pooled_context(storage_state=None):
+        if not _poolable(request.config):
+            return request.getfixturevalue("new_context")(storage_state=storage_state)
+        pooled = context_pool.acquire(
+            storage_state=storage_state,
+            prepare=prepare,
+            # Contexts with and without resource blocking or a HAR are kept apart.
+            key=(resource_policy is not None, har),
+        )
+        borrowed.append(pooled)
+        if failure_tracer:
+            failure_tracer.watch(pooled.context)
+        return pooled.context
+
+    yield _pooled_context
+    if failure_tracer:
+        # Failed contexts are closed on release, so their traces are saved first.
+        _finish_trace(request, failure_tracer)
+    for pooled in borrowed:
+        context_pool.release(pooled, failed=_test_failed(request.node))
+
+# This fixture provides a clean, anonymous page from the context pool.
+@pytest.fixture
+def pooled_page(pooled_context_factory):
+    context = pooled_context_factory()
+    return context.pages[0] if context.pages else context.new_page()
+
+# This fixture provides a browser context that is already logged in.
+# The role defaults to standard_user; pick another with @pytest.mark.user("problem_user").
+# With --reuse-contexts the context comes from the pool instead of being created for this test.
+@pytest.fixture
+def logged_in_context(request, auth_state, web_vitals):
+    marker = request.node.get_closest_marker("user")
+    username = marker.args[0] if marker else "standard_user"
+    if web_vitals:
+        web_vitals.user = username
+    if request.config.getoption("--reuse-contexts"):
+        return request.getfixturevalue("pooled_context_factory")(storage_state=auth_state(username))
+    return request.getfixturevalue("new_context")(storage_state=auth_state(username))
+
+# This fixture provides a logged-in page that is already open on inventory.html,
+# so tests can skip the login form entirely.
+@pytest.fixture
+def logged_in_page(logged_in_context):
+    # Pooled contexts come with a fresh blank page; new ones have none yet.
+    page = logged_in_context.pages[0] if logged_in_context.pages else logged_in_context.new_page()
+    InventoryPage(page).load()
+    return page
+
+# This fixture opens a logged-in page straight on the cart with the given items (kebab-case
+# names), or with checkout=True on the checkout form: seeded_page(["sauce-labs-backpack"]) -> page.
+# Unlike logged_in_page it does not load the inventory first: the cart is written before the
+# first navigation, so the page is loaded exactly once.
+@pytest.fixture
+def seeded_page(logged_in_context):
+    def _seeded_page(cart, checkout=False):
+        page = logged_in_context.pages[0] if logged_in_context.pages else logged_in_context.new_page()
+        CartPage(page).seed_cart(cart, checkout=checkout)
+        return page
+
+    return _seeded_page
+
+# This fixture remembers the end state of every journey prefix for the whole session (per xdist worker).
+# It depends on browser_name only to get one set of snapshots per browser.
+@pytest.fixture(scope="session")
+def journey_snapshots(browser_name):
+    return JourneySnapshots()
+
+# This fixture starts a test from the end of a shared journey prefix instead of replaying it.
+# It returns a function: journey_page(prefix) -> page where 'prefix' left off.
+# The prefix runs once per session and user (standard_user, or the @pytest.mark.user role);
+# every test gets its own context restored from the snapshot. Both the prefix's and the restored
+# contexts come from new_context, so they get the HAR replay, resource policy and failure tracer.
+@pytest.fixture
+def journey_page(request, journey_snapshots, auth_state, new_context, web_vitals):
+    marker = request.node.get_closest_marker("user")
+    username = marker.args[0] if marker else "standard_user"
+    if web_vitals:
+        web_vitals.user = username
+
+    def _journey_page(prefix):
+        snapshot = journey_snapshots.get(prefix, auth_state(username), new_context)
+        return restore_snapshot(new_context(storage_state=snapshot.storage_state), snapshot)
+
+    return _journey_page
+
+# This fixture compares screenshots with the baselines in tests/snapshots/<browser>/, see utils/visual.py.
+# It returns a function: assert_snapshot(page_or_locator, "cart_page.png", mask=[locator], regions=[(x, y, w, h)]).
+# Dynamic parts can be masked in the screenshot (mask) or ignored in the comparison (regions);
+# threshold, max_diff_pixels, max_diff_ratio and anti_aliasing are passed on to visual.assert_matches.
+# A missing baseline is saved from the current screenshot and the test is skipped, so the first
+# run on a new browser records instead of failing; with --missing-snapshots=fail the test fails
+# instead. Tests using it should be marked needs_assets.
+@pytest.fixture
+def assert_snapshot(pytestconfig, browser_name):
+    if not visual.available():
+        pytest.skip("Visual checks need numpy and Pillow (pip install -r requirements.txt)")
+    update = pytestconfig.getoption("--update-snapshots")
+    fail_missing = pytestconfig.getoption("--missing-snapshots") == "fail"
+
+    def _assert_snapshot(target, name, mask=(), full_page=False, **options):
+        screenshot_args = {"animations": "disabled", "caret": "hide", "mask": list(mask)}
+        if full_page:
+            screenshot_args["full_page"] = True
+        png = target.screenshot(**screenshot_args)
+        path = os.path.join(visual.SNAPSHOT_DIR, browser_name, name)
+        if not update and not os.path.exists(path) and fail_missing:
+            visual.fail_missing(png, path)
+        if update or not os.path.exists(path):
+            visual.save_baseline(path, png)
+            if not update:
+                pytest.skip(f"No baseline yet; saved the current screenshot to {path}")
+            return
+        visual.assert_matches(png, path, **options)
 
-# You can also add other fixtures here, such as for authentication or data setup.
+    return _assert_snapshot
@@ -0,0 +1,92 @@
+import argparse
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# Directory holding the stand-in application (one HTML shell, a script, a stylesheet and images).
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# Every page of the real site is rendered client-side from the same shell.
+PAGES = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+class _Handler(SimpleHTTPRequestHandler):
+    """Serves the app shell for every page path and static files for everything else."""
+
+    def translate_path(self, path):
+        if path.split("?", 1)[0].split("#", 1)[0] in PAGES:
+            path = "/index.html"
+        elif path.startswith("/static/"):
+            # Assets are referenced as /static/... from the shell.
+            path = path[len("/static"):]
+        return super().translate_path(path)
+
+    def end_headers(self):
+        # Static assets never change during a run; let the browser cache them.
+        self.send_header("Cache-Control", "max-age=3600")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        # Keep test output clean.
+        pass
+
+class LocalSauceDemo:
+    """
+    A local stand-in for https://www.saucedemo.com/.
+    It mirrors the pages, selectors, users and error messages the tests rely on,
+    but runs on localhost so test runs need no network access.
+
+    Usage:
+        with LocalSauceDemo() as base_url:
+            ...  # e.g. base_url == "http://127.0.0.1:53817/"
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        handler = partial(_Handler, directory=STATIC_DIR)
+        # port=0 lets the OS pick a free port, so parallel workers never collide.
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL."""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the local SauceDemo stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    app = LocalSauceDemo(args.host, args.port)
+    print(f"Serving SauceDemo stand-in at {app.base_url}")
+    try:
+        app.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
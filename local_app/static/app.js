@@ -0,0 +1,489 @@
+// Local stand-in for https://www.saucedemo.com/.
+// Renders every page client-side, mirroring the real site's markup, ids, classes,
+// data-test attributes, users and error messages closely enough for the test suite.
+// Like the real site, the logged-in user lives in the "session-username" cookie and
+// the cart in localStorage["cart-contents"] as a JSON array of item ids.
+(function () {
+    "use strict";
+
+    var PASSWORD = "secret_sauce";
+    var USERS = [
+        "standard_user",
+        "locked_out_user",
+        "problem_user",
+        "performance_glitch_user",
+        "error_user",
+        "visual_user"
+    ];
+    // Login delay for performance_glitch_user, in ms.
+    var GLITCH_DELAY = 2500;
+
+    var ITEMS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."}
+    ];
+
+    var TAX_RATE = 0.08;
+
+    // ---- state helpers ---------------------------------------------------
+
+    function slug(item) {
+        return item.name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function findItem(id) {
+        for (var i = 0; i < ITEMS.length; i++) {
+            if (ITEMS[i].id === id) return ITEMS[i];
+        }
+        return null;
+    }
+
+    function currentUser() {
+        var match = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUser(name) {
+        if (name) {
+            document.cookie = "session-username=" + encodeURIComponent(name) + "; path=/";
+        } else {
+            document.cookie = "session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+        }
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(localStorage.getItem("cart-contents")) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            localStorage.setItem("cart-contents", JSON.stringify(ids));
+        } else {
+            localStorage.removeItem("cart-contents");
+        }
+    }
+
+    function addToCart(id) {
+        var cart = getCart();
+        if (cart.indexOf(id) === -1) cart.push(id);
+        setCart(cart);
+    }
+
+    function removeFromCart(id) {
+        setCart(getCart().filter(function (x) { return x !== id; }));
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    // ---- markup helpers --------------------------------------------------
+
+    function esc(text) {
+        return String(text).replace(/[&<>"']/g, function (c) {
+            return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+        });
+    }
+
+    function imageFor(item) {
+        // problem_user famously sees the same wrong picture for every product.
+        var name = currentUser() === "problem_user" ? "sl-404" : slug(item).replace(/[().]/g, "");
+        return "/static/img/" + name + ".svg";
+    }
+
+    function cartButton(item, extraClass) {
+        var inCart = getCart().indexOf(item.id) !== -1;
+        var action = inCart ? "remove" : "add-to-cart";
+        var cls = inCart ? "btn btn_secondary btn_small " : "btn btn_primary btn_small ";
+        return '<button class="' + cls + extraClass + '" data-test="' + action + "-" + slug(item) +
+            '" id="' + action + "-" + slug(item) + '" name="' + action + "-" + slug(item) +
+            '" data-item="' + item.id + '">' + (inCart ? "Remove" : "Add to cart") + "</button>";
+    }
+
+    function header(title, secondary) {
+        var count = getCart().length;
+        return (
+            '<div class="bm-menu-wrap" aria-hidden="true">' +
+            '  <div class="bm-menu"><nav class="bm-item-list">' +
+            '    <a id="inventory_sidebar_link" class="bm-item menu-item" data-test="inventory-sidebar-link" href="/inventory.html">All Items</a>' +
+            '    <a id="about_sidebar_link" class="bm-item menu-item" data-test="about-sidebar-link" href="https://saucelabs.com/">About</a>' +
+            '    <a id="logout_sidebar_link" class="bm-item menu-item" data-test="logout-sidebar-link" href="#">Logout</a>' +
+            '    <a id="reset_sidebar_link" class="bm-item menu-item" data-test="reset-sidebar-link" href="#">Reset App State</a>' +
+            "  </nav></div>" +
+            '  <div class="bm-cross-button"><button type="button" id="react-burger-cross-btn">Close Menu</button></div>' +
+            "</div>" +
+            '<div class="primary_header" data-test="primary-header">' +
+            '  <div class="bm-burger-button"><button type="button" id="react-burger-menu-btn">Open Menu</button></div>' +
+            '  <div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+            '  <div id="shopping_cart_container" class="shopping_cart_container">' +
+            '    <a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html">' +
+            (count ? '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + count + "</span>" : "") +
+            "    </a>" +
+            "  </div>" +
+            "</div>" +
+            '<div class="header_secondary_container" data-test="secondary-header">' +
+            '  <span class="title" data-test="title">' + esc(title) + "</span>" +
+            (secondary || "") +
+            "</div>"
+        );
+    }
+
+    function footer() {
+        return '<footer class="footer" data-test="footer"><div class="footer_copy" data-test="footer-copy">' +
+            "© 2024 Sauce Labs. All Rights Reserved. Terms of Service | Privacy Policy</div></footer>";
+    }
+
+    function shell(body) {
+        return '<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">' + body + "</div>" + footer() + "</div>";
+    }
+
+    function bindHeader(rerender) {
+        var menu = document.querySelector(".bm-menu-wrap");
+        document.getElementById("react-burger-menu-btn").onclick = function () {
+            menu.classList.add("open");
+            menu.setAttribute("aria-hidden", "false");
+        };
+        document.getElementById("react-burger-cross-btn").onclick = function () {
+            menu.classList.remove("open");
+            menu.setAttribute("aria-hidden", "true");
+        };
+        document.getElementById("logout_sidebar_link").onclick = function (e) {
+            e.preventDefault();
+            setUser(null);
+            go("/");
+        };
+        document.getElementById("reset_sidebar_link").onclick = function (e) {
+            e.preventDefault();
+            setCart([]);
+            rerender(true);
+        };
+    }
+
+    // Re-render a page in place, keeping the side menu open if it was.
+    function mount(render, bind) {
+        function rerender(keepMenuOpen) {
+            document.getElementById("root").innerHTML = render();
+            bindHeader(rerender);
+            bindCartButtons(rerender);
+            if (keepMenuOpen) document.querySelector(".bm-menu-wrap").classList.add("open");
+            if (bind) bind(rerender);
+        }
+        rerender(false);
+    }
+
+    function bindCartButtons(rerender) {
+        var buttons = document.querySelectorAll("button[data-item]");
+        for (var i = 0; i < buttons.length; i++) {
+            buttons[i].onclick = function () {
+                var id = parseInt(this.getAttribute("data-item"), 10);
+                if (getCart().indexOf(id) === -1) addToCart(id); else removeFromCart(id);
+                rerender(false);
+            };
+        }
+    }
+
+    // ---- pages -----------------------------------------------------------
+
+    function loginPage() {
+        var root = document.getElementById("root");
+        root.innerHTML =
+            '<div class="login_container">' +
+            '  <div class="login_logo">Swag Labs</div>' +
+            '  <div class="login_wrapper"><div class="login_wrapper-inner"><div id="login_button_container" class="form_column">' +
+            '    <div class="login-box"><form>' +
+            '      <div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '      <div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '      <div class="error-message-container"></div>' +
+            '      <input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">' +
+            "    </form></div>" +
+            "  </div></div></div>" +
+            '  <div class="login_credentials_wrap"><div class="login_credentials" data-test="login-credentials">' +
+            "    <h4>Accepted usernames are:</h4>" + USERS.join("<br>") +
+            '  </div><div class="login_password" data-test="login-password"><h4>Password for all users:</h4>' + PASSWORD + "</div></div>" +
+            "</div>";
+
+        function showError(message) {
+            root.querySelector(".error-message-container").className = "error-message-container error";
+            root.querySelector(".error-message-container").innerHTML =
+                '<h3 data-test="error">' + esc(message) +
+                '<button class="error-button" data-test="error-button">✕</button></h3>';
+            root.querySelector(".error-button").onclick = function (e) {
+                e.preventDefault();
+                root.querySelector(".error-message-container").className = "error-message-container";
+                root.querySelector(".error-message-container").innerHTML = "";
+            };
+        }
+
+        var pending = sessionStorage.getItem("login-error");
+        if (pending) {
+            sessionStorage.removeItem("login-error");
+            showError(pending);
+        }
+
+        root.querySelector("form").onsubmit = function (e) {
+            e.preventDefault();
+            var username = document.getElementById("user-name").value;
+            var password = document.getElementById("password").value;
+            if (!username) return showError("Epic sadface: Username is required");
+            if (!password) return showError("Epic sadface: Password is required");
+            if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                return showError("Epic sadface: Username and password do not match any user in this service");
+            }
+            if (username === "locked_out_user") {
+                return showError("Epic sadface: Sorry, this user has been locked out.");
+            }
+            setUser(username);
+            var delay = username === "performance_glitch_user" ? GLITCH_DELAY : 0;
+            setTimeout(function () { go("/inventory.html"); }, delay);
+        };
+    }
+
+    var SORTS = {
+        az: function (a, b) { return a.name < b.name ? -1 : 1; },
+        za: function (a, b) { return a.name < b.name ? 1 : -1; },
+        lohi: function (a, b) { return a.price - b.price || (a.name < b.name ? -1 : 1); },
+        hilo: function (a, b) { return b.price - a.price || (a.name < b.name ? -1 : 1); }
+    };
+
+    function inventoryPage() {
+        var order = "az";
+
+        function render() {
+            var items = ITEMS.slice().sort(SORTS[order]);
+            var select =
+                '<div class="right_component"><span class="select_container">' +
+                '<span class="active_option" data-test="active-option">' + {
+                    az: "Name (A to Z)", za: "Name (Z to A)", lohi: "Price (low to high)", hilo: "Price (high to low)"
+                }[order] + "</span>" +
+                '<select class="product_sort_container" data-test="product-sort-container">' +
+                '<option value="az"' + (order === "az" ? " selected" : "") + ">Name (A to Z)</option>" +
+                '<option value="za"' + (order === "za" ? " selected" : "") + ">Name (Z to A)</option>" +
+                '<option value="lohi"' + (order === "lohi" ? " selected" : "") + ">Price (low to high)</option>" +
+                '<option value="hilo"' + (order === "hilo" ? " selected" : "") + ">Price (high to low)</option>" +
+                "</select></span></div>";
+            var list = items.map(function (item) {
+                return (
+                    '<div class="inventory_item" data-test="inventory-item">' +
+                    '  <div class="inventory_item_img"><a href="/inventory-item.html?id=' + item.id + '" id="item_' + item.id + '_img_link" data-test="item-' + item.id + '-img-link">' +
+                    '    <img alt="' + esc(item.name) + '" class="inventory_item_img" src="' + imageFor(item) + '" data-test="inventory-item-' + slug(item) + '-img"></a></div>' +
+                    '  <div class="inventory_item_description" data-test="inventory-item-description">' +
+                    '    <div class="inventory_item_label"><a href="/inventory-item.html?id=' + item.id + '" id="item_' + item.id + '_title_link" data-test="item-' + item.id + '-title-link">' +
+                    '      <div class="inventory_item_name" data-test="inventory-item-name">' + esc(item.name) + "</div></a>" +
+                    '      <div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(item.desc) + "</div></div>" +
+                    '    <div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' + money(item.price) + "</div>" +
+                    cartButton(item, "btn_inventory") + "</div>" +
+                    "  </div>" +
+                    "</div>"
+                );
+            }).join("");
+            return shell(header("Products", select) +
+                '<div id="inventory_container" class="inventory_container"><div class="inventory_list" data-test="inventory-list">' +
+                list + "</div></div>");
+        }
+
+        var bind = function (rerender) {
+            document.querySelector(".product_sort_container").onchange = function () {
+                order = this.value;
+                rerender(false);
+            };
+        };
+        mount(render, bind);
+    }
+
+    function itemPage() {
+        var id = parseInt(new URLSearchParams(window.location.search).get("id"), 10);
+        var item = findItem(id);
+
+        function render() {
+            if (!item) {
+                return shell(header("") + '<div class="inventory_details"><div class="inventory_details_name large_size">ITEM NOT FOUND</div></div>');
+            }
+            return shell(header("",
+                '<div class="left_component"><button class="btn btn_secondary back btn_large inventory_details_back_button" data-test="back-to-products" id="back-to-products">Back to products</button></div>') +
+                '<div class="inventory_details" data-test="inventory-container"><div class="inventory_details_container">' +
+                '  <div class="inventory_details_img_container"><img alt="' + esc(item.name) + '" class="inventory_details_img" src="' + imageFor(item) + '"></div>' +
+                '  <div class="inventory_details_desc_container">' +
+                '    <div class="inventory_details_name large_size" data-test="inventory-item-name">' + esc(item.name) + "</div>" +
+                '    <div class="inventory_details_desc large_size" data-test="inventory-item-desc">' + esc(item.desc) + "</div>" +
+                '    <div class="inventory_details_price" data-test="inventory-item-price">' + money(item.price) + "</div>" +
+                cartButton(item, "btn_inventory") +
+                "  </div>" +
+                "</div></div>");
+        }
+
+        var bind = function () {
+            document.getElementById("back-to-products").onclick = function () { go("/inventory.html"); };
+        };
+        mount(render, bind);
+    }
+
+    function cartItems(withButtons) {
+        return getCart().map(findItem).filter(Boolean).map(function (item) {
+            return (
+                '<div class="cart_item" data-test="inventory-item">' +
+                '  <div class="cart_quantity" data-test="item-quantity">1</div>' +
+                '  <div class="cart_item_label"><a href="/inventory-item.html?id=' + item.id + '" id="item_' + item.id + '_title_link">' +
+                '    <div class="inventory_item_name" data-test="inventory-item-name">' + esc(item.name) + "</div></a>" +
+                '    <div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(item.desc) + "</div>" +
+                '    <div class="item_pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' + money(item.price) + "</div>" +
+                (withButtons ? cartButton(item, "cart_button") : "") +
+                "  </div></div>" +
+                "</div>"
+            );
+        }).join("");
+    }
+
+    function cartPage() {
+        function render() {
+            return shell(header("Your Cart") +
+                '<div id="cart_contents_container" class="cart_contents_container"><div>' +
+                '  <div class="cart_list" data-test="cart-list">' +
+                '    <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+                '    <div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+                cartItems(true) +
+                "  </div>" +
+                '  <div class="cart_footer">' +
+                '    <button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" name="continue-shopping">Continue Shopping</button>' +
+                '    <button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout" name="checkout">Checkout</button>' +
+                "  </div>" +
+                "</div></div>");
+        }
+
+        var bind = function () {
+            document.getElementById("continue-shopping").onclick = function () { go("/inventory.html"); };
+            document.getElementById("checkout").onclick = function () { go("/checkout-step-one.html"); };
+        };
+        mount(render, bind);
+    }
+
+    function checkoutStepOnePage() {
+        function render() {
+            return shell(header("Checkout: Your Information") +
+                '<div id="checkout_info_container" class="checkout_info_container"><div class="checkout_info_wrapper"><form>' +
+                '  <div class="checkout_info" data-test="checkout-info-container">' +
+                '    <div class="form_group"><input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName" autocorrect="off" autocapitalize="none" value=""></div>' +
+                '    <div class="form_group"><input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName" autocorrect="off" autocapitalize="none" value=""></div>' +
+                '    <div class="form_group"><input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode" autocorrect="off" autocapitalize="none" value=""></div>' +
+                '    <div class="error-message-container"></div>' +
+                "  </div>" +
+                '  <div class="checkout_buttons">' +
+                '    <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel" type="button">Cancel</button>' +
+                '    <input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">' +
+                "  </div>" +
+                "</form></div></div>");
+        }
+
+        var bind = function () {
+            document.getElementById("cancel").onclick = function () { go("/cart.html"); };
+            document.querySelector("form").onsubmit = function (e) {
+                e.preventDefault();
+                var error = null;
+                if (!document.getElementById("first-name").value) error = "Error: First Name is required";
+                else if (!document.getElementById("last-name").value) error = "Error: Last Name is required";
+                else if (!document.getElementById("postal-code").value) error = "Error: Postal Code is required";
+                if (!error) return go("/checkout-step-two.html");
+                var container = document.querySelector(".error-message-container");
+                container.className = "error-message-container error";
+                container.innerHTML = '<h3 data-test="error">' + esc(error) +
+                    '<button class="error-button" data-test="error-button">✕</button></h3>';
+            };
+        };
+        mount(render, bind);
+    }
+
+    function checkoutStepTwoPage() {
+        function render() {
+            var total = getCart().map(findItem).filter(Boolean).reduce(function (sum, item) { return sum + item.price; }, 0);
+            var tax = Math.round(total * TAX_RATE * 100) / 100;
+            return shell(header("Checkout: Overview") +
+                '<div id="checkout_summary_container" class="checkout_summary_container"><div>' +
+                '  <div class="cart_list" data-test="cart-list">' +
+                '    <div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+                '    <div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+                cartItems(false) +
+                "  </div>" +
+                '  <div class="summary_info">' +
+                '    <div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>' +
+                '    <div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>' +
+                '    <div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>' +
+                '    <div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>' +
+                '    <div class="summary_info_label" data-test="total-info-label">Price Total</div>' +
+                '    <div class="summary_subtotal_label" data-test="subtotal-label">Item total: ' + money(total) + "</div>" +
+                '    <div class="summary_tax_label" data-test="tax-label">Tax: ' + money(tax) + "</div>" +
+                '    <div class="summary_total_label" data-test="total-label">Total: ' + money(total + tax) + "</div>" +
+                '    <div class="cart_footer">' +
+                '      <button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel">Cancel</button>' +
+                '      <button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" name="finish">Finish</button>' +
+                "    </div>" +
+                "  </div>" +
+                "</div></div>");
+        }
+
+        var bind = function () {
+            document.getElementById("cancel").onclick = function () { go("/inventory.html"); };
+            document.getElementById("finish").onclick = function () {
+                setCart([]);
+                go("/checkout-complete.html");
+            };
+        };
+        mount(render, bind);
+    }
+
+    function checkoutCompletePage() {
+        function render() {
+            return shell(header("Checkout: Complete!") +
+                '<div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">' +
+                '  <img alt="Pony Express" class="pony_express" data-test="pony-express" src="/static/img/pony-express.svg">' +
+                '  <h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>' +
+                '  <div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>' +
+                '  <button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" name="back-to-products">Back Home</button>' +
+                "</div>");
+        }
+
+        var bind = function () {
+            document.getElementById("back-to-products").onclick = function () { go("/inventory.html"); };
+        };
+        mount(render, bind);
+    }
+
+    // ---- routing ---------------------------------------------------------
+
+    var ROUTES = {
+        "/inventory.html": inventoryPage,
+        "/inventory-item.html": itemPage,
+        "/cart.html": cartPage,
+        "/checkout-step-one.html": checkoutStepOnePage,
+        "/checkout-step-two.html": checkoutStepTwoPage,
+        "/checkout-complete.html": checkoutCompletePage
+    };
+
+    var path = window.location.pathname;
+    var page = ROUTES[path];
+    if (!page) {
+        loginPage();
+    } else if (!currentUser()) {
+        // Same behaviour as the real site: protected pages bounce back to the login form.
+        sessionStorage.setItem("login-error", "Epic sadface: You can only access '" + path + "' when you are logged in.");
+        go("/");
+    } else {
+        page();
+    }
+})();
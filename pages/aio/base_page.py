@@ -0,0 +1,79 @@
+from urllib.parse import urljoin
+
+from playwright.async_api import Page, Locator
+
+from utils.async_smart_locator import AsyncSmartLocator
+from ..app_state import SESSION_COOKIE, seed_script, session_cookie
+from ..base_page import BasePage
+from ..elements import COUNT_SCRIPT, cached_locator, elements
+
+class AsyncBasePage:
+    """
+    AsyncBasePage is the playwright.async_api twin of BasePage.
+    It shares the base URL with BasePage, so both layers always target the same application.
+    """
+    # Path of the page relative to the base URL; provided by the shared locator classes.
+    PATH = ""
+
+    def __init__(self, page: Page):
+        """Initialize the AsyncBasePage with a Playwright async Page instance."""
+        self.page = page
+        self._smart_locator = None
+
+    @classmethod
+    def url(cls) -> str:
+        """Return the absolute URL of this page."""
+        return urljoin(BasePage.base_url, cls.PATH)
+
+    @classmethod
+    def selectors(cls) -> dict[str, str]:
+        """Return the selector of every element declared on this page object, by attribute name."""
+        return {name: element.selector for name, element in elements(cls).items()}
+
+    def locator_for(self, selector: str) -> Locator:
+        """Build (or reuse) the Locator for a selector; see BasePage.locator_for."""
+        return cached_locator(self.page, selector)
+
+    async def count_elements(self) -> dict[str, int]:
+        """Count the matches of every declared (non-template) element in one round trip."""
+        fixed = {name: selector for name, selector in self.selectors().items() if "{" not in selector}
+        return await self.page.evaluate(COUNT_SCRIPT, fixed)
+
+    async def missing_elements(self) -> list[str]:
+        """Return the names of declared elements that are not on the current page."""
+        return [name for name, count in (await self.count_elements()).items() if count == 0]
+
+    async def navigate(self, url: str):
+        """Navigate to the specified URL. Relative URLs are resolved against the base URL."""
+        await self.page.goto(urljoin(BasePage.base_url, url))
+
+    async def seed_state(self, cart=(), username: str = None, path: str = None):
+        """Set up the application state directly and open this page (or 'path'); see BasePage.seed_state."""
+        await self.page.add_init_script(seed_script(BasePage.base_url, cart))
+        if username:
+            await self.page.context.add_cookies([session_cookie(BasePage.base_url, username)])
+        await self.navigate(self.PATH if path is None else path)
+        return self
+
+    async def clear_state(self, logout: bool = False, path: str = None):
+        """Empty the cart (and with 'logout', drop the session); see BasePage.clear_state."""
+        if logout:
+            await self.page.context.clear_cookies(name=SESSION_COOKIE)
+        return await self.seed_state(path=path)
+
+    async def get_title(self) -> str:
+        """Return the current page title."""
+        return await self.page.title()
+
+    def get_url(self) -> str:
+        """Return the current page URL."""
+        return self.page.url
+
+    async def smart_find(self, selector: str, fallbacks: list[str] = None) -> Locator:
+        """
+        Find an element using AsyncSmartLocator with self-healing capabilities.
+        The AsyncSmartLocator (and its healing cache) is reused for the lifetime of this page object.
+        """
+        if self._smart_locator is None:
+            self._smart_locator = AsyncSmartLocator(self.page)
+        return await self._smart_locator.get_locator(selector, fallbacks)
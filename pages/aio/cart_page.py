@@ -0,0 +1,53 @@
+from .base_page import AsyncBasePage
+from ..locators import CartLocators
+
+class AsyncCartPage(CartLocators, AsyncBasePage):
+    """
+    The playwright.async_api twin of CartPage.
+    Selectors come from CartLocators, shared with the sync page object.
+    """
+
+    async def seed_cart(self, items, checkout: bool = False):
+        """Put 'items' in the cart and open the cart or the checkout form; see CartPage.seed_cart."""
+        return await self.seed_state(cart=items, path=self.CHECKOUT_PATH if checkout else self.PATH)
+
+    async def get_item_name(self):
+        """Return the name of the first item in the cart."""
+        return await self.page.locator(self.ITEM_NAME).first.inner_text()
+
+    async def get_item_price(self):
+        """Return the price of the first item in the cart."""
+        return await self.page.locator(self.ITEM_PRICE).first.inner_text()
+
+    async def checkout(self, first_name, last_name, zip_code):
+        """
+        Perform the checkout flow:
+        1. Click Checkout
+        2. Fill user details
+        3. Click Continue
+        """
+        await self.checkout_button.click()
+        await self.first_name_input.fill(first_name)
+        await self.last_name_input.fill(last_name)
+        await self.postal_code_input.fill(zip_code)
+        await self.continue_button.click()
+
+    async def finish_checkout(self):
+        """Complete the order by clicking the Finish button."""
+        await self.finish_button.click()
+
+    async def get_complete_header(self):
+        """Return the success message header after checkout."""
+        return await self.complete_header.inner_text()
+
+    async def remove_item(self, item_name_kebab_case):
+        """Remove a specific item from the cart."""
+        await self.remove_button(item=item_name_kebab_case).click()
+
+    async def continue_shopping(self):
+        """Navigate back to the inventory to continue shopping."""
+        await self.continue_shopping_button.click()
+
+    async def get_checkout_error(self):
+        """Return the error message displayed on the checkout page."""
+        return await self.error_message.inner_text()
@@ -0,0 +1,49 @@
+from .base_page import AsyncBasePage
+from ..locators import InventoryLocators
+
+class AsyncInventoryPage(InventoryLocators, AsyncBasePage):
+    """
+    The playwright.async_api twin of InventoryPage.
+    Selectors come from InventoryLocators, shared with the sync page object.
+    """
+
+    async def load(self):
+        """Navigate straight to the Inventory Page (requires a logged-in session)."""
+        await self.navigate(self.url())
+
+    async def add_item_to_cart(self, item_name_kebab_case):
+        """
+        Add a specific item to the cart using its kebab-case name.
+        Example: 'sauce-labs-backpack'
+        """
+        await self.add_to_cart_button(item=item_name_kebab_case).click()
+
+    async def get_cart_count(self):
+        """Return the number of items currently in the cart."""
+        return int(await self.cart_badge.inner_text())
+
+    async def go_to_cart(self):
+        """Navigate to the Cart page."""
+        await self.cart_link.click()
+
+    async def sort_by(self, option_value):
+        """
+        Sort the inventory items by the given option value.
+        Options: 'az', 'za', 'lohi', 'hilo'
+        """
+        await self.sort_container.select_option(option_value)
+
+    async def open_menu(self):
+        """Open the side menu."""
+        await self.menu_button.click()
+
+    async def logout(self):
+        """Perform the logout action via the side menu."""
+        await self.open_menu()
+        await self.logout_link.click()
+
+    async def reset_app_state(self):
+        """Reset the application state (e.g., clear cart) via the side menu."""
+        await self.open_menu()
+        await self.reset_link.click()
+        await self.close_menu_button.click()
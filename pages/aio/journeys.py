@@ -0,0 +1,42 @@
+from contextlib import asynccontextmanager
+
+from playwright.async_api import Page
+
+from .login_page import AsyncLoginPage
+from .inventory_page import AsyncInventoryPage
+from .cart_page import AsyncCartPage
+
+class NoSteps:
+    """A StepRecorder stand-in for running a journey without timing it."""
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        yield
+
+async def purchase_flow(page: Page, steps=NoSteps(), username: str = "standard_user"):
+    """
+    The TestE2E.test_purchase_flow journey on the async page objects:
+    Login -> Add Item -> Cart -> Checkout -> Finish -> Verify
+
+    Every page-object call is wrapped in a named step, so a StepRecorder passed as
+    'steps' can time them; by default nothing is recorded.
+    """
+    login_page = AsyncLoginPage(page)
+    inventory_page = AsyncInventoryPage(page)
+    cart_page = AsyncCartPage(page)
+
+    async with steps.step("LoginPage.load"):
+        await login_page.load()
+    async with steps.step("LoginPage.login"):
+        await login_page.login(username, "secret_sauce")
+        await page.wait_for_url(inventory_page.url())
+    async with steps.step("InventoryPage.add_item_to_cart"):
+        await inventory_page.add_item_to_cart("sauce-labs-backpack")
+    async with steps.step("InventoryPage.go_to_cart"):
+        await inventory_page.go_to_cart()
+    async with steps.step("CartPage.checkout"):
+        await cart_page.checkout("John", "Doe", "12345")
+    async with steps.step("CartPage.finish_checkout"):
+        await cart_page.finish_checkout()
+        header = await cart_page.get_complete_header()
+    assert header == "Thank you for your order!", f"Unexpected completion header: {header}"
@@ -0,0 +1,22 @@
+from .base_page import AsyncBasePage
+from ..locators import LoginLocators
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+    """
+    The playwright.async_api twin of LoginPage.
+    Selectors come from LoginLocators, shared with the sync page object.
+    """
+
+    async def load(self):
+        """Navigate to the Login Page."""
+        await self.navigate(self.url())
+
+    async def login(self, username, password):
+        """Perform the login action with the given credentials."""
+        await self.username_input.fill(username)
+        await self.password_input.fill(password)
+        await self.login_button.click()
+
+    async def get_error_text(self):
+        """Retrieve the text of the error message displayed on failure."""
+        return await self.error_message.inner_text()
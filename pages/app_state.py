@@ -0,0 +1,55 @@
+import itertools
+import json
+from urllib.parse import urlsplit
+
+# SauceDemo keeps its state in the browser: the logged-in user in the "session-username"
+# cookie and the cart in localStorage["cart-contents"] as a JSON array of item ids.
+# Writing both directly lets a test start on any page without clicking its way there.
+SESSION_COOKIE = "session-username"
+CART_KEY = "cart-contents"
+
+# Item id by kebab-case item name, the suffix of the add-to-cart/remove data-test attributes.
+ITEM_IDS = {
+    "sauce-labs-backpack": 4,
+    "sauce-labs-bike-light": 0,
+    "sauce-labs-bolt-t-shirt": 1,
+    "sauce-labs-fleece-jacket": 5,
+    "sauce-labs-onesie": 2,
+    "test.allthethings()-t-shirt-(red)": 3,
+}
+
+# Numbers the seeds, so a page can be seeded again after its first seed has run.
+_seeds = itertools.count(1)
+
+# Writes the cart before the application's own scripts run. Each seed runs once per tab
+# (remembered in sessionStorage): later navigations keep whatever the test did to the cart.
+SEED_SCRIPT = """(([origin, seed, key, value]) => {
+    if (location.origin !== origin) return;
+    const marker = `seeded-state-${seed}`;
+    if (sessionStorage.getItem(marker)) return;
+    sessionStorage.setItem(marker, "1");
+    if (value === null) localStorage.removeItem(key);
+    else localStorage.setItem(key, value);
+})(%s);"""
+
+def origin(base_url: str) -> str:
+    """Return the origin (scheme://host[:port]) of 'base_url'."""
+    url = urlsplit(base_url)
+    return f"{url.scheme}://{url.netloc}"
+
+def item_ids(items) -> list[int]:
+    """Translate kebab-case item names into the ids the cart stores."""
+    unknown = [item for item in items if item not in ITEM_IDS]
+    if unknown:
+        raise ValueError(f"Unknown item(s) {', '.join(unknown)}; known items: {', '.join(ITEM_IDS)}")
+    return [ITEM_IDS[item] for item in dict.fromkeys(items)]
+
+def seed_script(base_url: str, items) -> str:
+    """Init script that fills the cart with 'items' (an empty cart if there are none)."""
+    ids = item_ids(items)
+    value = json.dumps(ids) if ids else None
+    return SEED_SCRIPT % json.dumps([origin(base_url), next(_seeds), CART_KEY, value])
+
+def session_cookie(base_url: str, username: str) -> dict:
+    """The cookie that logs 'username' in, in the format of BrowserContext.add_cookies."""
+    return {"name": SESSION_COOKIE, "value": username, "url": origin(base_url) + "/"}
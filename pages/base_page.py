@@ -1,18 +1,107 @@
+from contextlib import nullcontext
+from urllib.parse import urljoin
+
 from playwright.sync_api import Page, Locator
 
+from utils.smart_locator import SmartLocator
+from .app_state import SESSION_COOKIE, seed_script, session_cookie
+from .elements import COUNT_SCRIPT, cached_locator, elements
+
+# Reads the inner text of several elements in one round trip. With a row selector,
+# the fields are read relative to every matching row. Missing elements read as null.
+READ_FIELDS_SCRIPT = """
+([rowSelector, fields]) => {
+    const read = (root) => Object.fromEntries(Object.entries(fields).map(([name, selector]) => {
+        const element = root.querySelector(selector);
+        return [name, element ? element.innerText.trim() : null];
+    }));
+    return rowSelector === null ? read(document) : Array.from(document.querySelectorAll(rowSelector), read);
+}
+"""
+
 class BasePage:
     """
     BasePage serves as the parent class for all page objects.
     It provides common methods and initializes the Playwright Page object.
     """
+    # Root URL of the application under test. conftest.py points this at the
+    # local stand-in or at --base-url; it is shared by every page object.
+    base_url = "https://www.saucedemo.com/"
+    # Path of the page relative to base_url; overridden by each page object.
+    PATH = ""
+    # WebVitalsCollector of the running test; set by conftest.py when --web-vitals is given.
+    web_vitals = None
 
     def __init__(self, page: Page):
         """Initialize the BasePage with a Playwright Page instance."""
         self.page = page
+        self._smart_locator = None
+
+    @classmethod
+    def url(cls) -> str:
+        """Return the absolute URL of this page."""
+        return urljoin(cls.base_url, cls.PATH)
+
+    @classmethod
+    def selectors(cls) -> dict[str, str]:
+        """Return the selector of every element declared on this page object, by attribute name."""
+        return {name: element.selector for name, element in elements(cls).items()}
+
+    def locator_for(self, selector: str) -> Locator:
+        """
+        Build (or reuse) the Locator for a selector. Every declared element goes through here,
+        so this is the place to hook in tooling such as healing caches.
+        """
+        return cached_locator(self.page, selector)
+
+    def count_elements(self) -> dict[str, int]:
+        """
+        Count the matches of every declared (non-template) element in one round trip.
+        Selectors must be CSS.
+        """
+        fixed = {name: selector for name, selector in self.selectors().items() if "{" not in selector}
+        return self.page.evaluate(COUNT_SCRIPT, fixed)
+
+    def missing_elements(self) -> list[str]:
+        """Return the names of declared elements that are not on the current page."""
+        return [name for name, count in self.count_elements().items() if count == 0]
 
     def navigate(self, url: str):
-        """Navigate to the specified URL."""
-        self.page.goto(url)
+        """Navigate to the specified URL. Relative URLs are resolved against base_url."""
+        self.page.goto(urljoin(self.base_url, url))
+        if self.web_vitals:
+            self.web_vitals.capture(self.page, f"{type(self).__name__}.navigate")
+
+    def seed_state(self, cart=(), username: str = None, path: str = None):
+        """
+        Set up the application state directly and open this page (or 'path') with it.
+        'cart' lists kebab-case item names; 'username' logs that user in through the
+        session cookie instead of the login form. The cart is written by an init script
+        before the application's first script runs, so this costs a single navigation.
+        """
+        self.page.add_init_script(seed_script(self.base_url, cart))
+        if username:
+            self.page.context.add_cookies([session_cookie(self.base_url, username)])
+        self.navigate(self.PATH if path is None else path)
+        return self
+
+    def clear_state(self, logout: bool = False, path: str = None):
+        """
+        Empty the cart (and with 'logout', drop the session) without the side menu,
+        then open this page (or 'path') again.
+        """
+        if logout:
+            self.page.context.clear_cookies(name=SESSION_COOKIE)
+        return self.seed_state(path=path)
+
+    def measure(self, step: str):
+        """
+        Context manager that captures web vitals after the wrapped action.
+        Does nothing unless web vitals collection is enabled.
+        """
+        if self.web_vitals is None:
+            return nullcontext()
+        return self.web_vitals.measure(self.page, step)
 
     def get_title(self) -> str:
         """Return the current page title."""
@@ -22,10 +111,35 @@ class BasePage:
         """Return the current page URL."""
         return self.page.url
 
+    def read_fields(self, fields: dict[str, str]) -> dict[str, str | None]:
+        """
+        Read the text of several elements with a single page.evaluate call.
+        'fields' maps a name to a CSS selector; each value is the inner text of the
+        first match, or None if nothing matches. Unlike locators, this does not wait.
+        """
+        return self.page.evaluate(READ_FIELDS_SCRIPT, [None, fields])
+
+    def read_rows(self, row_selector: str, fields: dict[str, str], required=()) -> list[dict[str, str | None]]:
+        """
+        Like read_fields, once per element matching 'row_selector' (e.g. every product card),
+        with the field selectors relative to the row. Still a single page.evaluate call.
+        A row missing one of the 'required' fields fails with an AssertionError naming it.
+        """
+        rows = self.page.evaluate(READ_FIELDS_SCRIPT, [row_selector, fields])
+        for index, row in enumerate(rows):
+            missing = [field for field in required if row[field] is None]
+            if missing:
+                raise AssertionError(
+                    f"Row {index + 1} of {row_selector} ({row.get('name') or 'unnamed'}) has no "
+                    + ", ".join(f"{field} ({fields[field]})" for field in missing)
+                )
+        return rows
+
     def smart_find(self, selector: str, fallbacks: list[str] = None) -> Locator:
         """
         Find an element using SmartLocator with self-healing capabilities.
+        The SmartLocator (and its healing cache) is reused for the lifetime of this page object.
         """
-        from utils.smart_locator import SmartLocator
-        finder = SmartLocator(self.page)
-        return finder.get_locator(selector, fallbacks)
\ No newline at end of file
+        if self._smart_locator is None:
+            self._smart_locator = SmartLocator(self.page)
+        return self._smart_locator.get_locator(selector, fallbacks)
@@ -1,32 +1,48 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass
+
 from .base_page import BasePage
+from .locators import CartLocators
+
+@dataclass
+class CartItem:
+    """One row of the cart."""
+    name: str
+    price: float
+    quantity: int
 
-class CartPage(BasePage):
+class CartPage(CartLocators, BasePage):
     """
     Represents the Cart and Checkout pages.
     Contains methods for cart management and the checkout process.
     """
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        # Locators
-        self.checkout_button = page.locator("[data-test='checkout']")
-        self.first_name_input = page.locator("[data-test='firstName']")
-        self.last_name_input = page.locator("[data-test='lastName']")
-        self.postal_code_input = page.locator("[data-test='postalCode']")
-        self.continue_button = page.locator("[data-test='continue']")
-        self.finish_button = page.locator("[data-test='finish']")
-        self.continue_shopping_button = page.locator("[data-test='continue-shopping']")
-        self.complete_header = page.locator(".complete-header")
-        self.error_message = page.locator("[data-test='error']")
+    def seed_cart(self, items, checkout: bool = False):
+        """
+        Put 'items' (kebab-case item names) in the cart without the inventory page and open
+        the cart, or with 'checkout' the checkout information form. Needs a logged-in page.
+        """
+        return self.seed_state(cart=items, path=self.CHECKOUT_PATH if checkout else self.PATH)
 
     def get_item_name(self):
         """Return the name of the first item in the cart."""
-        return self.page.locator(".inventory_item_name").first.inner_text()
+        return self.page.locator(self.ITEM_NAME).first.inner_text()
 
     def get_item_price(self):
         """Return the price of the first item in the cart."""
-        return self.page.locator(".inventory_item_price").first.inner_text()
+        return self.page.locator(self.ITEM_PRICE).first.inner_text()
+
+    def get_cart_items(self) -> list[CartItem]:
+        """Return the contents of the cart, read in a single round trip."""
+        self.page.locator(self.CART_LIST).wait_for(state="attached")
+        rows = self.read_rows(self.CART_ITEM, {
+            "name": self.ITEM_NAME,
+            "price": self.ITEM_PRICE,
+            "quantity": self.ITEM_QUANTITY,
+        }, required=("name", "price", "quantity"))
+        return [
+            CartItem(name=row["name"], price=float(row["price"].replace("$", "")), quantity=int(row["quantity"]))
+            for row in rows
+        ]
 
     def checkout(self, first_name, last_name, zip_code):
         """
@@ -51,7 +67,7 @@ class CartPage(BasePage):
 
     def remove_item(self, item_name_kebab_case):
         """Remove a specific item from the cart."""
-        self.page.locator(f"[data-test='remove-{item_name_kebab_case}']").click()
+        self.remove_button(item=item_name_kebab_case).click()
 
     def continue_shopping(self):
         """Navigate back to the inventory to continue shopping."""
@@ -0,0 +1,72 @@
+# Attribute of a Playwright page holding the locators already built for it: {selector: Locator}.
+# Page objects are created over and over for the same page; they all share these. Keeping
+# them on the page itself means they are released together with it.
+LOCATOR_CACHE = "_saucedemo_locators"
+
+# Counts the matches of many selectors in one round trip.
+COUNT_SCRIPT = """
+(selectors) => Object.fromEntries(Object.entries(selectors).map(
+    ([name, selector]) => [name, document.querySelectorAll(selector).length]
+))
+"""
+
+def cached_locator(page, selector: str):
+    """Return the Locator for 'selector' on 'page', building it only once per page."""
+    locators = page.__dict__.setdefault(LOCATOR_CACHE, {})
+    if selector not in locators:
+        locators[selector] = page.locator(selector)
+    return locators[selector]
+
+class Element:
+    """
+    A page element declared once on the class:
+
+        class LoginLocators:
+            USERNAME_INPUT = "[data-test='username']"
+            username_input = Element(USERNAME_INPUT)
+
+    Reading `login_page.username_input` resolves the Locator through the page object's
+    locator_for() (cached per Playwright page) and then keeps it on the instance.
+    Reading it on the class returns the Element itself, e.g. for listing selectors.
+    Works for the sync and the async page objects alike.
+    """
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        locator = instance.locator_for(self.selector)
+        # Later reads find the Locator in the instance dict and skip the descriptor.
+        instance.__dict__[self.name] = locator
+        return locator
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.selector!r})"
+
+class ElementTemplate(Element):
+    """
+    A family of elements that differ by a parameter, e.g. one button per item:
+
+        add_to_cart_button = ElementTemplate("[data-test='add-to-cart-{item}']")
+        inventory_page.add_to_cart_button(item="sauce-labs-backpack").click()
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return lambda **params: instance.locator_for(self.selector.format(**params))
+
+def elements(cls) -> dict[str, Element]:
+    """Every Element and ElementTemplate declared on 'cls' or its bases, by attribute name."""
+    found = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, Element):
+                found[name] = value
+    return found
@@ -1,29 +1,49 @@
-from playwright.sync_api import Page
+from dataclasses import dataclass
+
 from .base_page import BasePage
+from .locators import InventoryLocators
+
+@dataclass
+class InventoryItem:
+    """One product card of the inventory listing."""
+    name: str
+    price: float
+    # True when the card's button offers 'Remove', i.e. the item is in the cart.
+    in_cart: bool
 
-class InventoryPage(BasePage):
+class InventoryPage(InventoryLocators, BasePage):
     """
     Represents the Inventory (Product Listing) Page.
     Contains methods to interact with products, the cart, and the main menu.
     """
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        # Locators
-        self.cart_badge = page.locator(".shopping_cart_badge")
-        self.cart_link = page.locator(".shopping_cart_link")
-        self.sort_container = page.locator(".product_sort_container")
-        self.menu_button = page.locator("#react-burger-menu-btn")
-        self.logout_link = page.locator("#logout_sidebar_link")
-        self.reset_link = page.locator("#reset_sidebar_link")
-        self.close_menu_button = page.locator("#react-burger-cross-btn")
+    def load(self):
+        """Navigate straight to the Inventory Page (requires a logged-in session)."""
+        self.navigate(self.url())
 
     def add_item_to_cart(self, item_name_kebab_case):
         """
         Add a specific item to the cart using its kebab-case name.
         Example: 'sauce-labs-backpack'
         """
-        self.page.locator(f"[data-test='add-to-cart-{item_name_kebab_case}']").click()
+        self.add_to_cart_button(item=item_name_kebab_case).click()
+
+    def get_items(self) -> list[InventoryItem]:
+        """Return every product card, in display order, read in a single round trip."""
+        self.page.locator(self.INVENTORY_LIST).wait_for(state="attached")
+        rows = self.read_rows(self.ITEM_ROW, {
+            "name": self.ITEM_NAME,
+            "price": self.ITEM_PRICE,
+            "button": self.ITEM_BUTTON,
+        }, required=("name", "price"))
+        return [
+            InventoryItem(
+                name=row["name"],
+                price=float(row["price"].replace("$", "")),
+                in_cart=(row["button"] or "").lower() == "remove",
+            )
+            for row in rows
+        ]
 
     def get_cart_count(self):
         """Return the number of items currently in the cart."""
@@ -31,7 +51,8 @@ class InventoryPage(BasePage):
 
     def go_to_cart(self):
         """Navigate to the Cart page."""
-        self.cart_link.click()
+        with self.measure("InventoryPage.go_to_cart"):
+            self.cart_link.click()
 
     def sort_by(self, option_value):
         """
@@ -0,0 +1,76 @@
+from .elements import Element, ElementTemplate
+
+class LoginLocators:
+    """Path, selectors and elements of the Login Page."""
+    PATH = ""
+    USERNAME_INPUT = "[data-test='username']"
+    PASSWORD_INPUT = "[data-test='password']"
+    LOGIN_BUTTON = "[data-test='login-button']"
+    ERROR_MESSAGE = "[data-test='error']"
+
+    username_input = Element(USERNAME_INPUT)
+    password_input = Element(PASSWORD_INPUT)
+    login_button = Element(LOGIN_BUTTON)
+    error_message = Element(ERROR_MESSAGE)
+
+class InventoryLocators:
+    """Path, selectors and elements of the Inventory (Product Listing) Page."""
+    PATH = "inventory.html"
+    CART_BADGE = ".shopping_cart_badge"
+    CART_LINK = ".shopping_cart_link"
+    SORT_CONTAINER = ".product_sort_container"
+    MENU_BUTTON = "#react-burger-menu-btn"
+    LOGOUT_LINK = "#logout_sidebar_link"
+    RESET_LINK = "#reset_sidebar_link"
+    CLOSE_MENU_BUTTON = "#react-burger-cross-btn"
+    # Product cards; the ITEM_* selectors are relative to one card.
+    INVENTORY_LIST = ".inventory_list"
+    ITEM_ROW = ".inventory_item"
+    ITEM_NAME = ".inventory_item_name"
+    ITEM_PRICE = ".inventory_item_price"
+    ITEM_BUTTON = "button"
+    # Item-specific button; format with item=<kebab-case item name>.
+    ADD_TO_CART_BUTTON = "[data-test='add-to-cart-{item}']"
+
+    cart_badge = Element(CART_BADGE)
+    cart_link = Element(CART_LINK)
+    sort_container = Element(SORT_CONTAINER)
+    menu_button = Element(MENU_BUTTON)
+    logout_link = Element(LOGOUT_LINK)
+    reset_link = Element(RESET_LINK)
+    close_menu_button = Element(CLOSE_MENU_BUTTON)
+    add_to_cart_button = ElementTemplate(ADD_TO_CART_BUTTON)
+
+class CartLocators:
+    """Path, selectors and elements of the Cart and Checkout pages."""
+    PATH = "cart.html"
+    # First checkout step, the customer information form.
+    CHECKOUT_PATH = "checkout-step-one.html"
+    CHECKOUT_BUTTON = "[data-test='checkout']"
+    FIRST_NAME_INPUT = "[data-test='firstName']"
+    LAST_NAME_INPUT = "[data-test='lastName']"
+    POSTAL_CODE_INPUT = "[data-test='postalCode']"
+    CONTINUE_BUTTON = "[data-test='continue']"
+    FINISH_BUTTON = "[data-test='finish']"
+    CONTINUE_SHOPPING_BUTTON = "[data-test='continue-shopping']"
+    COMPLETE_HEADER = ".complete-header"
+    ERROR_MESSAGE = "[data-test='error']"
+    # Cart rows; ITEM_NAME, ITEM_PRICE and ITEM_QUANTITY also work relative to one row.
+    CART_LIST = ".cart_list"
+    CART_ITEM = ".cart_item"
+    ITEM_NAME = ".inventory_item_name"
+    ITEM_PRICE = ".inventory_item_price"
+    ITEM_QUANTITY = ".cart_quantity"
+    # Item-specific button; format with item=<kebab-case item name>.
+    REMOVE_BUTTON = "[data-test='remove-{item}']"
+
+    checkout_button = Element(CHECKOUT_BUTTON)
+    first_name_input = Element(FIRST_NAME_INPUT)
+    last_name_input = Element(LAST_NAME_INPUT)
+    postal_code_input = Element(POSTAL_CODE_INPUT)
+    continue_button = Element(CONTINUE_BUTTON)
+    finish_button = Element(FINISH_BUTTON)
+    continue_shopping_button = Element(CONTINUE_SHOPPING_BUTTON)
+    complete_header = Element(COMPLETE_HEADER)
+    error_message = Element(ERROR_MESSAGE)
+    remove_button = ElementTemplate(REMOVE_BUTTON)
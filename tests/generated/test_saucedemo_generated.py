@@ -1,10 +1,11 @@
 import pytest
 from playwright.sync_api import Page, expect
+from pages.base_page import BasePage
 from utils.smart_locator import SmartLocator
 
 def test_generated_page_structure(page: Page):
     # Generated test for https://www.saucedemo.com/
-    page.goto('https://www.saucedemo.com/')
+    BasePage(page).navigate('')
     smart = SmartLocator(page)
 
     # Interaction for input (Type: text)
@@ -0,0 +1,95 @@
+import os
+import sys
+import pytest
+import allure
+from playwright.sync_api import expect
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pages.app_state import item_ids
+from pages.cart_page import CartPage
+
+@allure.feature("Cart")
+class TestAppState:
+    """
+    Test suite for seeding the application state without the UI.
+    """
+
+    @allure.story("State Seeding")
+    def test_unknown_item_is_rejected(self):
+        """Verify that item names are translated to ids and typos fail early."""
+        assert item_ids(["sauce-labs-onesie", "sauce-labs-backpack", "sauce-labs-onesie"]) == [2, 4]
+        with pytest.raises(ValueError, match="sauce-labs-backpak"):
+            item_ids(["sauce-labs-backpak"])
+
+    @allure.story("State Seeding")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_seeded_cart_survives_navigation(self, seeded_page):
+        """Verify that a seeded cart is shown and later changes are not overwritten by the seed."""
+        with allure.step("Open the cart with two items in it"):
+            page = seeded_page(["sauce-labs-backpack", "sauce-labs-onesie"])
+            cart_page = CartPage(page)
+            assert [item.name for item in cart_page.get_cart_items()] == ["Sauce Labs Backpack", "Sauce Labs Onesie"]
+
+        with allure.step("Remove an item and reload"):
+            cart_page.remove_item("sauce-labs-onesie")
+            page.reload()
+            assert [item.name for item in cart_page.get_cart_items()] == ["Sauce Labs Backpack"]
+
+        with allure.step("Clear the state"):
+            cart_page.clear_state()
+            expect(page.locator(cart_page.CART_ITEM)).to_have_count(0)
+
+    @allure.story("State Seeding")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_seeded_cart_does_not_leak_into_next_borrower(self, context_pool, auth_state):
+        """Verify that a pooled context comes back with an empty cart, even if no page of the app is left open."""
+        state = auth_state("standard_user")
+        key = ("test_app_state",)
+
+        with allure.step("Seed the cart and close the page"):
+            pooled = context_pool.acquire(storage_state=state, key=key)
+            CartPage(pooled.page).seed_cart(["sauce-labs-backpack"])
+            pooled.page.close()
+            context_pool.release(pooled)
+
+        with allure.step("Borrow the same context and open the cart"):
+            again = context_pool.acquire(storage_state=state, key=key)
+            assert again is pooled
+            cart_page = CartPage(again.page)
+            cart_page.navigate(cart_page.PATH)
+            expect(again.page.locator(cart_page.CART_ITEM)).to_have_count(0)
+            context_pool.release(again)
+
+    @allure.story("State Seeding")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_pooled_context_drops_routes_and_retires_sticky_changes(self, context_pool, auth_state):
+        """Verify that routes a test added are gone for the next borrower and extra headers retire the context."""
+        state = auth_state("standard_user")
+        key = ("test_app_state_routes",)
+
+        with allure.step("Block the cart page on a pooled context"):
+            pooled = context_pool.acquire(storage_state=state, key=key)
+            pooled.context.route("**/cart.html", lambda route: route.abort())
+            context_pool.release(pooled)
+
+        with allure.step("Borrow it again and open the cart"):
+            again = context_pool.acquire(storage_state=state, key=key)
+            assert again is pooled
+            cart_page = CartPage(again.page)
+            cart_page.navigate(cart_page.PATH)
+            expect(again.page.locator(cart_page.CART_LIST)).to_be_attached()
+
+        with allure.step("Set extra headers and give it back"):
+            again.context.set_extra_http_headers({"X-Test": "1"})
+            context_pool.release(again)
+            assert context_pool.acquire(storage_state=state, key=key) is not again
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
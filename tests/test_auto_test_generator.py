@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tools import auto_test_generator as generator
+from tools.auto_test_generator import (MANIFEST_NAME, CrawledPage, CrawlResult, Module, diff_elements,
+                                      fingerprint, sync_modules, write_modules)
+
+URL = "https://www.saucedemo.com/"
+USERNAME = {"tag": "input", "selectors": ["#user-name", '[name="user-name"]'], "type": "text", "visible": True}
+PASSWORD = {"tag": "input", "selectors": ["#password"], "type": "password", "visible": True}
+LOGIN = {"tag": "button", "selectors": ["#login-button"], "text": "Login", "visible": True}
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+@allure.feature("Test Generation")
+class TestElementDiff:
+    """
+    Test suite for the element-set fingerprints and their change report.
+    """
+
+    @allure.story("Fingerprint")
+    def test_fingerprint_ignores_order(self):
+        """Verify that the same elements in another order give the same fingerprint, a changed one does not."""
+        assert fingerprint([USERNAME, PASSWORD]) == fingerprint([PASSWORD, USERNAME])
+        assert fingerprint([USERNAME, PASSWORD]) != fingerprint([USERNAME, {**PASSWORD, "type": "text"}])
+
+    @allure.story("Diff")
+    def test_added_removed_and_changed_elements(self):
+        """Verify the +/-/~ lines, keyed by tag and primary selector."""
+        old = [USERNAME, PASSWORD]
+        new = [{**USERNAME, "selectors": ["#user-name"]}, LOGIN]
+        assert diff_elements(old, new) == [
+            "+ button #login-button",
+            "- input #password",
+            "~ input #user-name: selectors ['#user-name', '[name=\"user-name\"]'] -> ['#user-name']",
+        ]
+
+    @allure.story("Diff")
+    def test_repeated_selectors_are_numbered(self):
+        """Verify that elements sharing a primary selector are told apart instead of overwriting each other."""
+        assert diff_elements([LOGIN], [LOGIN, LOGIN]) == ["+ button #login-button (2)"]
+
+@allure.feature("Test Generation")
+class TestSyncModules:
+    """
+    Test suite for the incremental writes of generated modules, without a browser.
+    """
+
+    @allure.story("Incremental Writes")
+    def test_unchanged_modules_are_not_rewritten(self, tmp_path):
+        """Verify the first write, the manifest, and that an unchanged module keeps its file."""
+        modules = {"test_gen_index.py": Module(URL, [USERNAME, PASSWORD])}
+        first = sync_modules(modules, str(tmp_path))
+        path = str(tmp_path / "test_gen_index.py")
+        assert first.written == [path]
+        assert first.report == [f"test_gen_index.py ({URL}): new, 2 elements"]
+        manifest = json.loads(read(tmp_path / MANIFEST_NAME))
+        assert manifest["test_gen_index.py"]["fingerprint"] == fingerprint([USERNAME, PASSWORD])
+
+        os.utime(path, (0, 0))
+        again = sync_modules(modules, str(tmp_path))
+        assert again.unchanged == [path] and not again.changed
+        assert os.path.getmtime(path) == 0
+
+    @allure.story("Incremental Writes")
+    def test_changed_page_is_reported_element_by_element(self, tmp_path):
+        """Verify that a changed element set rewrites the module and reports the difference."""
+        sync_modules({"test_gen_index.py": Module(URL, [USERNAME, PASSWORD])}, str(tmp_path))
+        result = sync_modules({"test_gen_index.py": Module(URL, [USERNAME, PASSWORD, LOGIN])}, str(tmp_path))
+
+        assert result.report[1:] == ["  + button #login-button"]
+        assert "#login-button" in read(tmp_path / "test_gen_index.py")
+
+    @allure.story("Incremental Writes")
+    def test_hand_edits_and_template_changes_are_told_apart(self, tmp_path, monkeypatch):
+        """Verify that a hand-edited file is restored and a template change rewrites every module."""
+        modules = {"test_gen_index.py": Module(URL, [USERNAME])}
+        sync_modules(modules, str(tmp_path))
+        path = tmp_path / "test_gen_index.py"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("# edited\n")
+        assert sync_modules(modules, str(tmp_path)).report[1:] == ["  edited by hand"]
+        assert "# edited" not in read(path)
+
+        render = generator.render_test
+        monkeypatch.setattr(generator, "render_test", lambda *args: render(*args) + "\n# new template")
+        assert sync_modules(modules, str(tmp_path)).report[1:] == ["  template changed"]
+
+    @allure.story("Check Mode")
+    def test_check_writes_nothing_and_prune_removes_stale_modules(self, tmp_path):
+        """Verify that check only reports, and prune deletes modules no longer generated."""
+        sync_modules({"test_gen_index.py": Module(URL, [USERNAME]),
+                      "test_gen_cart.py": Module(URL + "cart.html", [LOGIN])}, str(tmp_path))
+        manifest = read(tmp_path / MANIFEST_NAME)
+        modules = {"test_gen_index.py": Module(URL, [USERNAME, PASSWORD])}
+
+        check = sync_modules(modules, str(tmp_path), check=True, prune=True)
+        assert check.changed
+        assert check.removed == [str(tmp_path / "test_gen_cart.py")]
+        assert read(tmp_path / MANIFEST_NAME) == manifest
+        assert (tmp_path / "test_gen_cart.py").exists()
+
+        sync_modules(modules, str(tmp_path), prune=True)
+        assert not (tmp_path / "test_gen_cart.py").exists()
+        assert list(json.loads(read(tmp_path / MANIFEST_NAME))) == ["test_gen_index.py"]
+
+    @allure.story("Module Names")
+    def test_pages_with_the_same_module_name_are_both_written(self, tmp_path):
+        """Verify that URLs mapping to one module name get numbered modules instead of overwriting each other."""
+        pages = [CrawledPage(URL + "cart.html", 1, [LOGIN], fingerprint=fingerprint([LOGIN])),
+                 CrawledPage(URL + "cart", 1, [USERNAME], fingerprint=fingerprint([USERNAME]))]
+        sync = write_modules(CrawlResult(pages), str(tmp_path))
+
+        assert sorted(os.path.basename(path) for path in sync.written) == ["test_gen_cart.py", "test_gen_cart_2.py"]
+        assert "#user-name" in read(tmp_path / "test_gen_cart.py")
+        assert "#login-button" in read(tmp_path / "test_gen_cart_2.py")
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
@@ -7,7 +7,6 @@ from playwright.sync_api import Page, expect
 # Add parent directory to sys.path to allow running this file directly.
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 
@@ -20,21 +19,11 @@ class TestCart:
 
     @allure.story("Cart Management")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_remove_item_from_cart(self, page: Page):
+    def test_remove_item_from_cart(self, seeded_page):
         """Verify that an item can be removed from the cart."""
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
-        
-        with allure.step("Login as standard user"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            
-        with allure.step("Add item to cart"):
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            
-        with allure.step("Navigate to cart"):
-            inventory_page.go_to_cart()
+        with allure.step("Open the cart with an item in it"):
+            page = seeded_page(["sauce-labs-backpack"])
+            cart_page = CartPage(page)
             
         with allure.step("Remove item from cart"):
             cart_page.remove_item("sauce-labs-backpack")
@@ -44,16 +33,12 @@ class TestCart:
 
     @allure.story("Cart Management")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_continue_shopping(self, page: Page):
+    def test_continue_shopping(self, logged_in_page: Page):
         """Verify that 'Continue Shopping' redirects back to inventory."""
-        login_page = LoginPage(page)
+        page = logged_in_page
         inventory_page = InventoryPage(page)
         cart_page = CartPage(page)
         
-        with allure.step("Login as standard user"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            
         with allure.step("Navigate to cart"):
             inventory_page.go_to_cart()
             
@@ -61,24 +46,18 @@ class TestCart:
             cart_page.continue_shopping()
             
         with allure.step("Verify redirection to inventory"):
-            expect(page).to_have_url("https://www.saucedemo.com/inventory.html")
+            expect(page).to_have_url(InventoryPage.url())
 
     @allure.story("Advanced: UI Layout")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_cart_layout(self, page: Page):
+    def test_cart_layout(self, seeded_page):
         """
         Verify the presence and text of key elements on the cart page.
         Ensures UI structure is correct (Title, Headers, Buttons).
         """
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
-        
-        with allure.step("Login and go to cart"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            inventory_page.go_to_cart()
+        with allure.step("Open the cart with an item in it"):
+            page = seeded_page(["sauce-labs-backpack"])
+            cart_page = CartPage(page)
             
         with allure.step("Verify UI Layout"):
             # Verify page title
@@ -94,6 +73,6 @@ if __name__ == "__main__":
     import subprocess
     script_path = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cmd = [sys.executable, "-m", "pytest", "--headed", script_path]
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
     print(f"Running command: {' '.join(cmd)}")
     subprocess.run(cmd, cwd=project_root)
\ No newline at end of file
@@ -9,10 +9,22 @@ from playwright.sync_api import Page, expect
 # Add parent directory to sys.path to allow running this file directly.
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 
+def open_checkout_form(page: Page):
+    """
+    Journey prefix shared by the negative checkout tests, through the UI:
+    inventory -> add the backpack -> cart -> checkout information form.
+    """
+    inventory_page = InventoryPage(page)
+    inventory_page.load()
+    inventory_page.add_item_to_cart("sauce-labs-backpack")
+    inventory_page.go_to_cart()
+    cart_page = CartPage(page)
+    cart_page.checkout_button.click()
+    expect(cart_page.first_name_input).to_be_visible()
+
 @allure.feature("Checkout")
 class TestCheckout:
     """
@@ -22,14 +34,11 @@ class TestCheckout:
 
     @allure.story("Advanced: Dynamic Data")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_checkout_dynamic_data(self, page: Page):
+    def test_checkout_dynamic_data(self, seeded_page):
         """
         Verify checkout with randomly generated user data.
         Ensures application handles variable input correctly.
         """
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
         
         # Helper functions for random data
         def random_string(length=8):
@@ -42,11 +51,8 @@ class TestCheckout:
         last_name = random_string()
         zip_code = random_digits()
         
-        with allure.step("Login and go to checkout"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            inventory_page.go_to_cart()
+        with allure.step("Open the cart with an item in it"):
+            cart_page = CartPage(seeded_page(["sauce-labs-backpack"]))
             
         with allure.step(f"Checkout with dynamic data: {first_name} {last_name}, {zip_code}"):
             cart_page.checkout(first_name, last_name, zip_code)
@@ -56,18 +62,11 @@ class TestCheckout:
 
     @allure.story("Negative Checkout")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_checkout_empty_firstname(self, page: Page):
+    def test_checkout_empty_firstname(self, journey_page):
         """Verify error message when First Name is empty."""
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
-        
-        with allure.step("Login and go to checkout"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            inventory_page.go_to_cart()
-            cart_page.checkout_button.click()
+        with allure.step("Resume from the checkout form snapshot"):
+            page = journey_page(open_checkout_form)
+            cart_page = CartPage(page)
             
         with allure.step("Try to continue with empty first name"):
             cart_page.last_name_input.fill("Doe")
@@ -79,18 +78,11 @@ class TestCheckout:
 
     @allure.story("Negative Checkout")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_checkout_empty_lastname(self, page: Page):
+    def test_checkout_empty_lastname(self, journey_page):
         """Verify error message when Last Name is empty."""
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
-        
-        with allure.step("Login and go to checkout"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            inventory_page.go_to_cart()
-            cart_page.checkout_button.click()
+        with allure.step("Resume from the checkout form snapshot"):
+            page = journey_page(open_checkout_form)
+            cart_page = CartPage(page)
             
         with allure.step("Try to continue with empty last name"):
             cart_page.first_name_input.fill("John")
@@ -102,18 +94,11 @@ class TestCheckout:
 
     @allure.story("Negative Checkout")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_checkout_empty_zip(self, page: Page):
+    def test_checkout_empty_zip(self, journey_page):
         """Verify error message when Postal Code is empty."""
-        login_page = LoginPage(page)
-        inventory_page = InventoryPage(page)
-        cart_page = CartPage(page)
-        
-        with allure.step("Login and go to checkout"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            inventory_page.add_item_to_cart("sauce-labs-backpack")
-            inventory_page.go_to_cart()
-            cart_page.checkout_button.click()
+        with allure.step("Resume from the checkout form snapshot"):
+            page = journey_page(open_checkout_form)
+            cart_page = CartPage(page)
             
         with allure.step("Try to continue with empty zip code"):
             cart_page.first_name_input.fill("John")
@@ -127,6 +112,6 @@ if __name__ == "__main__":
     import subprocess
     script_path = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cmd = [sys.executable, "-m", "pytest", "--headed", script_path]
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
     print(f"Running command: {' '.join(cmd)}")
     subprocess.run(cmd, cwd=project_root)
\ No newline at end of file
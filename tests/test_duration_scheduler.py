@@ -0,0 +1,91 @@
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.duration_scheduler import load_durations, plan, save_durations
+
+def durations(**seconds):
+    """{nodeid: entry} with one group per test, e.g. durations(a=5) -> {"a": {"duration": 5, "group": "a"}}."""
+    return {nodeid: {"duration": value, "group": nodeid} for nodeid, value in seconds.items()}
+
+def loads(assigned, collection, known):
+    return [sum(known[collection[index]]["duration"] for index in indices) for indices in assigned]
+
+@allure.feature("Parallel Runs")
+class TestDurationPlan:
+    """
+    Test suite for the duration-aware xdist schedule.
+    Plans from made-up durations, so no browser (and no xdist) is needed.
+    """
+
+    @allure.story("Packing")
+    def test_longest_tests_are_packed_first(self):
+        """Verify longest-processing-time-first packing onto the least loaded worker."""
+        known = durations(a=5, b=4, c=3, d=3, e=2, f=1)
+        collection = list(known)
+        assigned = plan(collection, known, workers=2)
+
+        assert sorted(index for indices in assigned for index in indices) == list(range(6))
+        assert sorted(loads(assigned, collection, known)) == [9, 9]
+        # Each worker starts with its longest test.
+        assert [collection[indices[0]] for indices in assigned] == ["a", "b"]
+
+    @allure.story("Grouping")
+    def test_groups_stay_on_one_worker_unless_too_long(self):
+        """Verify that tests sharing a browser and role stay together, and an oversized group is split."""
+        known = {
+            "t1[chromium]": {"duration": 1, "group": "chromium/standard_user"},
+            "t2[chromium]": {"duration": 1, "group": "chromium/standard_user"},
+            "t3[firefox]": {"duration": 1, "group": "firefox/standard_user"},
+            "t4[firefox]": {"duration": 1, "group": "firefox/standard_user"},
+        }
+        collection = list(known)
+        assigned = plan(collection, known, workers=2)
+        assert sorted(sorted(indices) for indices in assigned) == [[0, 1], [2, 3]]
+
+        known = {f"t{n}": {"duration": 1, "group": "chromium/standard_user"} for n in range(4)}
+        assigned = plan(list(known), known, workers=2)
+        assert sorted(len(indices) for indices in assigned) == [2, 2]
+
+    @allure.story("Unknown Tests")
+    def test_unknown_tests_get_the_median_and_their_parameter_as_group(self):
+        """Verify that tests without history weigh the median duration and group by their parametrization."""
+        known = durations(a=1, b=2, c=9)
+        collection = ["a", "b", "c", "new_1[webkit]", "new_2[webkit]"]
+        assigned = plan(collection, known, workers=2)
+
+        # The webkit tests (2 x median 2s) form one unit, next to a.
+        worker = next(indices for indices in assigned if 3 in indices)
+        assert 4 in worker
+        assert sorted(map(sorted, assigned)) == [[0, 1, 3, 4], [2]]
+
+    @allure.story("Quarantine")
+    def test_deferred_tests_go_last(self):
+        """Verify that deferred (quarantined) tests are assigned after all others and end their worker's list."""
+        known = durations(a=1, b=1, flaky=10)
+        collection = list(known)
+        assigned = plan(collection, known, workers=2, deferred={"flaky"})
+
+        # Longest, but planned last: it goes behind a test instead of getting a worker to itself.
+        worker = next(indices for indices in assigned if 2 in indices)
+        assert worker[-1] == 2
+        assert len(worker) == 2
+
+    @allure.story("History")
+    def test_saved_durations_are_smoothed(self, tmp_path):
+        """Verify that a new measurement is averaged with the stored one."""
+        path = str(tmp_path / "durations.json")
+        save_durations({"a": (4.0, "chromium/standard_user")}, path)
+        save_durations({"a": (2.0, "chromium/standard_user")}, path)
+        assert load_durations(path) == {"a": {"duration": 3.0, "group": "chromium/standard_user"}}
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
@@ -9,7 +9,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
-from pages.cart_page import CartPage
+from pages.cart_page import CartItem, CartPage
 
 @allure.feature("E2E Checkout")
 class TestE2E:
@@ -36,7 +36,7 @@ class TestE2E:
 
         # 2. Add Item Step
         item_name = "Sauce Labs Backpack"
-        item_price = "$29.99"
+        item_price = 29.99
         
         with allure.step(f"Add {item_name} to cart"):
             inventory_page.add_item_to_cart("sauce-labs-backpack")
@@ -48,8 +48,9 @@ class TestE2E:
 
         # 4. Verify Item in Cart Step
         with allure.step("Verify item name and price in cart"):
-            assert cart_page.get_item_name() == item_name, f"Expected {item_name}, but got {cart_page.get_item_name()}"
-            assert cart_page.get_item_price() == item_price, f"Expected {item_price}, but got {cart_page.get_item_price()}"
+            # Name, price and quantity of every cart row, read in one round trip.
+            items = cart_page.get_cart_items()
+            assert items == [CartItem(item_name, item_price, 1)], f"Expected only {item_name} at ${item_price}, but got {items}"
 
         # 5. Checkout Step
         with allure.step("Proceed to checkout"):
@@ -66,6 +67,6 @@ if __name__ == "__main__":
     import subprocess
     script_path = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cmd = [sys.executable, "-m", "pytest", "--headed", script_path]
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
     print(f"Running command: {' '.join(cmd)}")
     subprocess.run(cmd, cwd=project_root)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pages.elements import LOCATOR_CACHE, Element, ElementTemplate, elements
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+class FakePage:
+    """Stands in for a Playwright page: locator() returns the selector and counts the calls."""
+
+    def __init__(self):
+        self.built = []
+
+    def locator(self, selector):
+        self.built.append(selector)
+        return f"locator({selector})"
+
+@allure.feature("Page Objects")
+class TestElements:
+    """
+    Test suite for the Element and ElementTemplate descriptors of the page objects.
+    Uses a stand-in page, so no browser is needed.
+    """
+
+    @allure.story("Declared Elements")
+    def test_class_access_returns_the_declaration(self):
+        """Verify that reading an element on the class gives the Element, for listing selectors."""
+        assert isinstance(LoginPage.username_input, Element)
+        assert LoginPage.username_input.selector == LoginPage.USERNAME_INPUT
+        assert LoginPage.username_input.name == "username_input"
+        assert repr(LoginPage.login_button) == f"Element({LoginPage.LOGIN_BUTTON!r})"
+
+    @allure.story("Declared Elements")
+    def test_locators_are_built_once_per_page(self):
+        """Verify that page objects over the same page share one Locator per selector."""
+        page = FakePage()
+        first = LoginPage(page)
+        assert first.username_input == f"locator({LoginPage.USERNAME_INPUT})"
+        assert "username_input" in vars(first)
+        assert first.username_input == LoginPage(page).username_input
+        assert page.built == [LoginPage.USERNAME_INPUT]
+        assert set(vars(page)[LOCATOR_CACHE]) == {LoginPage.USERNAME_INPUT}
+
+        other = FakePage()
+        LoginPage(other).username_input
+        assert other.built == [LoginPage.USERNAME_INPUT]
+
+    @allure.story("Element Templates")
+    def test_template_formats_its_selector(self):
+        """Verify that a template returns a factory and caches each formatted selector separately."""
+        page = FakePage()
+        inventory_page = InventoryPage(page)
+        assert isinstance(InventoryPage.add_to_cart_button, ElementTemplate)
+
+        backpack = inventory_page.add_to_cart_button(item="sauce-labs-backpack")
+        assert backpack == "locator([data-test='add-to-cart-sauce-labs-backpack'])"
+        inventory_page.add_to_cart_button(item="sauce-labs-backpack")
+        inventory_page.add_to_cart_button(item="sauce-labs-onesie")
+        assert page.built == ["[data-test='add-to-cart-sauce-labs-backpack']",
+                              "[data-test='add-to-cart-sauce-labs-onesie']"]
+
+    @allure.story("Declared Elements")
+    def test_elements_and_selectors_include_base_classes(self):
+        """Verify that elements() and selectors() list every declaration, overrides included once."""
+        class Base:
+            title = Element(".title")
+            button = Element("#old")
+
+        class Derived(Base):
+            button = Element("#new")
+            row = ElementTemplate(".row-{n}")
+
+        assert {name: element.selector for name, element in elements(Derived).items()} == {
+            "title": ".title", "button": "#new", "row": ".row-{n}",
+        }
+        assert LoginPage.selectors()["login_button"] == LoginPage.LOGIN_BUTTON
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
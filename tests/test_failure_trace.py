@@ -0,0 +1,46 @@
+import os
+import sys
+import allure
+from playwright.sync_api import Browser
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.failure_trace import FailureTracer
+
+@allure.feature("Diagnostics")
+class TestFailureTrace:
+    """
+    Test suite for the failure-only tracing behind --trace-failures.
+    """
+
+    @allure.story("Tracing")
+    def test_passed_chunk_is_discarded(self, browser: Browser, tmp_path):
+        """Verify that a passing test writes nothing and the context can be traced again."""
+        context = browser.new_context()
+        tracer = FailureTracer(title="passing")
+        tracer.watch(context)
+        context.new_page().set_content("<button>Go</button>")
+
+        assert tracer.finish(failed=False, directory=str(tmp_path)) == []
+        assert not os.listdir(tmp_path)
+
+        # The next test on the same (pooled) context records a new chunk.
+        tracer.watch(context)
+        assert tracer.finish(failed=False, directory=str(tmp_path)) == []
+        context.close()
+
+    @allure.story("Tracing")
+    def test_failed_chunk_is_saved(self, browser: Browser, tmp_path):
+        """Verify that a failing test's chunk is written as a trace zip."""
+        context = browser.new_context()
+        tracer = FailureTracer(title="failing")
+        tracer.watch(context)
+        page = context.new_page()
+        page.set_content("<button>Go</button>")
+        page.click("button")
+
+        paths = tracer.finish(failed=True, directory=str(tmp_path))
+        assert paths == [str(tmp_path / "trace.zip")]
+        assert os.path.getsize(paths[0]) > 0
+        context.close()
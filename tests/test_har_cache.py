@@ -0,0 +1,65 @@
+import json
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.har_cache import HarRecorder, har_path
+
+def entry(url, status=200, method="GET", body=None):
+    """A minimal HAR entry."""
+    request = {"method": method, "url": url}
+    if body is not None:
+        request["postData"] = {"text": body}
+    return {"request": request, "response": {"status": status}}
+
+def write_har(path, *entries):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"log": {"version": "1.2", "pages": [{"id": "page@1"}], "entries": list(entries)}}, f)
+    return str(path)
+
+@allure.feature("Network Cache")
+class TestHarRecorder:
+    """
+    Test suite for merging the HARs recorded by passing tests into one file per module.
+    """
+
+    @allure.story("Recording")
+    def test_repeated_requests_keep_the_latest_response(self, tmp_path):
+        """Verify that tests of a module are merged, with one entry per method, URL and body."""
+        recorder = HarRecorder(str(tmp_path / "hars"))
+        recorder.add("test_cart", write_har(tmp_path / "a.har", entry("https://app/inventory.html", 200),
+                                            entry("https://app/api", method="POST", body="a")))
+        recorder.add("test_cart", write_har(tmp_path / "b.har", entry("https://app/inventory.html", 304),
+                                            entry("https://app/api", method="POST", body="b")))
+        recorder.save()
+
+        with open(har_path("test_cart", str(tmp_path / "hars")), encoding="utf-8") as f:
+            log = json.load(f)["log"]
+        assert log["version"] == "1.2"
+        assert log["pages"] == []
+        assert [(e["request"]["url"], e["response"]["status"]) for e in log["entries"]] == [
+            ("https://app/inventory.html", 304), ("https://app/api", 200), ("https://app/api", 200),
+        ]
+        assert [e["request"].get("postData", {}).get("text") for e in log["entries"]] == [None, "a", "b"]
+
+    @allure.story("Recording")
+    def test_modules_are_kept_apart_and_missing_recordings_ignored(self, tmp_path):
+        """Verify one file per module, and that a context that recorded nothing is skipped."""
+        recorder = HarRecorder(str(tmp_path / "hars"))
+        recorder.add("test_cart", write_har(tmp_path / "a.har", entry("https://app/cart.html")))
+        recorder.add("test_login", write_har(tmp_path / "b.har", entry("https://app/")))
+        recorder.add("test_inventory", str(tmp_path / "never_written.har"))
+        recorder.save()
+
+        assert sorted(os.listdir(tmp_path / "hars")) == ["test_cart.har", "test_login.har"]
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
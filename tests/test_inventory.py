@@ -16,58 +16,45 @@ class TestInventory:
     # Test case for successful logout.
     @allure.story("Logout")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_logout(self, page: Page):
+    def test_logout(self, logged_in_page: Page):
+        page = logged_in_page
         login_page = LoginPage(page)
         inventory_page = InventoryPage(page)
         
-        with allure.step("Login as standard user"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            
         with allure.step("Perform logout"):
             # Logout from the application.
             inventory_page.logout()
             
         with allure.step("Verify redirection to login page"):
             # Assert that we are back on the login page.
-            expect(page).to_have_url("https://www.saucedemo.com/")
+            expect(page).to_have_url(LoginPage.url())
             # Verify that the login button is visible.
             expect(login_page.login_button).to_be_visible()
 
     # Test case for sorting products by price (low to high).
     @allure.story("Sorting")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_sort_low_to_high(self, page: Page):
-        login_page = LoginPage(page)
+    def test_sort_low_to_high(self, logged_in_page: Page):
+        page = logged_in_page
         inventory_page = InventoryPage(page)
         
-        with allure.step("Login as standard user"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            
         with allure.step("Sort products by Price (low to high)"):
             # Select the 'lohi' option to sort by price low to high.
             inventory_page.sort_by("lohi")
             
         with allure.step("Verify sorting"):
-            # Get all product prices.
-            prices = page.locator(".inventory_item_price").all_inner_texts()
-            # Convert price strings (e.g., "$29.99") to floats.
-            price_values = [float(price.replace("$", "")) for price in prices]
+            # Read every product card (name, price, button state) in one round trip.
+            price_values = [item.price for item in inventory_page.get_items()]
             # Assert that the list of prices is sorted in ascending order.
             assert price_values == sorted(price_values), "Prices are not sorted low to high"
 
     # Test case for resetting the app state.
     @allure.story("App State")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_reset_app_state(self, page: Page):
-        login_page = LoginPage(page)
+    def test_reset_app_state(self, logged_in_page: Page):
+        page = logged_in_page
         inventory_page = InventoryPage(page)
         
-        with allure.step("Login as standard user"):
-            login_page.load()
-            login_page.login("standard_user", "secret_sauce")
-            
         with allure.step("Add item to cart"):
             # Add an item to the cart.
             inventory_page.add_item_to_cart("sauce-labs-backpack")
@@ -115,6 +102,6 @@ if __name__ == "__main__":
     import subprocess
     script_path = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cmd = [sys.executable, "-m", "pytest", "--headed", script_path]
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
     print(f"Running command: {' '.join(cmd)}")
     subprocess.run(cmd, cwd=project_root)
\ No newline at end of file
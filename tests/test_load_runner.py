@@ -0,0 +1,80 @@
+import asyncio
+import csv
+import json
+import os
+import sys
+import pytest
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.load_runner import StepRecorder, build_report, percentile
+
+@allure.feature("Load Testing")
+class TestLoadReport:
+    """
+    Test suite for the latency statistics of the load runner.
+    Uses recorded samples only, so no browser is needed.
+    """
+
+    @allure.story("Percentiles")
+    def test_percentile_interpolates_between_samples(self):
+        """Verify linear interpolation, the extremes, order independence and empty input."""
+        values = [40.0, 10.0, 30.0, 20.0]
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 100) == 40.0
+        assert percentile(values, 50) == 25.0
+        assert percentile(values, 95) == pytest.approx(38.5)
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 95) == 0.0
+
+    @allure.story("Step Timing")
+    def test_steps_are_timed_and_errors_counted(self):
+        """Verify that a step records its latency, and a failing step its error but no sample."""
+        steps = StepRecorder()
+
+        async def journey():
+            async with steps.step("LoginPage.login"):
+                await asyncio.sleep(0.01)
+            with pytest.raises(RuntimeError):
+                async with steps.step("CartPage.checkout"):
+                    raise RuntimeError("no button")
+
+        asyncio.run(journey())
+        assert len(steps.samples["LoginPage.login"]) == 1
+        assert steps.samples["LoginPage.login"][0] >= 0.01
+        assert "CartPage.checkout" not in steps.samples
+        assert steps.errors == {"CartPage.checkout": 1}
+
+    @allure.story("Report")
+    def test_report_statistics_and_exports(self, tmp_path):
+        """Verify per-step statistics (including steps that only failed), throughput and the exports."""
+        steps = StepRecorder()
+        steps.samples["LoginPage.login"] = [i / 1000 for i in range(1, 101)]
+        steps.errors["CartPage.checkout"] = 2
+        report = build_report(steps, iterations=100, failures=2, elapsed=50.0, errors=["user 0: ..."])
+
+        login, checkout = sorted(report.steps, key=lambda s: s.step != "LoginPage.login")
+        assert (login.count, login.errors, login.max_ms) == (100, 0, pytest.approx(100.0))
+        assert login.mean_ms == pytest.approx(50.5)
+        assert login.p50_ms == pytest.approx(50.5)
+        assert login.p95_ms == pytest.approx(95.05)
+        assert (checkout.count, checkout.errors, checkout.p99_ms) == (0, 2, 0.0)
+        assert report.throughput_per_s == 2.0
+
+        report.to_json(str(tmp_path / "report.json"))
+        report.to_csv(str(tmp_path / "report.csv"))
+        with open(tmp_path / "report.json", encoding="utf-8") as f:
+            assert json.load(f)["failures"] == 2
+        with open(tmp_path / "report.csv", newline="", encoding="utf-8") as f:
+            assert [row["step"] for row in csv.DictReader(f)] == ["CartPage.checkout", "LoginPage.login"]
+        assert "100 iterations, 2 failed" in report.summary()
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
@@ -8,6 +8,7 @@ from playwright.sync_api import Page, expect
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
 
 @allure.feature("Login")
 class TestLogin:
@@ -29,7 +30,7 @@ class TestLogin:
             login_page.login("standard_user", "secret_sauce")
             
         with allure.step("Verify redirection to inventory"):
-            expect(page).to_have_url("https://www.saucedemo.com/inventory.html")
+            expect(page).to_have_url(InventoryPage.url())
 
     @allure.story("Negative Login")
     @allure.severity(allure.severity_level.NORMAL)
@@ -109,12 +110,12 @@ class TestLogin:
             login_page.login(username, password)
             
         with allure.step("Verify login success"):
-            expect(page).to_have_url("https://www.saucedemo.com/inventory.html")
+            expect(page).to_have_url(InventoryPage.url())
 
 if __name__ == "__main__":
     import subprocess
     script_path = os.path.abspath(__file__)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    cmd = [sys.executable, "-m", "pytest", "--headed", script_path]
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
     print(f"Running command: {' '.join(cmd)}")
     subprocess.run(cmd, cwd=project_root)
\ No newline at end of file
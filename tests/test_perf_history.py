@@ -0,0 +1,112 @@
+import itertools
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+import pytest
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tools import perf_history
+
+TEST = "tests.test_cart.TestCart#test_remove_item_from_cart"
+
+def write_result(directory, name, duration_ms, status="passed", parameters=(), steps=()):
+    """One allure-results file: a test of 'duration_ms' with optional (name, duration_ms) steps."""
+    os.makedirs(directory, exist_ok=True)
+    start = 1_700_000_000_000
+    result = {
+        "fullName": name,
+        "status": status,
+        "start": start,
+        "stop": start + duration_ms,
+        "parameters": [{"name": key, "value": repr(value)} for key, value in parameters],
+        "steps": [{"name": step, "start": start, "stop": start + ms, "status": status} for step, ms in steps],
+    }
+    path = os.path.join(directory, f"{len(os.listdir(directory))}-result.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+@allure.feature("Performance History")
+class TestPerfHistory:
+    """
+    Test suite for the duration history and the median/MAD slowdown check.
+    Works on generated allure-results, so no browser is needed.
+    """
+
+    @pytest.fixture
+    def history(self, tmp_path, monkeypatch):
+        """An empty history database; runs are ingested one clock tick apart."""
+        ticks = itertools.count(1)
+        monkeypatch.setattr(perf_history, "time", SimpleNamespace(time=lambda: next(ticks), strftime=time.strftime))
+        conn = perf_history.connect(str(tmp_path / "history.sqlite"))
+        yield conn
+        conn.close()
+
+    def ingest_runs(self, conn, tmp_path, durations):
+        """Ingest one run of TEST per entry of 'durations' (ms)."""
+        for number, duration in enumerate(durations):
+            write_result(str(tmp_path / f"run{number}"), TEST, duration)
+            perf_history.ingest(conn, str(tmp_path / f"run{number}"), f"run{number}")
+
+    @allure.story("Regressions")
+    def test_slowdown_beyond_threshold_is_flagged(self, history, tmp_path):
+        """Verify that a run far above the median (in MADs) and by more than min_delta_ms is reported."""
+        self.ingest_runs(history, tmp_path, [1000, 1010, 990, 1020, 980, 1000, 1600])
+        regressions = perf_history.compare(history)
+
+        assert len(regressions) == 1
+        regression = regressions[0]
+        assert regression["test"] == TEST and regression["step"] is None
+        assert regression["baseline_median_ms"] == 1000
+        assert regression["baseline_mad_ms"] == 10
+        assert regression["z"] == pytest.approx(0.6745 * 600 / 10, abs=0.01)
+
+    @allure.story("Regressions")
+    def test_small_or_unsupported_changes_are_not_flagged(self, history, tmp_path):
+        """Verify the min_delta_ms and min_runs guards."""
+        self.ingest_runs(history, tmp_path, [1000, 1000, 1000, 1000, 1000, 1050])
+        # z is huge (MAD is clamped to 1 ms), but 50 ms is below min_delta_ms.
+        assert perf_history.compare(history) == []
+        assert perf_history.compare(history, min_delta_ms=10)
+        assert perf_history.compare(history, min_delta_ms=10, min_runs=6) == []
+
+    @allure.story("Regressions")
+    def test_outlier_in_baseline_does_not_hide_a_slowdown(self, history, tmp_path):
+        """Verify that one very slow baseline run barely moves median and MAD, unlike mean and deviation."""
+        self.ingest_runs(history, tmp_path, [1000, 1010, 990, 20000, 1000, 1010, 990, 1500])
+        regressions = perf_history.compare(history)
+        assert [r["baseline_median_ms"] for r in regressions] == [1000]
+
+    @allure.story("Ingestion")
+    def test_steps_variants_and_failures(self, history, tmp_path):
+        """Verify that steps get their own history, parametrized variants are kept apart and failed runs ignored."""
+        for username, slow in (("standard_user", 1000), ("problem_user", 3000)):
+            for run in range(5):
+                directory = str(tmp_path / f"run{run}")
+                write_result(directory, TEST, slow, parameters=[("browser_name", "chromium"), ("username", username)],
+                             steps=[("Login", slow // 2)])
+        for run in range(5):
+            perf_history.ingest(history, str(tmp_path / f"run{run}"), f"run{run}")
+        # problem_user's usual 3 s is not a slowdown of standard_user; a failed run is not compared at all.
+        write_result(str(tmp_path / "run5"), TEST, 3000, parameters=[("browser_name", "chromium"),
+                                                                    ("username", "standard_user")])
+        write_result(str(tmp_path / "run5"), TEST, 9000, status="failed",
+                     parameters=[("browser_name", "chromium"), ("username", "problem_user")])
+        perf_history.ingest(history, str(tmp_path / "run5"), "run5")
+
+        regressions = perf_history.compare(history)
+        assert [(r["test"], r["browser"]) for r in regressions] == [(f"{TEST}[username=standard_user]", "chromium")]
+        steps = {row[0] for row in history.execute("SELECT DISTINCT step FROM samples")}
+        assert steps == {perf_history.WHOLE_TEST, "Login"}
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
@@ -0,0 +1,75 @@
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.resource_policy import ResourcePolicy
+
+BASE_URL = "https://www.saucedemo.com/"
+
+class FakeContext:
+    """Stands in for a BrowserContext and keeps the URL patterns routed on it."""
+
+    def __init__(self):
+        self.patterns = []
+
+    def route(self, pattern, handler):
+        self.patterns.append(pattern)
+
+def blocked(policy, url, base_url=BASE_URL):
+    """Whether any route the policy installs matches 'url'."""
+    context = FakeContext()
+    policy.apply(context, base_url)
+    return any(pattern.search(url) for pattern in context.patterns)
+
+@allure.feature("Resource Blocking")
+class TestResourcePolicy:
+    """
+    Test suite for the URL patterns behind --resources=fast.
+    """
+
+    @allure.story("Resource Types")
+    def test_images_fonts_and_media_are_blocked(self):
+        """Verify blocking by extension, with query strings and in any case."""
+        policy = ResourcePolicy()
+        for url in ["https://www.saucedemo.com/static/media/bike.jpg",
+                    "https://www.saucedemo.com/logo.SVG?v=3",
+                    "https://www.saucedemo.com/static/fonts/DMSans.woff2",
+                    "https://www.saucedemo.com/intro.mp4"]:
+            assert blocked(policy, url), url
+        for url in ["https://www.saucedemo.com/inventory.html",
+                    "https://www.saucedemo.com/static/js/main.js",
+                    "https://www.saucedemo.com/static/css/main.css",
+                    "https://www.saucedemo.com/jpg/list.html"]:
+            assert not blocked(policy, url), url
+
+    @allure.story("Third Parties")
+    def test_only_the_application_host_is_allowed(self):
+        """Verify that other hosts are blocked, while the app's host, subdomains and ports are not."""
+        policy = ResourcePolicy(block_types=())
+        assert not blocked(policy, "https://www.saucedemo.com/inventory.html")
+        assert not blocked(policy, "https://cdn.www.saucedemo.com/app.js")
+        assert not blocked(policy, "http://127.0.0.1:8000/cart.html", base_url="http://127.0.0.1:8000/")
+        assert blocked(policy, "https://www.google-analytics.com/collect")
+        # Look-alike hosts and the host name in a path or query are still third parties.
+        assert blocked(policy, "https://www.saucedemo.com.evil.net/x.js")
+        assert blocked(policy, "https://evilwww.saucedemo.com/x.js")
+        assert blocked(policy, "https://tracker.net/www.saucedemo.com/pixel")
+        assert blocked(policy, "https://tracker.net/?ref=www.saucedemo.com")
+
+    @allure.story("Configuration")
+    def test_nothing_blocked_when_disabled(self):
+        """Verify that a policy without types or third-party blocking installs no routes."""
+        context = FakeContext()
+        ResourcePolicy(block_types=(), block_third_party=False).apply(context, BASE_URL)
+        assert context.patterns == []
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
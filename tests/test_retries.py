@@ -0,0 +1,120 @@
+import json
+import os
+import sys
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils.retries import flakiness, load_history, quarantined, save_history
+
+# Runs a throwaway test session in-process for the plugin tests.
+pytest_plugins = ["pytester"]
+
+# conftest.py of the throwaway session: retries and history as --retries/--test-history set them up.
+CONFTEST = """
+from utils.retries import OutcomeRecorder, RetryPlugin
+
+def pytest_configure(config):
+    config.pluginmanager.register(RetryPlugin(retries=1), "retries")
+    config.pluginmanager.register(OutcomeRecorder("history.json"), "outcome_recorder")
+"""
+
+TESTS = """
+import pytest
+
+calls = {"flaky": 0, "setup": 0}
+
+@pytest.fixture
+def breaks_once():
+    calls["setup"] += 1
+    if calls["setup"] == 1:
+        raise RuntimeError("setup failed")
+
+def test_passes():
+    pass
+
+def test_flaky():
+    calls["flaky"] += 1
+    assert calls["flaky"] > 1
+
+def test_fails():
+    assert False
+
+def test_setup_flaky(breaks_once):
+    pass
+
+@pytest.mark.skip(reason="not relevant")
+def test_skipped():
+    pass
+"""
+
+@allure.feature("Retries")
+class TestFlakiness:
+    """
+    Test suite for the flaky-test score and quarantine.
+    """
+
+    @allure.story("Quarantine")
+    def test_only_passes_on_retry_count_as_flaky(self):
+        """Verify that flakiness is the share of flaky runs; new failures and fixes score 0."""
+        assert flakiness([]) == 0.0
+        assert flakiness(["passed", "flaky", "passed", "flaky"]) == 0.5
+        assert flakiness(["passed"] * 5 + ["failed"] * 5) == 0.0
+        assert flakiness(["failed"] * 5 + ["passed"] * 5) == 0.0
+
+    @allure.story("Quarantine")
+    def test_quarantine_needs_threshold_and_enough_runs(self):
+        """Verify that only tests with enough runs at or above the threshold are quarantined."""
+        history = {
+            "flaky": ["passed", "flaky"] * 3,
+            "new_and_flaky": ["flaky"] * 4,
+            "stable": ["passed"] * 10,
+            "broken": ["failed"] * 10,
+            "rarely_flaky": ["passed"] * 9 + ["flaky"],
+        }
+        assert quarantined(history, threshold=0.2) == {"flaky"}
+        assert quarantined(history, threshold=0.2, min_runs=4) == {"flaky", "new_and_flaky"}
+        assert quarantined(history, threshold=0.1) == {"flaky", "rarely_flaky"}
+
+    @allure.story("History")
+    def test_history_keeps_the_last_runs(self, tmp_path):
+        """Verify that each run is appended and only the last 'length' runs are kept."""
+        path = str(tmp_path / "history.json")
+        for outcome in ["failed", "passed", "flaky"]:
+            save_history({"test_a": outcome}, path, length=2)
+        save_history({"test_b": "passed"}, path, length=2)
+        assert load_history(path) == {"test_a": ["passed", "flaky"], "test_b": ["passed"]}
+
+@allure.feature("Retries")
+class TestRetryPlugin:
+    """
+    Test suite for the in-process retries, on a throwaway pytest session (no browser).
+    """
+
+    @allure.story("Retries")
+    def test_failed_tests_are_rerun_and_recorded(self, pytester):
+        """Verify reruns of call and setup failures, the final outcomes and the recorded history."""
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(test_sample=TESTS)
+        # pytest-playwright is left out: its hooks cannot nest inside the outer session.
+        result = pytester.runpytest("-p", "no:cacheprovider", "-p", "no:playwright")
+
+        outcomes = result.parseoutcomes()
+        assert (outcomes["passed"], outcomes["failed"], outcomes["skipped"], outcomes["rerun"]) == (3, 1, 1, 3)
+        with open(pytester.path / "history.json", encoding="utf-8") as f:
+            history = json.load(f)
+        assert history == {
+            "test_sample.py::test_passes": ["passed"],
+            "test_sample.py::test_flaky": ["flaky"],
+            "test_sample.py::test_setup_flaky": ["flaky"],
+            "test_sample.py::test_fails": ["failed"],
+        }
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
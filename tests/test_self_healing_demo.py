@@ -1,14 +1,29 @@
+import time
 import pytest
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.smart_locator import SmartLocator
+from utils.healing_cache import HealingCache
+from utils import instrumentation
 
-def test_self_healing_mechanism(page: Page):
+@pytest.fixture
+def healing_cache(tmp_path, monkeypatch):
+    """
+    A throwaway healing cache, also used as the default one for this test.
+    A heal left in the shared cache by an earlier run would make the tests below pass without healing.
+    """
+    cache = HealingCache(str(tmp_path / "healing_cache.sqlite"))
+    monkeypatch.setattr(HealingCache, "_default", cache)
+    return cache
+
+def test_self_healing_mechanism(page: Page, healing_cache):
     """
     Test to verify that the self-healing mechanism works.
     We will try to find an element with a broken selector, but provide a valid fallback.
     """
     base_page = BasePage(page)
-    base_page.navigate("https://www.saucedemo.com/")
+    base_page.navigate(LoginPage.url())
     
     # 1. Broken primary selector, Valid fallback
     # Primary: #wrong-id
@@ -30,7 +45,7 @@ def test_self_healing_failure(page: Page):
     Test to verify that it fails gracefully if all selectors are wrong.
     """
     base_page = BasePage(page)
-    base_page.navigate("https://www.saucedemo.com/")
+    base_page.navigate(LoginPage.url())
     
     # All selectors are wrong
     print("\nAttempting self-healing failure test...")
@@ -46,3 +61,80 @@ def test_self_healing_failure(page: Page):
     except Exception as e:
         print(f"Expected failure occurred: {e}")
         assert True
+
+def test_self_healing_races_fallbacks(page: Page, healing_cache):
+    """
+    Test to verify that fallbacks are raced against the primary instead of tried one by one.
+    A broken primary followed by broken fallbacks should heal well within a single timeout.
+    """
+    base_page = BasePage(page)
+    base_page.navigate(LoginPage.url())
+
+    start = time.monotonic()
+    username_input = SmartLocator(page, cache=healing_cache).get_locator(
+        "#wrong-id-for-username",
+        fallbacks=['#also-wrong', '.not-there-either', '[data-test="username"]'],
+        timeout=4000,
+    )
+    elapsed = time.monotonic() - start
+
+    expect(username_input).to_be_visible()
+    # Sequentially this would take 3 x 4s; racing finds the last fallback immediately.
+    assert elapsed < 4, f"Healing took {elapsed:.1f}s, fallbacks were not raced"
+
+def test_self_healing_cache(page: Page, tmp_path):
+    """
+    Test to verify that a successful heal is remembered and tried first next time.
+    """
+    base_page = BasePage(page)
+    base_page.navigate(LoginPage.url())
+    cache = HealingCache(str(tmp_path / "healing_cache.sqlite"))
+    smart = SmartLocator(page, cache=cache)
+
+    smart.get_locator("#wrong-id-for-username", fallbacks=['#also-wrong', '[data-test="username"]'])
+    assert cache.get(page.url, "#wrong-id-for-username") == '[data-test="username"]'
+
+    # The cached heal is tried first next time.
+    username_input = smart.get_locator("#wrong-id-for-username", fallbacks=['#also-wrong', '[data-test="username"]'])
+    expect(username_input).to_be_visible()
+
+    # A heal the caller no longer lists among the fallbacks is dropped instead of used.
+    smart.get_locator("#wrong-id-for-username", fallbacks=['#also-wrong'], timeout=500)
+    assert cache.get(page.url, "#wrong-id-for-username") is None
+
+def test_self_healing_cache_dropped_when_primary_works(page: Page, tmp_path):
+    """
+    Test to verify that a primary selector that matches again wins over its cached heal, which is then forgotten.
+    """
+    base_page = BasePage(page)
+    base_page.navigate(LoginPage.url())
+    cache = HealingCache(str(tmp_path / "healing_cache.sqlite"))
+
+    for race in (True, False):
+        cache.put(page.url, '[data-test="username"]', '#user-name')
+        smart = SmartLocator(page, race=race, cache=cache)
+        smart.get_locator('[data-test="username"]', fallbacks=['#user-name'])
+        assert cache.get(page.url, '[data-test="username"]') is None
+
+def test_self_healing_instrumentation(page: Page, tmp_path):
+    """
+    Test to verify that instrumentation records which selector won and how long the lookup took.
+    """
+    if instrumentation.enabled:
+        pytest.skip("Instrumentation is already enabled for the session (--instrument).")
+    base_page = BasePage(page)
+    base_page.navigate(LoginPage.url())
+    sink = instrumentation.MemorySink()
+    instrumentation.enable(sink)
+    try:
+        SmartLocator(page, cache=HealingCache(str(tmp_path / "healing_cache.sqlite"))).get_locator(
+            "#wrong-id-for-username", fallbacks=['[data-test="username"]']
+        )
+    finally:
+        instrumentation.disable()
+
+    span = sink.spans[-1]
+    assert span.name == "SmartLocator.get_locator"
+    assert span.attributes["winner"] == '[data-test="username"]'
+    assert span.attributes["healed"]
+    assert span.duration_ms >= sum(a["ms"] for a in span.attributes["attempts"])
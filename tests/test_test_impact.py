@@ -0,0 +1,164 @@
+import os
+import sys
+import subprocess
+from types import SimpleNamespace
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from utils.test_impact import DependencyIndex, changed_symbols, select
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Bodies of fake tests; only their source is analyzed, they never run.
+def _logs_in(page):
+    LoginPage(page).login("standard_user", "secret_sauce")
+
+def _checks_out(page):
+    cart_page = CartPage(page)
+    cart_page.checkout("John", "Doe", "12345")
+
+def fake_item(function, path, root=PROJECT_ROOT):
+    """The attributes of a collected test that the selection reads."""
+    return SimpleNamespace(
+        function=function,
+        nodeid=f"{path}::{function.__name__}",
+        path=os.path.join(root, path),
+        _fixtureinfo=SimpleNamespace(name2fixturedefs={}),
+    )
+
+def git(root, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, check=True, capture_output=True)
+
+def write(root, path, text):
+    os.makedirs(os.path.dirname(os.path.join(root, path)) or root, exist_ok=True)
+    with open(os.path.join(root, path), "w", encoding="utf-8") as f:
+        f.write(text)
+
+MODULE = '''import os
+
+LIMIT = 3
+
+def helper():
+    return 1
+
+class Page:
+    SELECTOR = "#a"
+
+    def open(self):
+        return 2
+'''
+
+@allure.feature("Test Selection")
+class TestChangedSymbols:
+    """
+    Test suite for mapping a git diff to the changed functions, methods and constants.
+    Uses a throwaway git repository, so no browser is needed.
+    """
+
+    def repository(self, tmp_path):
+        root = str(tmp_path)
+        git(root, "init", "-q")
+        write(root, "pages/page.py", MODULE)
+        write(root, "conftest.py", "import pytest\n\n@pytest.fixture\ndef thing():\n    return 1\n")
+        git(root, "add", ".")
+        git(root, "commit", "-q", "-m", "base")
+        return root
+
+    @allure.story("Diff")
+    def test_changed_lines_map_to_innermost_definition(self, tmp_path):
+        """Verify that edited methods, class attributes and module-level lines are told apart."""
+        root = self.repository(tmp_path)
+        write(root, "pages/page.py", MODULE.replace("return 2", "return 3")
+              .replace('"#a"', '"#b"').replace("LIMIT = 3", "LIMIT = 4"))
+        assert changed_symbols("HEAD", root) == {
+            "pages/page.py::Page.open", "pages/page.py::Page.SELECTOR", "pages/page.py::*",
+        }
+
+    @allure.story("Diff")
+    def test_untracked_and_data_files(self, tmp_path):
+        """Verify that new modules count as a whole and data files map to the symbols reading them."""
+        root = self.repository(tmp_path)
+        write(root, "pages/new_page.py", "X = 1\n")
+        write(root, "tests/hars/test_cart.har", "{}")
+        write(root, "notes.txt", "ignored")
+        assert changed_symbols("HEAD", root) == {"pages/new_page.py::*", "tests/test_cart.py::*"}
+
+    @allure.story("Diff")
+    def test_global_changes_select_everything(self, tmp_path):
+        """Verify that pytest.ini and conftest module-level code or hooks select the whole suite."""
+        root = self.repository(tmp_path)
+        write(root, "conftest.py", "import pytest\nimport os\n\n@pytest.fixture\ndef thing():\n    return 1\n")
+        assert changed_symbols("HEAD", root) is None
+
+        git(root, "checkout", "--", "conftest.py")
+        write(root, "pytest.ini", "[pytest]\n")
+        assert changed_symbols("HEAD", root) is None
+
+@allure.feature("Test Selection")
+class TestSelect:
+    """
+    Test suite for picking the tests that depend on changed symbols.
+    """
+
+    @allure.story("Static Dependencies")
+    def test_page_object_method_selects_its_tests(self):
+        """Verify that a changed page-object method selects only the tests calling it."""
+        logs_in = fake_item(_logs_in, "tests/test_login.py")
+        checks_out = fake_item(_checks_out, "tests/test_checkout.py")
+        index = DependencyIndex(PROJECT_ROOT)
+
+        selected, deselected = select([logs_in, checks_out], {"pages/login_page.py::LoginPage.login"}, index, {})
+        assert selected == [logs_in]
+        assert deselected == [checks_out]
+
+    @allure.story("Static Dependencies")
+    def test_element_descriptors_are_dependencies(self):
+        """Verify that declared elements depend on the Element descriptor and how locators are built."""
+        items = [fake_item(_logs_in, "tests/test_login.py"), fake_item(_checks_out, "tests/test_checkout.py")]
+        index = DependencyIndex(PROJECT_ROOT)
+        for change in ["pages/elements.py::Element.__get__", "pages/elements.py::cached_locator",
+                       "pages/elements.py::*", "pages/base_page.py::BasePage.locator_for"]:
+            selected, deselected = select(items, {change}, index, {})
+            assert selected == items, change
+
+    @allure.story("Runtime Coverage")
+    def test_recorded_coverage_selects(self):
+        """Verify that code a test was recorded running selects it even without a static dependency."""
+        item = fake_item(_logs_in, "tests/test_login.py")
+        runtime = {item.nodeid: {"pages/cart_page.py::CartPage.finish_checkout"}}
+        changed = {"pages/cart_page.py::CartPage.finish_checkout", "pages/login_page.py::LoginPage.login"}
+        selected, _ = select([item, fake_item(_checks_out, "tests/test_checkout.py")], changed,
+                             DependencyIndex(PROJECT_ROOT), runtime)
+        assert selected == [item]
+
+    @allure.story("Fallback")
+    def test_unmatched_change_selects_importing_modules(self, tmp_path):
+        """Verify that a change no test depends on selects the tests whose modules import the file."""
+        root = str(tmp_path)
+        write(root, "lib/__init__.py", "")
+        write(root, "lib/helpers.py", "def helper():\n    return 1\n")
+        write(root, "lib/wrapper.py", "from .helpers import helper\n")
+        write(root, "tests/test_a.py", "from lib import wrapper\n")
+        write(root, "tests/test_b.py", "import os\n")
+        through_import = fake_item(_logs_in, "tests/test_a.py", root)
+        unrelated = fake_item(_checks_out, "tests/test_b.py", root)
+
+        selected, deselected = select([through_import, unrelated], {"lib/helpers.py::helper"},
+                                      DependencyIndex(root), {})
+        assert selected == [through_import]
+        assert deselected == [unrelated]
+
+        write(root, "conftest.py", "import lib.helpers\n")
+        selected, _ = select([through_import, unrelated], {"lib/helpers.py::helper"}, DependencyIndex(root), {})
+        assert selected == [through_import, unrelated]
+
+if __name__ == "__main__":
+    script_path = os.path.abspath(__file__)
+    cmd = [sys.executable, "-m", "pytest", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=PROJECT_ROOT)
@@ -0,0 +1,67 @@
+import os
+import sys
+import pytest
+import allure
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from utils import visual
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+def white(height=60, width=80):
+    return np.full((height, width, 4), 255, dtype=np.uint8)
+
+@allure.feature("Visual Regression")
+class TestVisualCompare:
+    """
+    Test suite for the pixel comparison behind the assert_snapshot fixture.
+    Uses generated images, so no browser is needed.
+    """
+
+    @allure.story("Comparison")
+    def test_identical_screenshot_short_circuits(self, tmp_path):
+        """Verify that a byte-identical screenshot passes without a pixel comparison."""
+        png = visual.encode(white())
+        path = str(tmp_path / "page.png")
+        visual.save_baseline(path, png)
+        assert visual.assert_matches(png, path) is None
+
+    @allure.story("Comparison")
+    def test_changed_pixels_fail(self, tmp_path, monkeypatch):
+        """Verify that a new one-pixel line is reported, with the diff image written."""
+        monkeypatch.setattr(visual, "RESULTS_DIR", str(tmp_path / "results"))
+        path = str(tmp_path / "page.png")
+        visual.save_baseline(path, visual.encode(white()))
+        actual = white()
+        actual[:, 40, :3] = 0
+
+        with pytest.raises(AssertionError, match="60 pixels"):
+            visual.assert_matches(visual.encode(actual), path)
+        assert os.path.exists(tmp_path / "results" / f"{tmp_path.name}-page-diff.png")
+
+    @allure.story("Tolerance")
+    def test_threshold_and_anti_aliasing(self):
+        """Verify that small colour changes and edges moved by one pixel are tolerated."""
+        expected = white()
+        expected[:, 40:, :3] = 0
+        shifted = white()
+        shifted[:, 41:, :3] = 0
+        assert visual.compare(shifted, expected).diff_pixels == 0
+        assert visual.compare(shifted, expected, anti_aliasing=False).diff_pixels == 60
+
+        tinted = white()
+        tinted[10, 10, :3] = 250
+        assert visual.compare(tinted, white()).diff_pixels == 0
+        assert visual.compare(tinted, white(), threshold=0).diff_pixels == 1
+
+    @allure.story("Masks")
+    def test_ignored_regions_and_size_mismatch(self):
+        """Verify that ignored regions do not count and a different size always fails."""
+        actual = white()
+        actual[5:15, 5:15, :3] = 0
+        assert visual.compare(actual, white()).diff_pixels == 100
+        assert visual.compare(actual, white(), regions=[(5, 5, 10, 10)]).diff_pixels == 0
+        assert visual.compare(white(70, 80), white()).size_mismatch
@@ -0,0 +1,49 @@
+import os
+import sys
+import pytest
+import allure
+from playwright.sync_api import Page
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pages.login_page import LoginPage
+from utils.web_vitals import Budget, WebVitalsCollector
+
+@allure.feature("Performance")
+class TestWebVitals:
+    """
+    Test suite for the web vitals collector behind --web-vitals.
+    """
+
+    @allure.story("Capture")
+    def test_login_captures_metrics(self, page: Page):
+        """Verify that a navigation and the login action both produce a record."""
+        collector = WebVitalsCollector(budgets=[])
+        login_page = LoginPage(page)
+        login_page.navigate(LoginPage.url())
+        collector.capture(page, "LoginPage.navigate")
+
+        with collector.measure(page, "LoginPage.login"):
+            login_page.login("standard_user", "secret_sauce")
+
+        navigation, login = collector.records
+        assert navigation["new_document"] and navigation["ttfb"] is not None
+        assert login["url"].endswith("inventory.html")
+
+    @allure.story("Budgets")
+    def test_budget_violation_fails(self, page: Page):
+        """Verify that an exceeded budget raises an AssertionError naming the metric."""
+        collector = WebVitalsCollector(budgets=[Budget(metric="resource_count", max=-1)])
+        LoginPage(page).navigate(LoginPage.url())
+
+        with pytest.raises(AssertionError, match="resource_count"):
+            collector.capture(page, "LoginPage.navigate")
+
+if __name__ == "__main__":
+    import subprocess
+    script_path = os.path.abspath(__file__)
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    cmd = [sys.executable, "-m", "pytest", "--profile=debug", script_path]
+    print(f"Running command: {' '.join(cmd)}")
+    subprocess.run(cmd, cwd=project_root)
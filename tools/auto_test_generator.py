@@ -1,96 +1,496 @@
+import argparse
+import asyncio
+import hashlib
+import json
 import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit, urlunsplit
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
-def generate_test_case(url: str, output_path: str):
+from pages.aio.login_page import AsyncLoginPage
+
+# Analyze page to find interactive elements
+# We look for inputs, buttons, and links
+ANALYZE_SCRIPT = """() => {
+    const data = [];
+
+    // Helper to get unique-ish selector
+    function getSelectors(el) {
+        const selectors = [];
+        if (el.id) selectors.push(`#${el.id}`);
+        if (el.name) selectors.push(`[name="${el.name}"]`);
+        if (el.className) selectors.push(`.${el.className.split(' ').join('.')}`);
+        if (el.tagName === 'BUTTON' || el.tagName === 'A') {
+            const text = el.innerText.trim();
+            if (text) selectors.push(`text="${text}"`);
+        }
+        if (el.placeholder) selectors.push(`[placeholder="${el.placeholder}"]`);
+        return selectors;
+    }
+
+    // Hidden elements (e.g. a closed menu) would fail the generated visibility checks.
+    const visible = (el) => el.getClientRects().length > 0;
+
+    const inputs = document.querySelectorAll('input:not([type="hidden"])');
+    inputs.forEach(el => {
+        data.push({
+            tag: 'input',
+            selectors: getSelectors(el),
+            type: el.type,
+            visible: visible(el)
+        });
+    });
+
+    const buttons = document.querySelectorAll('button');
+    buttons.forEach(el => {
+        data.push({
+            tag: 'button',
+            selectors: getSelectors(el),
+            text: el.innerText.trim(),
+            visible: visible(el)
+        });
+    });
+
+    return data;
+}"""
+
+# Where the links of a page lead. Anchors without a real href (SPA navigation done by
+# click handlers) are returned by index, so the crawler can click them to find out.
+LINKS_SCRIPT = """(skip) => {
+    const skipRe = new RegExp(skip, 'i');
+    const hrefs = [];
+    const clickable = [];
+    document.querySelectorAll('a').forEach((a, i) => {
+        const href = a.getAttribute('href');
+        if (href && !href.startsWith('#') && !href.startsWith('javascript:')) {
+            hrefs.push(a.href);
+        } else if (!skipRe.test(`${a.id} ${a.innerText}`) && a.getClientRects().length > 0) {
+            clickable.push(i);
+        }
+    });
+    return {hrefs, clickable};
+}"""
+
+# Links whose id or text matches this are never clicked while crawling.
+DEFAULT_SKIP_LINKS = r"logout|log out|sign out|reset|delete|remove"
+
+def _relative_path(url: str) -> str:
+    """
+    Navigate relative to the configured base URL, so the generated test
+    also runs against the local stand-in or any other --base-url.
+    """
+    parts = urlsplit(url)
+    return parts.path.lstrip("/") + (f"?{parts.query}" if parts.query else "")
+
+def render_test(url: str, elements_data: list[dict], fixture: str = "page", also_seen_at: list[str] = ()) -> str:
+    """Python source of a test checking that the elements found at 'url' are visible."""
+    lines = []
+    lines.append("import pytest")
+    lines.append("from playwright.sync_api import Page, expect")
+    lines.append("from pages.base_page import BasePage")
+    lines.append("from utils.smart_locator import SmartLocator")
+    lines.append("")
+    lines.append(f"def test_generated_page_structure({fixture}: Page):")
+    lines.append(f"    # Generated test for {url}")
+    for other in also_seen_at:
+        lines.append(f"    # Same elements at {other}")
+    if fixture != "page":
+        lines.append(f"    page = {fixture}")
+    lines.append(f"    BasePage(page).navigate('{_relative_path(url)}')")
+    lines.append(f"    smart = SmartLocator(page)")
+    lines.append("")
+
+    for i, el in enumerate(elements_data):
+        selectors = el['selectors']
+        if not selectors or not el.get('visible', True):
+            continue
+
+        primary = selectors[0]
+        fallbacks = selectors[1:]
+
+        var_name = f"element_{i}"
+        lines.append(f"    # Interaction for {el['tag']} (Type: {el.get('type') or el.get('text')})")
+        lines.append(f"    {var_name} = smart.get_locator({primary!r}, fallbacks={fallbacks})")
+        lines.append(f"    expect({var_name}).to_be_visible()")
+        lines.append("")
+    return "\n".join(lines)
+
+def _structure(el: dict) -> dict:
+    """The parts of an analyzed element that end up in a generated test."""
+    return {key: el[key] for key in ("tag", "type", "text", "selectors", "visible") if el.get(key) is not None}
+
+def fingerprint(elements_data: list[dict]) -> str:
+    """
+    Hash of a page's element set (tags, types, texts, selector lists, visibility), in any order.
+    Pages with the same set get a single generated module.
+    """
+    keys = sorted(json.dumps(_structure(el), sort_keys=True) for el in elements_data)
+    return hashlib.sha1("\n".join(keys).encode()).hexdigest()[:12]
+
+def module_name(url: str) -> str:
+    """test_gen_<path and query as an identifier>.py, e.g. test_gen_inventory_item_id_4.py."""
+    path = re.sub(r"\.html?$", "", urlsplit(url).path.strip("/")) + "_" + urlsplit(url).query
+    slug = re.sub(r"[^0-9a-zA-Z]+", "_", path).strip("_").lower()
+    return f"test_gen_{slug or 'index'}.py"
+
+# ---------------------------------------------------------------------------
+# Incremental writes
+
+# Records what every generated module of a directory was rendered from; kept next to the modules.
+MANIFEST_NAME = ".generated_manifest.json"
+
+@dataclass
+class Module:
+    """Everything a generated test module is rendered from."""
+    url: str
+    elements: list[dict]
+    fixture: str = "page"
+    also_seen_at: list[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        return render_test(self.url, self.elements, self.fixture, self.also_seen_at)
+
+    def entry(self, source: str) -> dict:
+        """The module's manifest entry; 'source' is its rendered code."""
+        return {
+            "source": _digest(source),
+            "url": self.url,
+            "fixture": self.fixture,
+            "also_seen_at": list(self.also_seen_at),
+            "fingerprint": fingerprint(self.elements),
+            "elements": [_structure(el) for el in self.elements],
+        }
+
+@dataclass
+class SyncResult:
+    """Paths written (or, with check, to be written), left alone and removed, with a report of the changes."""
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    report: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.written or self.removed)
+
+def _digest(source: str) -> str:
+    return hashlib.sha1(source.encode()).hexdigest()[:12]
+
+def load_manifest(output_dir: str) -> dict:
+    """Return {module file name: manifest entry} of 'output_dir'."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _keyed(elements_data: list[dict]) -> dict[str, dict]:
+    """Elements by tag and primary selector; repeated keys are numbered."""
+    keyed = {}
+    for el in elements_data:
+        base = f"{el['tag']} {el['selectors'][0] if el.get('selectors') else '(no selector)'}"
+        key, n = base, 1
+        while key in keyed:
+            n += 1
+            key = f"{base} ({n})"
+        keyed[key] = el
+    return keyed
+
+def diff_elements(old: list[dict], new: list[dict]) -> list[str]:
+    """Lines describing how an element set changed: + added, - removed, ~ changed."""
+    before, after = _keyed(old), _keyed(new)
+    lines = [f"+ {key}" for key in after if key not in before]
+    lines += [f"- {key}" for key in before if key not in after]
+    for key in after:
+        if key in before and before[key] != after[key]:
+            changes = [f"{name} {before[key].get(name)!r} -> {after[key].get(name)!r}"
+                       for name in sorted(set(before[key]) | set(after[key]))
+                       if before[key].get(name) != after[key].get(name)]
+            lines.append(f"~ {key}: {'; '.join(changes)}")
+    return lines
+
+def _describe(name: str, old: dict, new: dict, current: str | None) -> list[str]:
+    """Report lines for a module that is (re)written; 'current' is the code in the file now."""
+    if old is None:
+        state = "not in the manifest" if current is not None else "new"
+        return [f"{name} ({new['url']}): {state}, {len(new['elements'])} elements"]
+    lines = [f"{name} ({new['url']}): {old['fingerprint']} -> {new['fingerprint']}"]
+    lines += [f"  {line}" for line in diff_elements(old["elements"], new["elements"])]
+    for key in ("url", "fixture", "also_seen_at"):
+        if old.get(key) != new[key]:
+            lines.append(f"  {key}: {old.get(key)!r} -> {new[key]!r}")
+    if len(lines) == 1:
+        # Same page: either the file or the generator's template changed.
+        if current is None:
+            lines.append("  file missing")
+        elif _digest(current) != old.get("source"):
+            lines.append("  edited by hand")
+        else:
+            lines.append("  template changed")
+    return lines
+
+def sync_modules(modules: dict[str, Module], output_dir: str, check: bool = False, prune: bool = False) -> SyncResult:
+    """
+    Bring the test modules in 'output_dir' up to date with 'modules' ({file name: Module}).
+
+    Every module is rendered (cheap) and written only if the file differs: unchanged files
+    keep their modification time, so pytest does not re-collect them. This also catches
+    template changes and hand edits. Every rewrite is reported against the manifest:
+    element by element when the page changed. With 'prune', modules in the manifest that
+    are no longer generated are deleted. With 'check', nothing is written; the result
+    tells what would change.
+    """
+    manifest = load_manifest(output_dir)
+    updated = dict(manifest)
+    result = SyncResult()
+    for name, module in sorted(modules.items()):
+        path = os.path.join(output_dir, name)
+        source = module.render()
+        entry, old = module.entry(source), manifest.get(name)
+        current = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                current = f.read()
+        if current == source:
+            result.unchanged.append(path)
+        else:
+            result.written.append(path)
+            result.report += _describe(name, old, entry, current)
+            if not check:
+                os.makedirs(output_dir, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(source)
+        updated[name] = entry
+    if prune:
+        for name in sorted(set(manifest) - set(modules)):
+            path = os.path.join(output_dir, name)
+            result.removed.append(path)
+            result.report.append(f"{name} ({manifest[name]['url']}): no longer generated")
+            del updated[name]
+            if not check and os.path.exists(path):
+                os.remove(path)
+    if not check and updated != manifest:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(updated, f, indent=1, sort_keys=True)
+    return result
+
+def generate_test_case(url: str, output_path: str, check: bool = False) -> SyncResult:
     """
     Analyzes the web page at 'url' and generates a Playwright test case
-    with self-healing selectors.
+    with self-healing selectors. The file is only rewritten if the page changed.
     """
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
         print(f"Navigating to {url}...")
         page.goto(url)
-        
-        # Analyze page to find interactive elements
-        # We look for inputs, buttons, and links
-        elements_data = page.evaluate("""() => {
-            const data = [];
-            
-            // Helper to get unique-ish selector
-            function getSelectors(el) {
-                const selectors = [];
-                if (el.id) selectors.push(`#${el.id}`);
-                if (el.name) selectors.push(`[name="${el.name}"]`);
-                if (el.className) selectors.push(`.${el.className.split(' ').join('.')}`);
-                if (el.tagName === 'BUTTON' || el.tagName === 'A') {
-                    const text = el.innerText.trim();
-                    if (text) selectors.push(`text="${text}"`);
-                }
-                if (el.placeholder) selectors.push(`[placeholder="${el.placeholder}"]`);
-                return selectors;
-            }
-
-            const inputs = document.querySelectorAll('input:not([type="hidden"])');
-            inputs.forEach(el => {
-                data.push({
-                    tag: 'input',
-                    selectors: getSelectors(el),
-                    type: el.type
-                });
-            });
-
-            const buttons = document.querySelectorAll('button');
-            buttons.forEach(el => {
-                data.push({
-                    tag: 'button',
-                    selectors: getSelectors(el),
-                    text: el.innerText.trim()
-                });
-            });
-
-            return data;
-        }""")
-        
+
+        elements_data = page.evaluate(ANALYZE_SCRIPT)
+
         browser.close()
-        
-        # Generate Python Test Code
-        lines = []
-        lines.append("import pytest")
-        lines.append("from playwright.sync_api import Page, expect")
-        lines.append("from utils.smart_locator import SmartLocator")
-        lines.append("")
-        lines.append(f"def test_generated_page_structure(page: Page):")
-        lines.append(f"    # Generated test for {url}")
-        lines.append(f"    page.goto('{url}')")
-        lines.append(f"    smart = SmartLocator(page)")
-        lines.append("")
-        
-        for i, el in enumerate(elements_data):
-            selectors = el['selectors']
-            if not selectors:
-                continue
-            
-            primary = selectors[0]
-            fallbacks = selectors[1:]
-            
-            var_name = f"element_{i}"
-            lines.append(f"    # Interaction for {el['tag']} (Type: {el.get('type') or el.get('text')})")
-            lines.append(f"    {var_name} = smart.get_locator('{primary}', fallbacks={fallbacks})")
-            lines.append(f"    expect({var_name}).to_be_visible()")
-            lines.append("")
-            
-        # Write to file
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write("\n".join(lines))
-        
-        print(f"Test case generated at: {output_path}")
+
+    output_dir, name = os.path.split(output_path)
+    return sync_modules({name: Module(url, elements_data)}, output_dir or ".", check=check)
+
+# ---------------------------------------------------------------------------
+# Crawl mode
+
+@dataclass
+class CrawledPage:
+    """One analyzed page."""
+    url: str
+    depth: int
+    elements: list[dict]
+    # Whether the page was reached with the logged-in session.
+    logged_in: bool = False
+    fingerprint: str = ""
+
+@dataclass
+class CrawlResult:
+    pages: list[CrawledPage] = field(default_factory=list)
+    # {url: error} for pages that could not be analyzed.
+    errors: dict[str, str] = field(default_factory=dict)
+    duration: float = 0.0
+
+def _normalize(url: str) -> str:
+    """Drop the fragment, so '#top' links do not count as new pages."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path or "/", parts.query, ""))
+
+async def crawl(
+    seed_url: str,
+    max_pages: int = 200,
+    concurrency: int = 8,
+    login: tuple[str, str] = None,
+    browser_name: str = "chromium",
+    headless: bool = True,
+    skip_links: str = DEFAULT_SKIP_LINKS,
+    click_timeout: float = 2000,
+) -> CrawlResult:
+    """
+    Breadth-first crawl of the pages of seed_url's origin, in one browser.
+
+    'concurrency' pages of one browser context take URLs from a shared queue; each
+    page is loaded once and analyzed with ANALYZE_SCRIPT. New URLs come from the
+    hrefs of its links and, for links without one, from where clicking them leads
+    (on a scratch page, so the analyzed page is not disturbed). With 'login'
+    (username, password) the seed page is analyzed anonymously and the login form
+    filled in on it; every other page is crawled with the resulting session.
+    """
+    origin = urlsplit(seed_url)[:2]
+    result = CrawlResult()
+    start = time.perf_counter()
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_name).launch(headless=headless)
+        context = await browser.new_context()
+        seen = {_normalize(seed_url)}
+        queue = asyncio.Queue()
+
+        def discover(url: str, depth: int):
+            url = _normalize(url)
+            if urlsplit(url)[:2] == origin and url not in seen and len(seen) < max_pages:
+                seen.add(url)
+                queue.put_nowait((url, depth))
+
+        async def analyze(page, url: str, depth: int):
+            await page.goto(url)
+            await page.wait_for_load_state()
+            final_url = _normalize(page.url)
+            if final_url != url:
+                # Redirected (e.g. to the login page): analyze the target under its own URL.
+                discover(final_url, depth)
+                return
+            elements = await page.evaluate(ANALYZE_SCRIPT)
+            result.pages.append(CrawledPage(url, depth, elements, logged_in=login is not None and depth > 0,
+                                            fingerprint=fingerprint(elements)))
+            links = await page.evaluate(LINKS_SCRIPT, skip_links)
+            for href in links["hrefs"]:
+                discover(href, depth + 1)
+            if links["clickable"]:
+                scratch = await context.new_page()
+                try:
+                    for index in links["clickable"]:
+                        await scratch.goto(url)
+                        try:
+                            await scratch.locator("a").nth(index).click(timeout=click_timeout)
+                            await scratch.wait_for_url(lambda u: _normalize(u) != url, timeout=click_timeout)
+                        except Exception:
+                            continue
+                        discover(scratch.url, depth + 1)
+                finally:
+                    await scratch.close()
+
+        async def worker(page):
+            while True:
+                url, depth = await queue.get()
+                try:
+                    await analyze(page, url, depth)
+                except Exception as e:
+                    result.errors[url] = str(e).splitlines()[0]
+                finally:
+                    queue.task_done()
+
+        try:
+            seed = await context.new_page()
+            await analyze(seed, _normalize(seed_url), 0)
+            if login:
+                await seed.goto(seed_url)
+                await AsyncLoginPage(seed).login(*login)
+                await seed.wait_for_load_state()
+                discover(seed.url, 1)
+            await seed.close()
+
+            workers = [asyncio.create_task(worker(await context.new_page())) for _ in range(concurrency)]
+            await queue.join()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            await browser.close()
+    result.duration = time.perf_counter() - start
+    return result
+
+def write_modules(result: CrawlResult, output_dir: str, check: bool = False) -> SyncResult:
+    """
+    Write one test module per distinct element set, skipping the unchanged ones.
+    Of pages with the same fingerprint, the one closest to the seed (then by URL) is
+    generated; the others are listed in a comment. Modules of pages that are gone are
+    deleted, unless some pages of this crawl failed. URLs that map to the same module
+    name (e.g. /cart and /cart.html) are told apart by a _2, _3, ... suffix.
+    """
+    groups = {}
+    for crawled in sorted(result.pages, key=lambda c: (c.depth, c.url)):
+        if crawled.elements:
+            groups.setdefault(crawled.fingerprint, []).append(crawled)
+    modules = {}
+    for first, *others in groups.values():
+        fixture = "logged_in_page" if first.logged_in else "page"
+        name = base = module_name(first.url)
+        n = 1
+        while name in modules:
+            n += 1
+            name = f"{base[:-len('.py')]}_{n}.py"
+        modules[name] = Module(first.url, first.elements, fixture, [other.url for other in others])
+    return sync_modules(modules, output_dir, check=check, prune=not result.errors)
+
+def print_sync(sync: SyncResult, check: bool):
+    """Print the change report and a summary line."""
+    for line in sync.report:
+        print(line)
+    verb = "to write" if check else "written"
+    print(f"{len(sync.written)} modules {verb}, {len(sync.unchanged)} unchanged, {len(sync.removed)} removed")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate self-healing Playwright tests from live pages.")
+    parser.add_argument("url", nargs="?", default="https://www.saucedemo.com/", help="Page to analyze, or the seed of --crawl.")
+    parser.add_argument("--output", default=None,
+                        help="Test file to write (default: tests/generated/test_saucedemo_generated.py), "
+                             "or the directory of the modules with --crawl (default: crawled_tests, outside pytest's testpaths).")
+    parser.add_argument("--crawl", action="store_true", help="Follow same-origin links and generate one module per page.")
+    parser.add_argument("--max-pages", type=int, default=200, help="Stop discovering pages after this many.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Pages analyzed at once.")
+    parser.add_argument("--login", metavar="USER:PASSWORD", help="Log in on the seed page before crawling on.")
+    parser.add_argument("--skip-links", default=DEFAULT_SKIP_LINKS, help="Regex of link ids/texts never clicked.")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("--check", action="store_true",
+                        help="Write nothing; report what changed and exit with 1 if a module is out of date.")
+    args = parser.parse_args()
+
+    if not args.crawl:
+        sync = generate_test_case(args.url, args.output or "tests/generated/test_saucedemo_generated.py", check=args.check)
+        print_sync(sync, args.check)
+        sys.exit(1 if args.check and sync.changed else 0)
+
+    login = tuple(args.login.split(":", 1)) if args.login else None
+    result = asyncio.run(crawl(
+        args.url,
+        max_pages=args.max_pages,
+        concurrency=args.concurrency,
+        login=login,
+        browser_name=args.browser,
+        headless=not args.headed,
+        skip_links=args.skip_links,
+    ))
+    sync = write_modules(result, args.output or "crawled_tests", check=args.check)
+    print(f"Crawled {len(result.pages)} pages in {result.duration:.1f}s")
+    print_sync(sync, args.check)
+    for url, error in result.errors.items():
+        print(f"  failed: {url}: {error}")
+    sys.exit(1 if args.check and sync.changed else 0)
 
 if __name__ == "__main__":
     # Example usage:
-    # Generate a test for the inventory page (assuming login is handled or we test a public page)
-    # For demo, we'll test a public site or the login page itself.
-    target_url = "https://www.saucedemo.com/" 
-    output_file = "tests/generated/test_saucedemo_generated.py"
-    generate_test_case(target_url, output_file)
+    #   python tools/auto_test_generator.py https://www.saucedemo.com/
+    #   python tools/auto_test_generator.py https://www.saucedemo.com/ --crawl --login standard_user:secret_sauce
+    #   python tools/auto_test_generator.py --check
+    main()
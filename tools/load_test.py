@@ -0,0 +1,70 @@
+import argparse
+import asyncio
+import os
+import sys
+from functools import partial
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from local_app.server import LocalSauceDemo
+from pages.base_page import BasePage
+from pages.aio.journeys import purchase_flow
+from utils.load_runner import LoadProfile, run_load
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Use the E2E purchase journey as a load generator and report per-step latency percentiles."
+    )
+    parser.add_argument("--users", type=int, default=10, help="Virtual users.")
+    parser.add_argument("--contexts", type=int, default=None, help="Journeys running at once, each in its own context (default: one per user).")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds over which users are started.")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.0, 0.0), metavar=("MIN", "MAX"),
+                        help="Random pause after every step, in seconds.")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds.")
+    parser.add_argument("--iterations", type=int, default=None,
+                        help="Journeys per user (default: 1, or unlimited when --duration is given).")
+    parser.add_argument("--user", default="standard_user", help="SauceDemo account, e.g. performance_glitch_user.")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("--app", default="live", choices=["live", "local"], help="Target the live site or the local stand-in.")
+    parser.add_argument("--json", help="Write the report as JSON to this file.")
+    parser.add_argument("--csv", help="Write per-step statistics as CSV to this file.")
+    args = parser.parse_args()
+
+    iterations = args.iterations
+    if iterations is None and args.duration is None:
+        iterations = 1
+    profile = LoadProfile(
+        users=args.users,
+        contexts=args.contexts or args.users,
+        ramp_up=args.ramp_up,
+        think_time=tuple(args.think_time),
+        duration=args.duration,
+        iterations=iterations,
+    )
+
+    server = None
+    if args.app == "local":
+        server = LocalSauceDemo()
+        BasePage.base_url = server.start()
+    try:
+        report = asyncio.run(run_load(
+            partial(purchase_flow, username=args.user),
+            profile,
+            browser_name=args.browser,
+            headless=not args.headed,
+        ))
+    finally:
+        if server:
+            server.stop()
+
+    print(report.summary())
+    if args.json:
+        report.to_json(args.json)
+    if args.csv:
+        report.to_csv(args.csv)
+    sys.exit(1 if report.failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from statistics import median
+
+DEFAULT_DB = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "perf_history.sqlite"))
+# Step name used for the duration of a whole test (as opposed to one of its steps).
+WHOLE_TEST = ""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL,
+    ingested REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    test TEXT NOT NULL,
+    step TEXT NOT NULL,
+    browser TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS samples_key ON samples (test, step, browser);
+"""
+
+def connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+def _browser(result: dict) -> str:
+    """The browser a result ran in, from pytest-playwright's browser_name parameter."""
+    for parameter in result.get("parameters", []):
+        if parameter.get("name") == "browser_name":
+            return parameter.get("value", "").strip("'\"")
+    return "chromium"
+
+# Allure stores parameter values as Python reprs, e.g. 'chromium'.
+QUOTES = "'\""
+
+def _test_name(result: dict) -> str:
+    """
+    The test a result belongs to: its full name plus its parameters other than the browser
+    (which has its own column), e.g. tests.test_login.TestLogin#test_login_parametrized[username=problem_user].
+    Without them every parametrized variant would share one history.
+    """
+    name = result.get("fullName") or result.get("name")
+    parameters = [f"{p.get('name')}={p.get('value', '').strip(QUOTES)}"
+                  for p in result.get("parameters", []) if p.get("name") != "browser_name"]
+    return f"{name}[{', '.join(parameters)}]" if parameters else name
+
+def _steps(steps: list, prefix: str = ""):
+    """Yield (path, duration_ms, status) for every Allure step, nested steps joined with ' > '."""
+    for step in steps:
+        path = f"{prefix}{step.get('name', '')}"
+        if "start" in step and "stop" in step:
+            yield path, step["stop"] - step["start"], step.get("status")
+        yield from _steps(step.get("steps", []), f"{path} > ")
+
+def ingest(conn: sqlite3.Connection, results_dir: str, run_id: str) -> int:
+    """Store the durations of every test and step in an allure-results directory. Returns the row count."""
+    rows = []
+    starts = []
+    for path in glob.glob(os.path.join(results_dir, "*-result.json")):
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+        if "start" not in result or "stop" not in result:
+            continue
+        test = _test_name(result)
+        browser = _browser(result)
+        starts.append(result["start"])
+        rows.append((run_id, test, WHOLE_TEST, browser, result["stop"] - result["start"], result.get("status")))
+        for step, duration, status in _steps(result.get("steps", [])):
+            rows.append((run_id, test, step, browser, duration, status))
+
+    with conn:
+        # Re-ingesting a run replaces it.
+        conn.execute("DELETE FROM samples WHERE run_id = ?", (run_id,))
+        conn.execute(
+            "INSERT OR REPLACE INTO runs (run_id, started, ingested) VALUES (?, ?, ?)",
+            (run_id, min(starts) / 1000 if starts else None, time.time()),
+        )
+        conn.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+def _run_durations(conn: sqlite3.Connection, run_ids: list[str]) -> dict:
+    """
+    {(test, step, browser): {run_id: duration_ms}} for passed samples of the given runs.
+    Repeated samples within a run (e.g. reruns) are reduced to their median.
+    """
+    placeholders = ",".join("?" * len(run_ids))
+    samples = defaultdict(lambda: defaultdict(list))
+    for run_id, test, step, browser, duration in conn.execute(
+        f"SELECT run_id, test, step, browser, duration_ms FROM samples "
+        f"WHERE run_id IN ({placeholders}) AND status = 'passed'",
+        run_ids,
+    ):
+        samples[(test, step, browser)][run_id].append(duration)
+
+    return {key: {run_id: median(values) for run_id, values in runs.items()} for key, runs in samples.items()}
+
+def compare(conn: sqlite3.Connection, run_id: str | None = None, baseline_runs: int = 20,
+            threshold: float = 3.5, min_delta_ms: float = 100.0, min_runs: int = 5) -> list[dict]:
+    """
+    Compare a run (the latest one by default) to the runs ingested before it.
+
+    For every test, step and browser the baseline is the median and the median absolute
+    deviation (MAD) of the previous 'baseline_runs' runs. A duration is a regression when
+    its robust z-score, 0.6745 * (x - median) / MAD, is above 'threshold' and it is at
+    least 'min_delta_ms' slower than the median. Medians and MAD are not thrown off by
+    the occasional very slow run in the baseline, unlike mean and standard deviation.
+    """
+    runs = [row[0] for row in conn.execute("SELECT run_id FROM runs ORDER BY ingested")]
+    if not runs:
+        return []
+    run_id = run_id or runs[-1]
+    if run_id not in runs:
+        raise SystemExit(f"Unknown run '{run_id}'.")
+    baseline = runs[:runs.index(run_id)][-baseline_runs:]
+    if not baseline:
+        return []
+
+    durations = _run_durations(conn, [*baseline, run_id])
+    regressions = []
+    for (test, step, browser), per_run in durations.items():
+        if run_id not in per_run:
+            continue
+        history = [per_run[r] for r in baseline if r in per_run]
+        if len(history) < min_runs:
+            continue
+        current = per_run[run_id]
+        center = median(history)
+        # A perfectly stable history has MAD 0; treat it as 1 ms so the z-score stays finite.
+        mad = max(median(abs(d - center) for d in history), 1.0)
+        z = 0.6745 * (current - center) / mad
+        if z > threshold and current - center >= min_delta_ms:
+            regressions.append({
+                "test": test,
+                "step": step or None,
+                "browser": browser,
+                "current_ms": round(current, 1),
+                "baseline_median_ms": round(center, 1),
+                "baseline_mad_ms": round(mad, 1),
+                "baseline_runs": len(history),
+                "z": round(z, 2),
+            })
+    return sorted(regressions, key=lambda r: r["z"], reverse=True)
+
+def format_regressions(run_id: str, regressions: list[dict]) -> str:
+    """Human-readable list of regressions."""
+    if not regressions:
+        return f"No significant slowdowns in run {run_id}."
+    lines = [f"{len(regressions)} significant slowdown(s) in run {run_id}:"]
+    for r in regressions:
+        name = r["test"] + (f" :: {r['step']}" if r["step"] else "")
+        lines.append(
+            f"  [{r['browser']}] {name}: {r['current_ms']:.0f} ms vs median {r['baseline_median_ms']:.0f} ms "
+            f"(MAD {r['baseline_mad_ms']:.0f} ms, z={r['z']}, {r['baseline_runs']} runs)"
+        )
+    return "\n".join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep a history of test and step durations and flag slowdowns.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite history file (default: perf_history.sqlite).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="Add an allure-results directory to the history.")
+    ingest_parser.add_argument("results_dir", help="Directory written by pytest --alluredir.")
+    ingest_parser.add_argument("--run-id", default=None, help="Name of the run, e.g. the CI build id (default: timestamp).")
+
+    compare_parser = commands.add_parser("compare", help="Compare a run to the runs before it.")
+    compare_parser.add_argument("--run-id", default=None, help="Run to check (default: the latest).")
+    compare_parser.add_argument("--baseline", type=int, default=20, help="Number of previous runs in the baseline.")
+    compare_parser.add_argument("--threshold", type=float, default=3.5, help="Robust z-score above which a slowdown is flagged.")
+    compare_parser.add_argument("--min-delta-ms", type=float, default=100.0, help="Ignore slowdowns smaller than this.")
+    compare_parser.add_argument("--min-runs", type=int, default=5, help="Baseline runs needed before anything is flagged.")
+    compare_parser.add_argument("--json", help="Also write the regressions to this JSON file.")
+    compare_parser.add_argument("--fail", action="store_true", help="Exit with status 1 when a slowdown is flagged.")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "ingest":
+        run_id = args.run_id or time.strftime("%Y%m%d-%H%M%S")
+        count = ingest(conn, args.results_dir, run_id)
+        print(f"Ingested {count} durations from {args.results_dir} as run {run_id}.")
+        return
+
+    regressions = compare(conn, args.run_id, args.baseline, args.threshold, args.min_delta_ms, args.min_runs)
+    run_id = args.run_id or next(iter(conn.execute("SELECT run_id FROM runs ORDER BY ingested DESC LIMIT 1")), [None])[0]
+    print(format_regressions(run_id, regressions))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(regressions, f, indent=2)
+    if args.fail and regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
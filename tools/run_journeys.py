@@ -0,0 +1,47 @@
+import argparse
+import asyncio
+import os
+import sys
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from local_app.server import LocalSauceDemo
+from pages.base_page import BasePage
+from pages.aio.journeys import purchase_flow
+from utils.async_runner import run_journeys
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many purchase journeys concurrently in one browser.")
+    parser.add_argument("--users", type=int, default=10, help="Number of journeys to run.")
+    parser.add_argument("--concurrency", type=int, default=None, help="Journeys in flight at once (default: all).")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("--app", default="live", choices=["live", "local"], help="Target the live site or the local stand-in.")
+    args = parser.parse_args()
+
+    server = None
+    if args.app == "local":
+        server = LocalSauceDemo()
+        BasePage.base_url = server.start()
+    try:
+        results = asyncio.run(run_journeys(
+            purchase_flow,
+            users=args.users,
+            concurrency=args.concurrency,
+            browser_name=args.browser,
+            headless=not args.headed,
+        ))
+    finally:
+        if server:
+            server.stop()
+
+    passed = [r for r in results if r.passed]
+    print(f"{len(passed)}/{len(results)} journeys passed")
+    for r in results:
+        if not r.passed:
+            print(f"User {r.user} failed after {r.duration:.2f}s:\n{r.error}")
+    sys.exit(0 if len(passed) == len(results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+import argparse
+import ast
+import difflib
+import glob
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+
+# Add parent directory to sys.path to allow running this file directly.
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from playwright.sync_api import sync_playwright
+
+from local_app.server import LocalSauceDemo
+from pages import locators
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.elements import Element, ElementTemplate
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+GENERATED_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests", "generated"))
+
+# Counts every selector in one round trip and lists what the page could be matched by instead.
+#   counts:     matches per selector, null when it is not valid CSS (e.g. text="Login")
+#   same:       groups of the first 'checked' selectors that match the same single element
+#   candidates: {selector: matches} for the ids, data-test, name and placeholder attributes
+#               and classes on the page, the pool that healing suggestions are drawn from
+HEALTH_SCRIPT = r"""
+([selectors, checked]) => {
+    const owners = new Map();
+    const counts = selectors.map((selector, i) => {
+        let found;
+        try {
+            found = document.querySelectorAll(selector);
+        } catch (e) {
+            return null;
+        }
+        if (found.length === 1 && i < checked) {
+            owners.set(found[0], [...(owners.get(found[0]) || []), selector]);
+        }
+        return found.length;
+    });
+    const candidates = {};
+    const add = (selector) => { candidates[selector] = (candidates[selector] || 0) + 1; };
+    for (const el of document.querySelectorAll("body *")) {
+        if (el.id) add(`#${CSS.escape(el.id)}`);
+        for (const attr of ["data-test", "name", "placeholder"]) {
+            const value = el.getAttribute(attr);
+            if (value) add(`[${attr}='${value.replace(/'/g, "\\'")}']`);
+        }
+        for (const cls of el.classList) add(`.${CSS.escape(cls)}`);
+    }
+    return {counts, same: [...owners.values()].filter((group) => group.length > 1), candidates};
+}
+"""
+
+@dataclass
+class Declared:
+    """A selector and everywhere it is declared."""
+    selector: str
+    owners: list[str] = field(default_factory=list)
+    # Elements and generated locators must match exactly one element (strict mode);
+    # row and field selectors such as ITEM_NAME only have to exist.
+    unique: bool = False
+    fallbacks: list[str] = field(default_factory=list)
+    # What is actually evaluated; templates are probed through their fixed prefix.
+    probe: str | None = None
+
+def _template_probe(selector: str) -> str | None:
+    """[data-test='remove-{item}'] -> [data-test^='remove-']; None if the placeholder is not at the end of a value."""
+    probe = re.sub(r"\[([\w-]+)=(['\"])([^'\"{]*)\{\w*\}\2\]", r"[\1^=\2\3\2]", selector)
+    return probe if "{" not in probe else None
+
+def page_object_selectors() -> dict[str, Declared]:
+    """Selector constants and elements of the locator classes in pages/locators.py."""
+    declared = {}
+    for cls in vars(locators).values():
+        if not inspect.isclass(cls) or cls.__module__ != locators.__name__:
+            continue
+        for name, value in vars(cls).items():
+            if isinstance(value, Element):
+                selector = value.selector
+            elif name.isupper() and name != "PATH" and isinstance(value, str):
+                selector = value
+            else:
+                continue
+            entry = declared.setdefault(selector, Declared(selector))
+            entry.owners.append(f"{cls.__name__}.{name}")
+            if isinstance(value, ElementTemplate) or "{" in selector:
+                entry.probe = _template_probe(selector)
+            else:
+                entry.probe = selector
+                entry.unique |= isinstance(value, Element)
+    return declared
+
+def generated_selectors(directory: str = GENERATED_DIR, declared: dict[str, Declared] = None) -> dict[str, Declared]:
+    """Selectors passed to get_locator(), smart_find() and locator() in the generated tests."""
+    declared = {} if declared is None else declared
+    root = os.path.dirname(os.path.dirname(directory))
+    for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+        relative = os.path.relpath(path, root).replace(os.sep, "/")
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in ("get_locator", "smart_find", "locator")
+                    and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+                continue
+            fallbacks = node.args[1] if len(node.args) > 1 else next(
+                (k.value for k in node.keywords if k.arg == "fallbacks"), None)
+            selector = node.args[0].value
+            entry = declared.setdefault(selector, Declared(selector, probe=selector))
+            entry.owners.append(f"{relative}:{node.lineno}")
+            entry.unique = True
+            if isinstance(fallbacks, (ast.List, ast.Tuple)):
+                entry.fallbacks += [e.value for e in fallbacks.elts
+                                    if isinstance(e, ast.Constant) and e.value not in entry.fallbacks]
+    return declared
+
+def page_states(page, username: str, password: str):
+    """
+    Walk the purchase flow once, stopping at each page: login, inventory, cart,
+    checkout step one and two, and complete. Yields the name of each state.
+    Error banners are triggered on the way, so their selectors are covered too.
+    """
+    login_page = LoginPage(page)
+    inventory_page = InventoryPage(page)
+    cart_page = CartPage(page)
+
+    login_page.load()
+    login_page.login_button.click()
+    yield "login"
+    login_page.login(username, password)
+    page.wait_for_url(inventory_page.url())
+    inventory_page.add_item_to_cart("sauce-labs-backpack")
+    yield "inventory"
+    inventory_page.go_to_cart()
+    page.wait_for_url(cart_page.url())
+    yield "cart"
+    cart_page.checkout_button.click()
+    page.wait_for_url("**/checkout-step-one.html")
+    cart_page.continue_button.click()
+    yield "checkout-step-one"
+    cart_page.first_name_input.fill("John")
+    cart_page.last_name_input.fill("Doe")
+    cart_page.postal_code_input.fill("12345")
+    cart_page.continue_button.click()
+    page.wait_for_url("**/checkout-step-two.html")
+    yield "checkout-step-two"
+    cart_page.finish_checkout()
+    page.wait_for_url("**/checkout-complete.html")
+    yield "checkout-complete"
+
+def scan(page, declared: dict[str, Declared], username: str = "standard_user", password: str = "secret_sauce") -> dict:
+    """
+    Evaluate every declared selector and fallback on every page state, one batch per state.
+    Returns {"states", "counts": {selector: {state: matches}}, "same": [groups], "candidates": {selector: max matches}}.
+    """
+    checked = [d.probe for d in declared.values() if d.probe]
+    selectors = list(dict.fromkeys(checked + [f for d in declared.values() for f in d.fallbacks]))
+    result = {"states": [], "counts": {s: {} for s in selectors}, "same": [], "candidates": {}}
+    for state in page_states(page, username, password):
+        page.wait_for_load_state()
+        batch = page.evaluate(HEALTH_SCRIPT, [selectors, len(checked)])
+        result["states"].append(state)
+        for selector, count in zip(selectors, batch["counts"]):
+            if count is None:
+                # Not CSS: let Playwright's own selector engines count it (one round trip each).
+                try:
+                    count = page.locator(selector).count()
+                except Exception:
+                    count = None
+            result["counts"][selector][state] = count
+        for group in batch["same"]:
+            if group not in result["same"]:
+                result["same"].append(group)
+        for candidate, count in batch["candidates"].items():
+            result["candidates"][candidate] = max(count, result["candidates"].get(candidate, 0))
+    return result
+
+def suggest(selector: str, candidates: dict[str, int], n: int = 3) -> list[str]:
+    """Selectors on the pages that look like 'selector' and match a single element."""
+    unique = [candidate for candidate, count in candidates.items() if count == 1]
+    return difflib.get_close_matches(selector, unique, n=n, cutoff=0.5)
+
+def report(declared: dict[str, Declared], result: dict) -> list[dict]:
+    """
+    One finding per problem:
+      missing    the selector matches nothing on any page (error)
+      invalid    the selector cannot be parsed (error)
+      ambiguous  an element matches more than once, which fails in strict mode (error)
+      healable   the primary is missing but a fallback matches; every run pays for the heal (warning)
+      duplicate  several declared selectors match the same element (warning)
+    """
+    findings = []
+    counts = result["counts"]
+    for entry in declared.values():
+        if entry.probe is None:
+            continue
+        matches = counts[entry.probe]
+        base = {"selector": entry.selector, "declared_by": entry.owners,
+                "matches": {state: count for state, count in matches.items() if count}}
+        if all(count is None for count in matches.values()):
+            findings.append({"status": "invalid", "severity": "error", **base})
+        elif not any(matches.values()):
+            healed = [f for f in entry.fallbacks if any(counts[f].values())]
+            if healed:
+                findings.append({"status": "healable", "severity": "warning", **base, "suggestions": healed})
+            else:
+                findings.append({"status": "missing", "severity": "error", **base,
+                                 "suggestions": suggest(entry.selector, result["candidates"])})
+        elif entry.unique and max(count or 0 for count in matches.values()) > 1:
+            findings.append({"status": "ambiguous", "severity": "error", **base,
+                             "suggestions": suggest(entry.selector, result["candidates"])})
+    by_probe = {d.probe: d for d in declared.values() if d.probe}
+    for group in result["same"]:
+        findings.append({
+            "status": "duplicate", "severity": "warning",
+            "selector": " == ".join(group),
+            "declared_by": [owner for selector in group for owner in by_probe[selector].owners],
+        })
+    return findings
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check every page-object and generated-test selector against the live pages in one pass."
+    )
+    parser.add_argument("--generated", default=GENERATED_DIR, help="Directory of generated tests to include.")
+    parser.add_argument("--user", default="standard_user", help="SauceDemo account to walk the flow with.")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Show the browser window.")
+    parser.add_argument("--app", default="live", choices=["live", "local"], help="Target the live site or the local stand-in.")
+    parser.add_argument("--timeout", type=float, default=10000, help="Timeout of each navigation step, in ms.")
+    parser.add_argument("--json", help="Write the findings as JSON to this file.")
+    parser.add_argument("--strict", action="store_true", help="Also fail on warnings (healable and duplicate selectors).")
+    args = parser.parse_args()
+
+    declared = generated_selectors(args.generated, page_object_selectors())
+    server = None
+    if args.app == "local":
+        server = LocalSauceDemo()
+        BasePage.base_url = server.start()
+    start = time.perf_counter()
+    try:
+        with sync_playwright() as p:
+            browser = getattr(p, args.browser).launch(headless=not args.headed)
+            page = browser.new_page()
+            page.set_default_timeout(args.timeout)
+            result = scan(page, declared, username=args.user)
+            browser.close()
+    finally:
+        if server:
+            server.stop()
+    findings = report(declared, result)
+
+    print(f"{len(declared)} selectors checked on {len(result['states'])} pages in {time.perf_counter() - start:.1f}s")
+    for finding in findings:
+        print(f"\n{finding['severity'].upper():8} {finding['status']:10} {finding['selector']}")
+        print(f"         declared by: {', '.join(finding['declared_by'])}")
+        if finding.get("matches"):
+            print(f"         matches: {', '.join(f'{s}={c}' for s, c in finding['matches'].items())}")
+        if finding.get("suggestions"):
+            print(f"         try: {', '.join(finding['suggestions'])}")
+    if not findings:
+        print("All selectors healthy.")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"states": result["states"], "findings": findings}, f, indent=2)
+
+    failing = [f for f in findings if f["severity"] == "error" or args.strict]
+    sys.exit(1 if failing else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import asyncio
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page, async_playwright
+
+# A journey drives one page from start to finish, e.g. login -> add item -> checkout.
+Journey = Callable[[Page], Awaitable[None]]
+
+@dataclass
+class JourneyResult:
+    """Outcome of one virtual user's journey."""
+    user: int
+    passed: bool
+    duration: float
+    error: str | None = None
+
+async def run_journeys(
+    journey: Journey,
+    users: int,
+    concurrency: int = None,
+    browser_name: str = "chromium",
+    headless: bool = True,
+    launch_args: dict = None,
+    context_args: dict = None,
+) -> list[JourneyResult]:
+    """
+    Run 'journey' once per virtual user, all inside a single browser process.
+
+    Every user gets its own browser context (separate cookies and storage), and up to
+    'concurrency' of them (default: all) run at the same time on one asyncio event loop.
+    A failing journey is recorded in its result instead of stopping the others.
+    """
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_name).launch(headless=headless, **(launch_args or {}))
+        semaphore = asyncio.Semaphore(concurrency or users)
+
+        async def run_one(user: int) -> JourneyResult:
+            async with semaphore:
+                context = await browser.new_context(**(context_args or {}))
+                page = await context.new_page()
+                start = time.perf_counter()
+                try:
+                    await journey(page)
+                    return JourneyResult(user, True, time.perf_counter() - start)
+                except Exception:
+                    return JourneyResult(user, False, time.perf_counter() - start, traceback.format_exc(limit=3))
+                finally:
+                    await context.close()
+
+        try:
+            return list(await asyncio.gather(*(run_one(user) for user in range(users))))
+        finally:
+            await browser.close()
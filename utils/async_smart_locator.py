@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from playwright.async_api import Locator, TimeoutError as PlaywrightTimeoutError
+
+from utils import instrumentation
+from utils.smart_locator import SmartLocator, _record, logger
+
+class AsyncSmartLocator(SmartLocator):
+    """
+    The playwright.async_api twin of SmartLocator.
+    Candidate ordering, logging and the healing cache are shared with the sync version;
+    only the waiting is async. The SQLite healing cache is read and written in a worker
+    thread, so a lookup never blocks the other journeys on the event loop.
+    """
+    async def get_locator(self, selector: str, fallbacks: list[str] = None, timeout: int = 4000) -> Locator:
+        """
+        Attempts to find an element using the primary selector.
+        If it fails, tries the fallback selectors.
+        Returns the first working locator found.
+
+        Args:
+            selector: The primary selector to try first.
+            fallbacks: A list of alternative selectors to try if primary fails.
+            timeout: Time in ms to wait. In racing mode this is the total budget
+                shared by all selectors; in sequential mode it applies to each selector.
+        """
+        if fallbacks is None:
+            fallbacks = []
+
+        url = self.page.url
+        cached = await asyncio.to_thread(self.cache.get, url, selector) if self.cache else None
+        if cached and cached not in fallbacks:
+            # The caller no longer offers this selector: the heal is out of date.
+            await asyncio.to_thread(self.cache.invalidate, url, selector)
+            cached = None
+        candidates = self._candidates(selector, fallbacks, cached)
+        attempts = [] if instrumentation.enabled else None
+        start = time.perf_counter()
+        if self.race:
+            winner = await self._race(candidates, timeout, attempts)
+        else:
+            winner = await self._sequential(candidates, timeout, attempts)
+        if cached and winner == cached and await self.page.locator(selector).count() > 0:
+            # The primary works again: use it, and _update_cache drops the heal.
+            winner = selector
+        await asyncio.to_thread(self._update_cache, url, selector, cached, winner)
+        return self._settle(selector, cached, winner, start, attempts, update_cache=False)
+
+    async def _race(self, candidates: list[str], timeout: int, attempts: list[dict] = None) -> str | None:
+        """
+        Wait for whichever candidate attaches first, then return the highest-priority match.
+        """
+        combined = self.page.locator(candidates[0])
+        for candidate in candidates[1:]:
+            combined = combined.or_(self.page.locator(candidate))
+
+        t0 = time.perf_counter()
+        try:
+            await combined.first.wait_for(state="attached", timeout=timeout)
+        except PlaywrightTimeoutError:
+            _record(attempts, "|".join(candidates), t0, False)
+            return None
+        _record(attempts, "|".join(candidates), t0, True)
+
+        for candidate in candidates:
+            t0 = time.perf_counter()
+            matched = await self.page.locator(candidate).count() > 0
+            _record(attempts, candidate, t0, matched)
+            if matched:
+                return candidate
+        return None
+
+    async def _sequential(self, candidates: list[str], timeout: int, attempts: list[dict] = None) -> str | None:
+        """
+        Try each candidate in turn, waiting up to 'timeout' on each.
+        """
+        for candidate in candidates:
+            t0 = time.perf_counter()
+            try:
+                await self.page.locator(candidate).wait_for(state="attached", timeout=timeout)
+                _record(attempts, candidate, t0, True)
+                return candidate
+            except PlaywrightTimeoutError:
+                _record(attempts, candidate, t0, False)
+                logger.info(f"Selector '{candidate}' failed/timed out. Trying the next candidate...")
+        return None
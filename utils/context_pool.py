@@ -0,0 +1,179 @@
+import json
+import logging
+from typing import Callable
+
+from playwright.sync_api import Browser, BrowserContext, Page, Error as PlaywrightError
+
+logger = logging.getLogger(__name__)
+
+# Replaces the localStorage of the current origin with the given [{name, value}] items.
+WRITE_LOCAL_STORAGE_SCRIPT = """
+(items) => {
+    localStorage.clear();
+    for (const {name, value} of items) localStorage.setItem(name, value);
+}
+"""
+
+# BrowserContext methods whose effect outlives the test's pages. A context on which a
+# test called one of them is retired instead of going back to the pool.
+STICKY_METHODS = ("add_init_script", "set_extra_http_headers", "set_offline", "set_geolocation",
+                  "expose_binding", "expose_function", "set_default_timeout", "set_default_navigation_timeout")
+# Context-level routing. Routes a test added are dropped on reset and the pool's own
+# (HAR replay, resource blocking) installed again.
+ROUTE_METHODS = ("route", "route_from_har", "route_web_socket")
+
+def _local_storage(state: dict) -> dict[str, dict[str, str]]:
+    """{origin: {name: value}} of a storage state."""
+    return {origin["origin"]: {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            for origin in state.get("origins", [])}
+
+class PooledContext:
+    """A browser context on loan from a ContextPool, with the page the test should use."""
+
+    def __init__(self, context: BrowserContext, key: tuple, storage_state: str | None,
+                 prepare: Callable[[BrowserContext], None] = None):
+        self.context = context
+        self.key = key
+        self.prepare = prepare
+        # Set when the borrower changed the context in a way reset() cannot undo, or added routes.
+        self.sticky = False
+        self.rerouted = False
+        for name in STICKY_METHODS:
+            setattr(context, name, self._flagging(getattr(context, name), "sticky"))
+        for name in ROUTE_METHODS:
+            setattr(context, name, self._flagging(getattr(context, name), "rerouted"))
+        self.storage_state = {}
+        if storage_state:
+            with open(storage_state, encoding="utf-8") as f:
+                self.storage_state = json.load(f)
+        self.page = context.new_page()
+        self.uses = 0
+        self.healthy = True
+        context.on("close", lambda _: self._mark_unhealthy())
+        self._watch(self.page)
+
+    def _flagging(self, method, flag: str):
+        """Wrap a BrowserContext method so calling it sets 'flag' on this PooledContext."""
+        def wrapper(*args, **kwargs):
+            setattr(self, flag, True)
+            return method(*args, **kwargs)
+        return wrapper
+
+    def _watch(self, page: Page):
+        page.on("crash", lambda _: self._mark_unhealthy())
+
+    def _mark_unhealthy(self):
+        self.healthy = False
+
+    def reset(self):
+        """
+        Bring the context back to its storage state: the cookies and localStorage it was
+        created with and nothing else, no permissions, only the pool's own routes, and a
+        single fresh blank page. Contexts with sticky changes are not reset but retired.
+        """
+        for page in self.context.pages:
+            # Closing the page also drops its routes, listeners, dialogs and sessionStorage.
+            page.close()
+        if self.rerouted:
+            self.context.unroute_all(behavior="ignoreErrors")
+            if self.prepare:
+                self.prepare(self.context)
+            self.rerouted = False
+        self.context.clear_cookies()
+        self.context.clear_permissions()
+        if self.storage_state.get("cookies"):
+            self.context.add_cookies(self.storage_state["cookies"])
+        self.page = self.context.new_page()
+        self._watch(self.page)
+
+        # localStorage outlives the pages. Every origin the test wrote to is listed in the
+        # context's storage state, even when no page of it is open any more.
+        current = _local_storage(self.context.storage_state())
+        wanted = _local_storage(self.storage_state)
+        changed = [origin for origin in sorted(set(current) | set(wanted))
+                   if current.get(origin, {}) != wanted.get(origin, {})]
+        for origin in changed:
+            self._write_local_storage(origin, wanted.get(origin, {}))
+        if changed:
+            self.page.goto("about:blank")
+
+    def _write_local_storage(self, origin: str, items: dict[str, str]):
+        """Set the localStorage of 'origin' from a stub document, without loading the site."""
+        url = f"{origin}/"
+        self.page.route(url, lambda route: route.fulfill(content_type="text/html", body=""))
+        try:
+            self.page.goto(url)
+            self.page.evaluate(WRITE_LOCAL_STORAGE_SCRIPT, [{"name": k, "value": v} for k, v in items.items()])
+        finally:
+            self.page.unroute(url)
+
+class ContextPool:
+    """
+    A worker-wide pool of warm browser contexts.
+
+    Creating a context and its first page is a large fixed cost per test. The pool
+    hands out an idle context instead, and resets it when the test gives it back.
+    Contexts are discarded after 'max_uses' tests, when their page crashed, when
+    the test failed, or when it added init scripts, headers, offline mode and the
+    like (see STICKY_METHODS), so a broken state never leaks into the next test.
+
+    Contexts are grouped by key, e.g. storage state and resource policy, so a test
+    only ever receives a context that was created with the options it asked for.
+    """
+
+    def __init__(self, browser: Browser, context_args: dict, max_uses: int = 20):
+        self.browser = browser
+        self.context_args = context_args
+        self.max_uses = max_uses
+        self.idle = {}
+        self.created = 0
+
+    def acquire(self, storage_state: str | None = None, prepare: Callable[[BrowserContext], None] = None, key: tuple = ()) -> PooledContext:
+        """
+        Return a clean context for 'key'. 'prepare' runs once on newly created
+        contexts, e.g. to install routes; 'key' must tell apart contexts prepared differently.
+        """
+        key = (storage_state, *key)
+        idle = self.idle.setdefault(key, [])
+        while idle:
+            pooled = idle.pop()
+            if pooled.healthy:
+                pooled.uses += 1
+                return pooled
+            self._discard(pooled)
+
+        context = self.browser.new_context(**self.context_args, storage_state=storage_state)
+        if prepare:
+            prepare(context)
+        self.created += 1
+        pooled = PooledContext(context, key, storage_state, prepare)
+        pooled.uses = 1
+        return pooled
+
+    def release(self, pooled: PooledContext, failed: bool = False):
+        """Give a context back. It is reset for the next test, or closed if it is worn out."""
+        if failed or not pooled.healthy or pooled.sticky or pooled.uses >= self.max_uses:
+            self._discard(pooled)
+            return
+        try:
+            pooled.reset()
+        except PlaywrightError as e:
+            logger.warning(f"Discarding pooled context that failed to reset: {e}")
+            self._discard(pooled)
+            return
+        self.idle[pooled.key].append(pooled)
+
+    def close(self):
+        """Close every idle context."""
+        for contexts in self.idle.values():
+            for pooled in contexts:
+                self._discard(pooled)
+        self.idle.clear()
+
+    def _discard(self, pooled: PooledContext):
+        pooled.healthy = False
+        try:
+            pooled.context.close()
+        except PlaywrightError:
+            # Already closed or the browser went away.
+            pass
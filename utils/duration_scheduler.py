@@ -0,0 +1,138 @@
+import json
+import os
+import re
+from statistics import median
+
+# Per-test durations of previous runs, written by the xdist controller (or a plain run).
+DURATIONS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".test_durations.json"))
+# Assumed duration of a test that has never run, when nothing else is known.
+DEFAULT_DURATION = 1.0
+# Weight of the latest run when updating a stored duration (the rest is history).
+SMOOTHING = 0.5
+
+def load_durations(path: str = DURATIONS_PATH) -> dict:
+    """Return {nodeid: {"duration": seconds, "group": key}} from the durations file."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_durations(measured: dict, path: str = DURATIONS_PATH):
+    """
+    Merge this run's {nodeid: (seconds, group)} into the durations file. Durations are
+    smoothed so one slow run does not reshuffle the next schedule completely.
+    """
+    durations = load_durations(path)
+    for nodeid, (seconds, group) in measured.items():
+        previous = durations.get(nodeid, {}).get("duration")
+        if previous is not None:
+            seconds = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        durations[nodeid] = {"duration": round(seconds, 3), "group": group}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=1, sort_keys=True)
+
+def _default_group(nodeid: str) -> str:
+    """Group of a test without history: its parametrization id, e.g. the browser name."""
+    match = re.search(r"\[([^\]]*)\]$", nodeid)
+    return match.group(1) if match else ""
+
+def plan(collection: list[str], durations: dict, workers: int, deferred: set[str] = frozenset()) -> list[list[int]]:
+    """
+    Split 'collection' (node ids) into one list of indices per worker, minimizing the
+    longest worker's total duration.
+
+    Tests of the same group (same browser and role) form one unit, so their expensive
+    session fixtures are set up on one worker only. A group longer than a fair share of
+    the run is split up, otherwise it would decide the makespan on its own. Units are
+    then assigned longest first, each to the worker with the least work so far
+    (longest-processing-time-first). Within a worker, the longest units run first.
+    'deferred' tests (quarantined ones) are assigned after all others and go to the end
+    of their worker's list. That only orders each worker's own queue: a worker given
+    nothing but deferred tests starts them at once, while the others are still busy.
+    """
+    known = [d["duration"] for d in durations.values() if "duration" in d]
+    fallback = median(known) if known else DEFAULT_DURATION
+
+    groups = {}
+    for index, nodeid in enumerate(collection):
+        entry = durations.get(nodeid, {})
+        group = (nodeid in deferred, entry.get("group") or _default_group(nodeid))
+        groups.setdefault(group, []).append((entry.get("duration", fallback), index))
+
+    total = sum(duration for tests in groups.values() for duration, _ in tests)
+    share = total / workers
+    units = []
+    for (later, _), tests in groups.items():
+        tests.sort(reverse=True)
+        unit, unit_duration = [], 0.0
+        for duration, index in tests:
+            if unit and unit_duration + duration > share:
+                units.append((later, unit_duration, unit))
+                unit, unit_duration = [], 0.0
+            unit.append(index)
+            unit_duration += duration
+        units.append((later, unit_duration, unit))
+
+    loads = [0.0] * workers
+    assigned = [[] for _ in range(workers)]
+    for _, unit_duration, unit in sorted(units, key=lambda u: (not u[0], u[1]), reverse=True):
+        worker = loads.index(min(loads))
+        loads[worker] += unit_duration
+        assigned[worker].extend(unit)
+    return assigned
+
+class DurationRecorder:
+    """
+    pytest plugin that measures every test (setup + call + teardown) and updates the
+    durations file at the end of the session. Registered on the xdist controller, or
+    in the only process of a run without xdist.
+    """
+
+    def __init__(self, path: str = DURATIONS_PATH):
+        self.path = path
+        self.measured = {}
+
+    def pytest_runtest_logreport(self, report):
+        seconds, group = self.measured.get(report.nodeid, (0.0, ""))
+        group = dict(report.user_properties).get("schedule_group", group)
+        self.measured[report.nodeid] = (seconds + report.duration, group)
+
+    def pytest_sessionfinish(self, session):
+        if self.measured:
+            save_durations(self.measured, self.path)
+
+def make_scheduler(config, log, deferred: set[str] = frozenset()):
+    """Build the xdist scheduler; imported lazily so the suite runs without pytest-xdist."""
+    from xdist.scheduler import LoadScheduling
+
+    class DurationScheduling(LoadScheduling):
+        """
+        Sends every worker its whole share of tests up front, as planned by plan(),
+        instead of handing out small chunks in collection order, and then tells every
+        worker to shut down once its share is done. Only this initial split is new:
+        a crashed worker is handled by LoadScheduling, which puts its remaining tests
+        back in the shared queue, where only a replacement worker (xdist restarts
+        crashed ones) picks them up; the surviving workers are not rebalanced.
+        """
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = next(iter(self.node2collection.values()))
+            self.pending[:] = []
+            nodes = self.nodes
+            for node, indices in zip(nodes, plan(self.collection, load_durations(), len(nodes), deferred)):
+                if indices:
+                    self.node2pending[node].extend(indices)
+                    node.send_runtest_some(indices)
+            for node in nodes:
+                node.shutdown()
+
+    return DurationScheduling(config, log)
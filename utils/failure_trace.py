@@ -0,0 +1,62 @@
+import os
+import re
+from weakref import WeakSet
+
+import allure
+from playwright.sync_api import BrowserContext, Error as PlaywrightError
+
+# Contexts on which tracing is running. Pooled contexts keep it across tests.
+_tracing = WeakSet()
+
+def trace_dir(output_dir: str, nodeid: str) -> str:
+    """Folder for the traces of one test, e.g. test-results/tests-test_cart.py-TestCart-test_cart_visual-chromium."""
+    return os.path.join(output_dir, re.sub(r"[^\w.-]+", "-", nodeid).strip("-")[:200])
+
+class FailureTracer:
+    """
+    Records a Playwright trace of one test and keeps it only if the test fails.
+
+    Tracing is started once per context (with screenshots and DOM snapshots) and every
+    test records into its own chunk, covering the whole test rather than its last few
+    actions. While the test runs, Playwright streams the events and screenshots to its
+    temporary artifacts folder, so passing tests still pay for that. What they save is
+    the rest: their chunk is stopped without a path, so it is never zipped, copied into
+    test-results or attached. When the test fails, the chunk is written as a zip and
+    attached to the Allure report. Chunks must be finished before their context closes:
+    a context closed first (e.g. by the test) loses its chunk.
+    """
+
+    def __init__(self, title: str, screenshots: bool = True, snapshots: bool = True, sources: bool = False):
+        self.title = title
+        self.options = {"screenshots": screenshots, "snapshots": snapshots, "sources": sources}
+        self.contexts = []
+
+    def watch(self, context: BrowserContext):
+        """Start recording the current test on 'context'."""
+        if context not in _tracing:
+            context.tracing.start(**self.options)
+            _tracing.add(context)
+        context.tracing.start_chunk(title=self.title)
+        self.contexts.append(context)
+
+    def finish(self, failed: bool, directory: str) -> list[str]:
+        """End the test's chunks; write them to 'directory' only if 'failed'. Returns the written paths."""
+        paths = []
+        if failed and self.contexts:
+            os.makedirs(directory, exist_ok=True)
+        for index, context in enumerate(self.contexts):
+            path = None
+            if failed:
+                name = "trace.zip" if len(self.contexts) == 1 else f"trace-{index + 1}.zip"
+                path = os.path.join(directory, name)
+            try:
+                context.tracing.stop_chunk(path=path)
+            except PlaywrightError:
+                # Closed by the test.
+                _tracing.discard(context)
+                continue
+            if path:
+                allure.attach.file(path, name=f"Playwright trace ({name})", extension="zip")
+                paths.append(path)
+        self.contexts = []
+        return paths
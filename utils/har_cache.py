@@ -0,0 +1,47 @@
+import json
+import os
+
+# Recorded traffic lives next to the tests, one HAR file per test module.
+HAR_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests", "hars"))
+
+def har_path(module_name: str, har_dir: str = HAR_DIR) -> str:
+    """Return the HAR file used for a test module, e.g. 'test_cart' -> tests/hars/test_cart.har."""
+    return os.path.join(har_dir, f"{module_name}.har")
+
+def _entry_key(entry: dict) -> tuple:
+    """Requests that replay identically share a key: method, URL and request body."""
+    request = entry["request"]
+    return request["method"], request["url"], (request.get("postData") or {}).get("text")
+
+class HarRecorder:
+    """
+    Collects the network traffic of passing tests and writes one HAR file per test module.
+
+    Each test records into its own temporary HAR (Playwright writes it when the context
+    closes); passing tests are merged here and the module files are written at the end
+    of the session. Repeated requests are stored once, keeping the latest response.
+    """
+
+    def __init__(self, har_dir: str = HAR_DIR):
+        self.har_dir = har_dir
+        self.logs = {}
+        self.entries = {}
+
+    def add(self, module_name: str, recorded_har: str):
+        """Merge a test's recorded HAR into its module."""
+        if not os.path.exists(recorded_har):
+            return
+        with open(recorded_har, encoding="utf-8") as f:
+            log = json.load(f)["log"]
+        self.logs.setdefault(module_name, log)
+        entries = self.entries.setdefault(module_name, {})
+        for entry in log.get("entries", []):
+            entries[_entry_key(entry)] = entry
+
+    def save(self):
+        """Write the merged HAR file of every module that recorded traffic."""
+        os.makedirs(self.har_dir, exist_ok=True)
+        for module_name, log in self.logs.items():
+            merged = {**log, "pages": [], "entries": list(self.entries[module_name].values())}
+            with open(har_path(module_name, self.har_dir), "w", encoding="utf-8") as f:
+                json.dump({"log": merged}, f)
@@ -0,0 +1,110 @@
+import logging
+import os
+import sqlite3
+import time
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Default location of the cache file: the project root, next to pytest.ini.
+DEFAULT_CACHE_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".smart_locator_cache.sqlite"))
+
+class HealingCache:
+    """
+    Remembers which fallback healed a broken primary selector, so the next lookup
+    can try it first instead of rediscovering it.
+
+    Entries are keyed by (page URL pattern, primary selector) and stored in a small
+    SQLite file. SQLite handles locking between processes, so pytest-xdist workers
+    can share one file. Entries expire after 'ttl' seconds and the least recently
+    used ones are evicted once there are more than 'max_entries'. Lookups only read:
+    an entry's last use is written at most once per 'touch_interval' seconds, so
+    workers hitting the cache do not queue up for SQLite's write lock.
+    """
+    _default = None
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: int = 7 * 24 * 3600, max_entries: int = 1000,
+                 touch_interval: int = 3600):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        # isolation_level=None: autocommit, every statement is its own short transaction.
+        self.conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS healed ("
+            " url_pattern TEXT NOT NULL,"
+            " selector TEXT NOT NULL,"
+            " healed_selector TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (url_pattern, selector))"
+        )
+
+    @classmethod
+    def default(cls):
+        """
+        Return the process-wide cache, or None if caching is disabled.
+        Set SMART_LOCATOR_CACHE to a file path to relocate it, or to 'off' to disable it.
+        """
+        if cls._default is None:
+            path = os.environ.get("SMART_LOCATOR_CACHE", DEFAULT_CACHE_PATH)
+            if path.lower() == "off":
+                return None
+            cls._default = cls(path)
+        return cls._default
+
+    @staticmethod
+    def url_pattern(url: str) -> str:
+        """Reduce a URL to the part that identifies the page: scheme, host and path."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+    def get(self, url: str, selector: str) -> str | None:
+        """Return the healed selector recorded for this page and primary selector, if still fresh."""
+        key = (self.url_pattern(url), selector)
+        row = self.conn.execute(
+            "SELECT healed_selector, created, last_used FROM healed WHERE url_pattern = ? AND selector = ?", key
+        ).fetchone()
+        if row is None:
+            return None
+        healed, created, last_used = row
+        now = time.time()
+        if now - created > self.ttl:
+            self.invalidate(url, selector)
+            return None
+        if now - last_used > self.touch_interval:
+            # Coarse is enough for the eviction order.
+            self.conn.execute(
+                "UPDATE healed SET last_used = ? WHERE url_pattern = ? AND selector = ?", (now, *key)
+            )
+        return healed
+
+    def put(self, url: str, selector: str, healed_selector: str):
+        """Record that 'healed_selector' worked where 'selector' did not."""
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO healed VALUES (?, ?, ?, ?, ?)",
+            (self.url_pattern(url), selector, healed_selector, now, now),
+        )
+        self._evict(now)
+
+    def invalidate(self, url: str, selector: str):
+        """Forget the entry for this page and primary selector, e.g. when it stopped matching."""
+        self.conn.execute(
+            "DELETE FROM healed WHERE url_pattern = ? AND selector = ?", (self.url_pattern(url), selector)
+        )
+
+    def clear(self):
+        """Remove every entry."""
+        self.conn.execute("DELETE FROM healed")
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones above 'max_entries'."""
+        self.conn.execute("DELETE FROM healed WHERE created < ?", (now - self.ttl,))
+        self.conn.execute(
+            "DELETE FROM healed WHERE rowid IN ("
+            " SELECT rowid FROM healed ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
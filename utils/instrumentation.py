@@ -0,0 +1,191 @@
+import argparse
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Opt-in timing of page-object methods and SmartLocator lookups.
+#
+# Nothing is wrapped until enable() is called, so a disabled run pays nothing
+# for page objects and a single boolean check per SmartLocator lookup.
+
+enabled = False
+_sinks = []
+_originals = {}
+# Name of the span we are currently inside (page-object methods call each other).
+_parent = contextvars.ContextVar("parent_span", default=None)
+# Node id of the running test, set by conftest.py.
+current_test = contextvars.ContextVar("current_test", default=None)
+
+@dataclass
+class Span:
+    """One timed operation."""
+    name: str
+    kind: str
+    start: float
+    duration_ms: float
+    status: str = "ok"
+    parent: str | None = None
+    test: str | None = None
+    # Where the timed code is defined, as 'module:qualname' (the span name uses the runtime class).
+    code: str | None = None
+    attributes: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "parent": self.parent,
+            "test": self.test,
+            "code": self.code,
+            **({"attributes": self.attributes} if self.attributes else {}),
+        }
+
+class MemorySink:
+    """Keeps spans in a list, e.g. for assertions in tests or in-process analysis."""
+
+    def __init__(self):
+        self.spans = []
+
+    def emit(self, span: Span):
+        self.spans.append(span)
+
+class JsonlSink:
+    """Appends one JSON object per span to a file; safe to share between processes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def emit(self, span: Span):
+        line = json.dumps(span.to_dict()) + "\n"
+        with self.lock:
+            # One write per line keeps lines from different workers from interleaving.
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class AllureSink:
+    """Collects the spans of a test and attaches them to its Allure report as JSON."""
+
+    def __init__(self):
+        self.spans = []
+
+    def emit(self, span: Span):
+        self.spans.append(span)
+
+    def flush(self):
+        """Attach the collected spans to the current test and start over."""
+        if not self.spans:
+            return
+        import allure
+        allure.attach(
+            json.dumps([s.to_dict() for s in self.spans], indent=2),
+            name="Page-object timings",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        self.spans = []
+
+def emit(span: Span):
+    """Send a span to every sink."""
+    span.parent = span.parent or _parent.get()
+    span.test = span.test or current_test.get()
+    for sink in _sinks:
+        sink.emit(span)
+
+def enable(*sinks):
+    """Start emitting spans to 'sinks'. Use instrument_subclasses() to choose what gets timed."""
+    global enabled
+    _sinks.extend(sinks)
+    enabled = True
+
+def disable():
+    """Stop emitting spans and restore every wrapped method."""
+    global enabled
+    enabled = False
+    _sinks.clear()
+    for (cls, name), func in _originals.items():
+        setattr(cls, name, func)
+    _originals.clear()
+
+def _wrap(func, kind: str):
+    """Return a sync or async wrapper that emits a span per call."""
+    code = f"{func.__module__}:{func.__qualname__}"
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            name = f"{type(self).__name__}.{func.__name__}"
+            token = _parent.set(name)
+            start, t0, status = time.time(), time.perf_counter(), "ok"
+            try:
+                return await func(self, *args, **kwargs)
+            except BaseException:
+                status = "error"
+                raise
+            finally:
+                _parent.reset(token)
+                emit(Span(name, kind, start, (time.perf_counter() - t0) * 1000, status, parent=_parent.get(), code=code))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        name = f"{type(self).__name__}.{func.__name__}"
+        token = _parent.set(name)
+        start, t0, status = time.time(), time.perf_counter(), "ok"
+        try:
+            return func(self, *args, **kwargs)
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            _parent.reset(token)
+            emit(Span(name, kind, start, (time.perf_counter() - t0) * 1000, status, parent=_parent.get(), code=code))
+    return wrapper
+
+def instrument_class(cls, kind: str = "page_object"):
+    """Wrap the public methods defined directly on 'cls'."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member) or (cls, name) in _originals:
+            continue
+        _originals[(cls, name)] = member
+        setattr(cls, name, _wrap(member, kind))
+
+def instrument_subclasses(base, kind: str = "page_object"):
+    """Wrap the public methods of 'base' and of every class derived from it."""
+    pending = [base]
+    while pending:
+        cls = pending.pop()
+        instrument_class(cls, kind)
+        pending.extend(cls.__subclasses__())
+
+def summarize(path: str, top: int = 20) -> str:
+    """Table of the slowest span names in a JSONL file, ordered by p95."""
+    from utils.load_runner import percentile
+
+    durations = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            span = json.loads(line)
+            durations[span["name"]].append(span["duration_ms"])
+    rows = sorted(durations.items(), key=lambda item: percentile(item[1], 95), reverse=True)[:top]
+    lines = [f"{'span':<40}{'count':>8}{'p50':>9}{'p95':>9}{'max':>9}"]
+    for name, values in rows:
+        lines.append(f"{name:<40}{len(values):>8}{percentile(values, 50):>9.0f}{percentile(values, 95):>9.0f}{max(values):>9.0f}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the slowest page-object actions recorded with --instrument.")
+    parser.add_argument("path", help="JSONL file written by the JSONL sink.")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+    print(summarize(args.path, args.top))
@@ -0,0 +1,81 @@
+import json
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Page
+
+# A journey prefix drives a fresh page (already carrying the user's session) to the
+# point where several tests diverge, e.g. "backpack in the cart, checkout form open".
+JourneyPrefix = Callable[[Page], None]
+
+@dataclass
+class JourneySnapshot:
+    """Everything needed to resume a journey in a new context."""
+    # Cookies and localStorage, as returned by BrowserContext.storage_state().
+    storage_state: dict
+    url: str
+    # sessionStorage of the page's origin; not part of Playwright's storage state.
+    session_storage: dict
+
+def take_snapshot(page: Page) -> JourneySnapshot:
+    """Capture the state of 'page' and its context."""
+    return JourneySnapshot(
+        storage_state=page.context.storage_state(),
+        url=page.url,
+        session_storage=json.loads(page.evaluate("() => JSON.stringify(sessionStorage)")),
+    )
+
+def restore_snapshot(context: BrowserContext, snapshot: JourneySnapshot) -> Page:
+    """
+    Open the snapshot's URL in 'context', which must have been created with
+    storage_state=snapshot.storage_state. Returns the page, ready for the variant.
+    """
+    if snapshot.session_storage:
+        # Refill sessionStorage before the application's own scripts run, once per tab.
+        url = urlsplit(snapshot.url)
+        context.add_init_script(
+            "(([origin, items]) => {"
+            "  if (location.origin !== origin || sessionStorage.length) return;"
+            "  for (const [key, value] of Object.entries(items)) sessionStorage.setItem(key, value);"
+            f"}})({json.dumps([f'{url.scheme}://{url.netloc}', snapshot.session_storage])});"
+        )
+    page = context.new_page()
+    page.goto(snapshot.url)
+    return page
+
+class JourneySnapshots:
+    """
+    Runs each journey prefix once per user and remembers where it ended.
+
+    Data-driven variants (e.g. one negative test per empty checkout field) then start
+    from the snapshot instead of repeating the prefix: the cost of N variants becomes
+    one prefix plus N short restores. A prefix that fails is not retried; every
+    variant that needs it fails with the original error.
+    """
+
+    def __init__(self):
+        self.snapshots = {}
+
+    def get(self, prefix: JourneyPrefix, storage_state: str | None,
+            new_context: Callable[..., BrowserContext]) -> JourneySnapshot:
+        """
+        Return the snapshot of 'prefix' for a user's storage state. On first use the prefix
+        runs in a context from 'new_context', the factory of the test that needs it.
+        """
+        key = (f"{prefix.__module__}.{prefix.__qualname__}", storage_state)
+        if key not in self.snapshots:
+            context = new_context(storage_state=storage_state)
+            try:
+                page = context.new_page()
+                prefix(page)
+                self.snapshots[key] = take_snapshot(page)
+            except Exception as e:
+                # The context stays open until the test ends, so its trace is kept with the failure.
+                self.snapshots[key] = e
+            else:
+                context.close()
+        snapshot = self.snapshots[key]
+        if isinstance(snapshot, Exception):
+            raise RuntimeError(f"Journey prefix '{key[0]}' failed") from snapshot
+        return snapshot
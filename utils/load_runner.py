@@ -0,0 +1,193 @@
+import asyncio
+import csv
+import json
+import random
+import time
+import traceback
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable
+
+from playwright.async_api import Page, async_playwright
+
+@dataclass
+class LoadProfile:
+    """How much load to generate and for how long."""
+    # Virtual users running the journey in a loop.
+    users: int = 10
+    # Journeys running at once. Every journey gets a fresh browser context of its own,
+    # so no two journeys share cookies or the localStorage cart; users beyond this
+    # number wait for a running journey to finish.
+    contexts: int = 10
+    # Seconds over which users are started, evenly spaced.
+    ramp_up: float = 0.0
+    # Pause after every step, drawn uniformly from (min, max) seconds.
+    think_time: tuple[float, float] = (0.0, 0.0)
+    # Stop after this many seconds and/or iterations per user (whichever comes first).
+    duration: float | None = None
+    iterations: int | None = 1
+
+class StepRecorder:
+    """
+    Times the steps of a journey. Journeys wrap every page-object call:
+
+        async with steps.step("LoginPage.login"):
+            await login_page.login(...)
+
+    Think time is applied after the step and is not part of its latency.
+    """
+
+    def __init__(self, think_time: tuple[float, float] = (0.0, 0.0)):
+        self.think_time = think_time
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] += 1
+            raise
+        self.samples[name].append(time.perf_counter() - start)
+        low, high = self.think_time
+        if high > 0:
+            await asyncio.sleep(random.uniform(low, high))
+
+# A load journey drives one page through one iteration and reports its steps.
+LoadJourney = Callable[[Page, StepRecorder], Awaitable[None]]
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linearly interpolated percentile of 'values' (pct between 0 and 100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+@dataclass
+class StepStats:
+    """Latency summary of one step, in milliseconds."""
+    step: str
+    count: int
+    errors: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+@dataclass
+class LoadReport:
+    """Result of a load run."""
+    iterations: int
+    failures: int
+    elapsed_s: float
+    throughput_per_s: float
+    steps: list[StepStats]
+    errors: list[str]
+
+    def to_json(self, path: str):
+        """Write the whole report as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+
+    def to_csv(self, path: str):
+        """Write one row of latency statistics per step."""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(StepStats.__dataclass_fields__))
+            writer.writeheader()
+            for stats in self.steps:
+                writer.writerow(asdict(stats))
+
+    def summary(self) -> str:
+        """Human-readable table of the run."""
+        lines = [
+            f"{self.iterations} iterations, {self.failures} failed, {self.elapsed_s:.1f}s, "
+            f"{self.throughput_per_s:.2f} iterations/s",
+            f"{'step':<32}{'count':>7}{'errors':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+        for s in self.steps:
+            lines.append(f"{s.step:<32}{s.count:>7}{s.errors:>8}{s.p50_ms:>9.0f}{s.p95_ms:>9.0f}{s.p99_ms:>9.0f}{s.max_ms:>9.0f}")
+        return "\n".join(lines)
+
+def build_report(steps: StepRecorder, iterations: int, failures: int, elapsed: float, errors: list[str]) -> LoadReport:
+    """Turn the raw step samples into percentiles."""
+    stats = []
+    for name in sorted(set(steps.samples) | set(steps.errors)):
+        samples = steps.samples.get(name, [])
+        ms = [s * 1000 for s in samples]
+        stats.append(StepStats(
+            step=name,
+            count=len(samples),
+            errors=steps.errors.get(name, 0),
+            mean_ms=sum(ms) / len(ms) if ms else 0.0,
+            p50_ms=percentile(ms, 50),
+            p95_ms=percentile(ms, 95),
+            p99_ms=percentile(ms, 99),
+            max_ms=max(ms) if ms else 0.0,
+        ))
+    return LoadReport(
+        iterations=iterations,
+        failures=failures,
+        elapsed_s=elapsed,
+        throughput_per_s=iterations / elapsed if elapsed else 0.0,
+        steps=stats,
+        errors=errors,
+    )
+
+async def run_load(
+    journey: LoadJourney,
+    profile: LoadProfile,
+    browser_name: str = "chromium",
+    headless: bool = True,
+    launch_args: dict = None,
+    context_args: dict = None,
+) -> LoadReport:
+    """
+    Generate load by running 'journey' in a loop for every virtual user of 'profile',
+    all inside one browser process, and return per-step latency statistics.
+    Each iteration runs in a new context that is closed afterwards; at most
+    'profile.contexts' of them are open at a time.
+    """
+    steps = StepRecorder(profile.think_time)
+    iterations = 0
+    failures = 0
+    errors = []
+
+    async with async_playwright() as p:
+        browser = await getattr(p, browser_name).launch(headless=headless, **(launch_args or {}))
+        slots = asyncio.Semaphore(max(1, profile.contexts))
+        start = time.perf_counter()
+        deadline = start + profile.duration if profile.duration else None
+
+        async def virtual_user(user: int):
+            nonlocal iterations, failures
+            if profile.ramp_up and profile.users > 1:
+                await asyncio.sleep(profile.ramp_up * user / profile.users)
+            done = 0
+            while (profile.iterations is None or done < profile.iterations) and \
+                    (deadline is None or time.perf_counter() < deadline):
+                async with slots:
+                    context = await browser.new_context(**(context_args or {}))
+                    try:
+                        await journey(await context.new_page(), steps)
+                    except Exception:
+                        failures += 1
+                        errors.append(f"user {user}: {traceback.format_exc(limit=2)}")
+                    finally:
+                        await context.close()
+                iterations += 1
+                done += 1
+
+        try:
+            await asyncio.gather(*(virtual_user(user) for user in range(profile.users)))
+            elapsed = time.perf_counter() - start
+        finally:
+            await browser.close()
+
+    return build_report(steps, iterations, failures, elapsed, errors)
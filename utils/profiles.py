@@ -0,0 +1,32 @@
+from dataclasses import dataclass, field
+
+@dataclass(frozen=True)
+class ExecutionProfile:
+    """Browser launch and context settings for one way of running the suite."""
+    headless: bool
+    # None means no fixed viewport: the page follows the (maximized) window size.
+    viewport: dict | None
+    reduced_motion: str | None = None
+    slow_mo: int = 0
+    # Extra command line switches; only passed to Chromium.
+    chromium_args: list[str] = field(default_factory=list)
+
+PROFILES = {
+    # Default: headless, fixed viewport, no animations, no GPU or extensions.
+    # Cheapest to run and packs the most workers per agent.
+    "ci-fast": ExecutionProfile(
+        headless=True,
+        viewport={"width": 1280, "height": 720},
+        reduced_motion="reduce",
+        chromium_args=["--disable-gpu", "--disable-extensions", "--disable-dev-shm-usage"],
+    ),
+    # For watching a run locally: real maximized window, slowed down.
+    "debug": ExecutionProfile(
+        headless=False,
+        viewport=None,
+        slow_mo=250,
+        chromium_args=["--start-maximized"],
+    ),
+}
+
+DEFAULT_PROFILE = "ci-fast"
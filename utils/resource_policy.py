@@ -0,0 +1,39 @@
+import re
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext
+
+# File extensions per Playwright resource type. Matching on the URL (instead of
+# route.request.resource_type) lets Playwright filter inside the browser, so
+# requests that are not blocked never make a round trip to Python.
+EXTENSIONS = {
+    "image": ["png", "jpg", "jpeg", "gif", "svg", "webp", "avif", "ico", "bmp"],
+    "font": ["woff", "woff2", "ttf", "otf", "eot"],
+    "media": ["mp3", "mp4", "webm", "ogg", "wav", "m4a"],
+}
+
+class ResourcePolicy:
+    """
+    Decides which requests a browser context is allowed to make.
+
+    The default ("fast") policy aborts images, fonts, media and every request that
+    leaves the application's own domain (analytics, tracking, CDNs of other sites).
+    Functional tests do not need any of these, and skipping them makes every
+    navigation cheaper.
+    """
+
+    def __init__(self, block_types=("image", "font", "media"), block_third_party: bool = True):
+        self.block_types = tuple(block_types)
+        self.block_third_party = block_third_party
+
+    def apply(self, context: BrowserContext, base_url: str):
+        """Install the blocking routes on a context. Call after any other context routes."""
+        extensions = [ext for kind in self.block_types for ext in EXTENSIONS[kind]]
+        if extensions:
+            pattern = re.compile(r"\.(" + "|".join(extensions) + r")(\?.*)?$", re.IGNORECASE)
+            context.route(pattern, lambda route: route.abort())
+        if self.block_third_party:
+            # Anything not on the application's host (or one of its subdomains).
+            host = re.escape(urlsplit(base_url).hostname)
+            pattern = re.compile(r"^https?://(?!([^/?#]*\.)?" + host + r"(:\d+)?([/?#]|$))")
+            context.route(pattern, lambda route: route.abort())
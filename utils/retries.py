@@ -0,0 +1,115 @@
+import json
+import os
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+# Outcomes of the last runs of every test, written by the xdist controller (or a plain run).
+HISTORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".test_history.json"))
+# Runs kept per test.
+HISTORY_LENGTH = 20
+
+# Outcomes of one run of a test:
+#   passed  passed on the first attempt
+#   flaky   failed, then passed on a retry
+#   failed  failed on every attempt
+
+def load_history(path: str = HISTORY_PATH) -> dict[str, list[str]]:
+    """Return {nodeid: [outcome of each run, oldest first]}."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_history(outcomes: dict[str, str], path: str = HISTORY_PATH, length: int = HISTORY_LENGTH):
+    """Append this run's {nodeid: outcome} to the history file, keeping the last 'length' runs per test."""
+    history = load_history(path)
+    for nodeid, outcome in outcomes.items():
+        history[nodeid] = (history.get(nodeid, []) + [outcome])[-length:]
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1, sort_keys=True)
+
+def flakiness(runs: list[str]) -> float:
+    """
+    Share of runs that only passed on a retry. A test that starts or stops failing
+    (a regression or its fix) is not flaky and scores 0: quarantining it would hide it.
+    """
+    if not runs:
+        return 0.0
+    return runs.count("flaky") / len(runs)
+
+def quarantined(history: dict[str, list[str]], threshold: float, min_runs: int = 5) -> set[str]:
+    """Node ids of the tests with at least 'min_runs' runs and a flakiness of 'threshold' or more."""
+    return {nodeid for nodeid, runs in history.items()
+            if len(runs) >= min_runs and flakiness(runs) >= threshold}
+
+class RetryPlugin:
+    """
+    pytest plugin that re-runs a failed test up to 'retries' times, right away and in
+    the same process.
+
+    Between attempts pytest tears down only what the next test does not share, never the
+    session: every attempt gets a fresh context and page while the browser, the saved
+    logins and the other session fixtures stay warm. Failed attempts are reported with the outcome
+    "rerun"; each attempt is a separate Allure result, which Allure shows as retries.
+    Registered in every process that runs tests (and on the xdist controller for the
+    status line).
+    """
+
+    def __init__(self, retries: int):
+        self.retries = retries
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        ihook = item.ihook
+        for attempt in range(1, self.retries + 2):
+            item.attempt = attempt
+            last = attempt > self.retries
+            ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            # Teardown stops at what 'nextitem' shares with this test, so session fixtures
+            # survive. For the last test of the session, the teardown of an attempt that may
+            # be retried stops at its parent instead; pytest finishes it at the end of the session.
+            reports = runtestprotocol(item, log=False, nextitem=nextitem if last or nextitem else item.parent)
+            retry = not last and any(r.failed for r in reports if r.when in ("setup", "call"))
+            for report in reports:
+                if retry and report.failed and report.when != "teardown":
+                    report.outcome = "rerun"
+                report.user_properties.append(("attempt", attempt))
+                ihook.pytest_runtest_logreport(report=report)
+            ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+            if not retry:
+                break
+        return True
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+class OutcomeRecorder:
+    """
+    pytest plugin that works out the outcome of every test (passed, flaky or failed)
+    from its reports and appends it to the history file at the end of the session.
+    Registered on the xdist controller, or in the only process of a run without xdist.
+    """
+
+    def __init__(self, path: str = HISTORY_PATH):
+        self.path = path
+        self.outcomes = {}
+        self.rerun = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            self.rerun.add(report.nodeid)
+        elif report.when == "call" or (report.when == "setup" and not report.passed):
+            if report.skipped:
+                return
+            if report.passed:
+                self.outcomes[report.nodeid] = "flaky" if report.nodeid in self.rerun else "passed"
+            else:
+                self.outcomes[report.nodeid] = "failed"
+
+    def pytest_sessionfinish(self, session):
+        if self.outcomes:
+            save_history(self.outcomes, self.path)
@@ -1,5 +1,9 @@
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
 import logging
+import time
+
+from utils import instrumentation
+from utils.healing_cache import HealingCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -10,48 +14,164 @@ class SmartLocator:
     A utility to provide self-healing capabilities for Playwright locators.
     It attempts to find an element using a primary selector, and if that fails,
     it tries a list of fallback selectors.
+
+    By default the primary and all fallbacks are raced against the DOM at once,
+    so a broken primary costs one shared time budget instead of one timeout per selector.
+    Pass race=False to get the original one-selector-at-a-time behaviour.
+
+    Successful heals are recorded in a HealingCache (the shared default one unless
+    another is given), and the recorded selector is preferred on the next lookup
+    (tried first in sequential mode, right after the primary when racing). A heal is
+    forgotten when the primary matches again, when it stops matching, when the caller
+    no longer lists it among the fallbacks, and after the cache's TTL.
     """
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, race: bool = True, cache: HealingCache = None):
         self.page = page
+        self.race = race
+        self.cache = cache if cache is not None else HealingCache.default()
 
     def get_locator(self, selector: str, fallbacks: list[str] = None, timeout: int = 4000) -> Locator:
         """
         Attempts to find an element using the primary selector.
         If it fails, tries the fallback selectors.
         Returns the first working locator found.
-        
+
         Args:
             selector: The primary selector to try first.
             fallbacks: A list of alternative selectors to try if primary fails.
-            timeout: Time in ms to wait for each selector to be attached.
+            timeout: Time in ms to wait. In racing mode this is the total budget
+                shared by all selectors; in sequential mode it applies to each selector.
         """
         if fallbacks is None:
             fallbacks = []
 
-        # List of selectors to try: Primary first, then fallbacks
-        # We process them sequentially.
-        
-        # 1. Try Primary
+        cached = self.cache.get(self.page.url, selector) if self.cache else None
+        if cached and cached not in fallbacks:
+            # The caller no longer offers this selector: the heal is out of date.
+            self.cache.invalidate(self.page.url, selector)
+            cached = None
+        candidates = self._candidates(selector, fallbacks, cached)
+        # Attempt timings are only collected while instrumentation is enabled.
+        attempts = [] if instrumentation.enabled else None
+        start = time.perf_counter()
+        if self.race:
+            winner = self._race(candidates, timeout, attempts)
+        else:
+            winner = self._sequential(candidates, timeout, attempts)
+        if cached and winner == cached and self.page.locator(selector).count() > 0:
+            # The primary works again: use it, and _update_cache drops the heal.
+            winner = selector
+        return self._settle(selector, cached, winner, start, attempts)
+
+    def _candidates(self, selector: str, fallbacks: list[str], cached: str | None) -> list[str]:
+        """
+        Return the selectors to try, in priority order, given the cached heal (if any).
+        A previously healed selector goes to the front of the queue in sequential mode,
+        so a broken primary costs no timeout. When racing, waiting costs the same for
+        every candidate, so the primary keeps priority and the heal comes second.
+        """
+        candidates = [selector, *fallbacks]
+        if cached:
+            rest = [c for c in candidates if c != cached]
+            candidates = [selector, cached, *rest[1:]] if self.race and cached != selector else [cached, *rest]
+        return candidates
+
+    def _settle(self, selector: str, cached: str | None, winner: str | None,
+                start: float = None, attempts: list[dict] = None, update_cache: bool = True) -> Locator:
+        """
+        Log the outcome, update the healing cache (unless the caller does it with
+        _update_cache) and build the locator to return.
+        With instrumentation enabled, also emit a span describing the lookup.
+        """
+        if attempts is not None:
+            elapsed = time.perf_counter() - start
+            instrumentation.emit(instrumentation.Span(
+                name="SmartLocator.get_locator",
+                kind="smart_locator",
+                code=f"{type(self).__module__}:{type(self).__qualname__}.get_locator",
+                start=time.time() - elapsed,
+                duration_ms=elapsed * 1000,
+                status="ok" if winner else "error",
+                attributes={
+                    "selector": selector,
+                    "winner": winner,
+                    "healed": winner is not None and winner != selector,
+                    "cache_hit": cached is not None and winner == cached,
+                    "mode": "race" if self.race else "sequential",
+                    "attempts": attempts,
+                },
+            ))
+        if update_cache:
+            self._update_cache(self.page.url, selector, cached, winner)
+        if winner is None:
+            # If all fail, return the primary locator so the calling code raises the standard Playwright error
+            # (or we could raise a custom error here)
+            logger.error(f"Self-Healing FAILED. All selectors failed for target (Primary: '{selector}').")
+            return self.page.locator(selector)
+
+        if winner != selector:
+            logger.warning(f"Self-Healing SUCCESS! Primary '{selector}' failed. Healed using fallback '{winner}'.")
+        return self.page.locator(winner)
+
+    def _update_cache(self, url: str, selector: str, cached: str | None, winner: str | None):
+        """Record a new heal, or forget a cached one that failed or is no longer needed."""
+        if not self.cache:
+            return
+        if winner is None or winner == selector:
+            # Nothing matched, or the primary works again: the cached heal is of no use.
+            if cached:
+                self.cache.invalidate(url, selector)
+        elif winner != cached:
+            self.cache.put(url, selector, winner)
+
+    def _race(self, candidates: list[str], timeout: int, attempts: list[dict] = None) -> str | None:
+        """
+        Wait for whichever candidate attaches first, then return the highest-priority match.
+        If 'attempts' is a list, the shared wait and each candidate check are timed into it.
+        """
+        # 1. Combine every candidate into a single 'or' locator, so the browser polls
+        # them all in one wait instead of us waiting on each in turn.
+        combined = self.page.locator(candidates[0])
+        for candidate in candidates[1:]:
+            combined = combined.or_(self.page.locator(candidate))
+
+        t0 = time.perf_counter()
         try:
-            loc = self.page.locator(selector)
-            # Check if attached. If it's not attached within timeout, we assume it's broken/missing.
-            # Note: 'visible' might be better, but 'attached' is safer for existence.
-            loc.wait_for(state="attached", timeout=timeout)
-            return loc
+            combined.first.wait_for(state="attached", timeout=timeout)
         except PlaywrightTimeoutError:
-            logger.info(f"Primary selector '{selector}' failed/timed out. Attempting self-healing with fallbacks...")
+            _record(attempts, "|".join(candidates), t0, False)
+            return None
+        _record(attempts, "|".join(candidates), t0, True)
+
+        # 2. Something is attached now; pick the first candidate (in priority order) that matches.
+        for candidate in candidates:
+            t0 = time.perf_counter()
+            matched = self.page.locator(candidate).count() > 0
+            _record(attempts, candidate, t0, matched)
+            if matched:
+                return candidate
+        # The match detached again between the wait and the check.
+        return None
 
-        # 2. Try Fallbacks
-        for fb in fallbacks:
+    def _sequential(self, candidates: list[str], timeout: int, attempts: list[dict] = None) -> str | None:
+        """
+        Try each candidate in turn, waiting up to 'timeout' on each.
+        If 'attempts' is a list, each wait is timed into it.
+        """
+        for candidate in candidates:
+            t0 = time.perf_counter()
             try:
-                loc = self.page.locator(fb)
-                loc.wait_for(state="attached", timeout=timeout)
-                logger.warning(f"Self-Healing SUCCESS! Primary '{selector}' failed. Healed using fallback '{fb}'.")
-                return loc
+                # Check if attached. If it's not attached within timeout, we assume it's broken/missing.
+                # Note: 'visible' might be better, but 'attached' is safer for existence.
+                self.page.locator(candidate).wait_for(state="attached", timeout=timeout)
+                _record(attempts, candidate, t0, True)
+                return candidate
             except PlaywrightTimeoutError:
-                continue
-        
-        # 3. If all fail, return the primary locator so the calling code raises the standard Playwright error
-        # (or we could raise a custom error here)
-        logger.error(f"Self-Healing FAILED. All selectors failed for target (Primary: '{selector}').")
-        return self.page.locator(selector)
+                _record(attempts, candidate, t0, False)
+                logger.info(f"Selector '{candidate}' failed/timed out. Trying the next candidate...")
+        return None
+
+def _record(attempts: list[dict] | None, selector: str, t0: float, matched: bool):
+    """Append one timed attempt to 'attempts' (a no-op when instrumentation is off)."""
+    if attempts is not None:
+        attempts.append({"selector": selector, "ms": round((time.perf_counter() - t0) * 1000, 3), "matched": matched})
@@ -0,0 +1,395 @@
+import ast
+import glob
+import importlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import textwrap
+from fnmatch import fnmatch
+
+# Runtime coverage recorded with --record-impact, one file per (xdist) process.
+IMPACT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".test_impact"))
+# Changes to these files can affect any test, so they select the whole suite.
+GLOBAL_FILES = ["pytest.ini", "requirements.txt", "azure-pipelines.yml", "local_app/*"]
+# Data files read while tests run, mapped to the symbol that reads them. The tests
+# depending on that symbol are selected when the file changes.
+DATA_FILES = [
+    # Recorded traffic of one test module (--network=replay).
+    ("tests/hars/*.har", lambda path: f"tests/{os.path.splitext(os.path.basename(path))[0]}.py::*"),
+    # Baselines of the visual checks.
+    ("tests/snapshots/*", lambda path: "conftest.py::assert_snapshot"),
+    # Budgets checked by the (autouse) web vitals collector.
+    ("perf_budgets.json", lambda path: "conftest.py::web_vitals"),
+]
+
+# Dependencies and changes are "symbols": '<file>::<qualified name>', e.g.
+#   pages/login_page.py::LoginPage.login
+#   pages/locators.py::CartLocators.ITEM_NAME
+#   pages/login_page.py::*        (module-level code: imports, constants, ...)
+# A dependency on a class also covers its members and vice versa.
+
+def _matches(dependency: str, changed: str) -> bool:
+    dep_file, dep_name = dependency.split("::", 1)
+    changed_file, changed_name = changed.split("::", 1)
+    if dep_file != changed_file:
+        return False
+    return changed_name == "*" or dep_name == changed_name \
+        or dep_name.startswith(changed_name + ".") or changed_name.startswith(dep_name + ".")
+
+# ---------------------------------------------------------------------------
+# Which symbols changed
+
+def _definitions(source: str) -> list[tuple[int, int, str]]:
+    """(first line, last line, name) of every function, class, method and class attribute."""
+    definitions = []
+
+    def first_line(node):
+        return min([node.lineno, *[d.lineno for d in getattr(node, "decorator_list", [])]])
+
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            definitions.append((first_line(node), node.end_lineno, node.name))
+        elif isinstance(node, ast.ClassDef):
+            definitions.append((first_line(node), node.end_lineno, node.name))
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    definitions.append((first_line(member), member.end_lineno, f"{node.name}.{member.name}"))
+                elif isinstance(member, (ast.Assign, ast.AnnAssign)):
+                    targets = member.targets if isinstance(member, ast.Assign) else [member.target]
+                    for target in targets:
+                        if isinstance(target, ast.Name):
+                            definitions.append((member.lineno, member.end_lineno, f"{node.name}.{target.id}"))
+    return definitions
+
+def _symbol_at(definitions: list[tuple[int, int, str]], line: int) -> str:
+    """Innermost definition containing 'line', or '*' for module-level code."""
+    containing = [d for d in definitions if d[0] <= line <= d[1]]
+    if not containing:
+        return "*"
+    return min(containing, key=lambda d: d[1] - d[0])[2]
+
+def changed_symbols(ref: str, root: str) -> set[str] | None:
+    """
+    Symbols changed between 'ref' and the working tree (including untracked files).
+    Returns None when a change can affect every test.
+    """
+    diff = subprocess.run(
+        ["git", "diff", "-U0", "--no-color", "--no-renames", ref, "--"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    lines = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("--- a/"):
+            path = line[6:]
+        elif line.startswith("+++ "):
+            # Deleted files keep the old path.
+            path = line[6:] if line.startswith("+++ b/") else path
+            lines.setdefault(path, [])
+        elif line.startswith("@@") and path:
+            start, count = re.match(r"@@ -\S+ \+(\d+)(?:,(\d+))?", line).groups()
+            start, count = int(start), int(count if count is not None else 1)
+            # A pure deletion touches the lines around it.
+            lines[path].extend(range(start, start + count) if count else [start, start + 1])
+    for path in untracked:
+        lines[path] = None
+
+    symbols = set()
+    for path, changed_lines in lines.items():
+        if any(fnmatch(path, pattern) for pattern in GLOBAL_FILES):
+            return None
+        data = [reader(path) for pattern, reader in DATA_FILES if fnmatch(path, pattern)]
+        if data:
+            symbols.update(data)
+            continue
+        if not path.endswith(".py"):
+            continue
+        full_path = os.path.join(root, path)
+        if changed_lines is None or not os.path.exists(full_path):
+            symbols.add(f"{path}::*")
+            continue
+        with open(full_path, encoding="utf-8") as f:
+            definitions = _definitions(f.read())
+        for line in changed_lines:
+            name = _symbol_at(definitions, line)
+            if path == "conftest.py" and (name == "*" or name.startswith("pytest_")):
+                # Options and hooks apply to every test.
+                return None
+            symbols.add(f"{path}::{name}")
+    return symbols
+
+# ---------------------------------------------------------------------------
+# What a test depends on
+
+class DependencyIndex:
+    """
+    Static dependencies of test functions and fixtures inside the project at 'root'.
+
+    A function depends on itself, on the project functions it calls, and on the methods
+    and attributes it uses on page objects (e.g. `login_page.login` where
+    `login_page = LoginPage(page)`). Methods are followed through `self.<name>`, so
+    LoginPage.login also depends on LoginLocators.username_input and, through the
+    selector it is declared with, on LoginLocators.USERNAME_INPUT.
+    Classes named inside methods (collaborators such as HealingCache) count as a whole.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.cache = {}
+
+    def symbol(self, obj, name: str = None) -> str | None:
+        """Symbol of a project function or class (optionally of one of its members)."""
+        try:
+            path = inspect.getsourcefile(obj)
+        except TypeError:
+            return None
+        if not path or not os.path.exists(path) or not os.path.abspath(path).startswith(self.root + os.sep) \
+                or "site-packages" in path:
+            return None
+        relative = os.path.relpath(path, self.root).replace(os.sep, "/")
+        qualname = obj.__qualname__ + (f".{name}" if name else "")
+        return f"{relative}::{qualname}"
+
+    def member(self, cls: type, name: str) -> set[str]:
+        """Dependencies of using attribute 'name' on an instance of 'cls'."""
+        key = (cls, name)
+        if key in self.cache:
+            return self.cache[key]
+        self.cache[key] = set()
+        for klass in cls.__mro__:
+            if name in vars(klass):
+                symbol = self.symbol(klass, name)
+                if symbol is None:
+                    break
+                value = vars(klass)[name]
+                value = getattr(value, "__func__", value)
+                found = {symbol}
+                if inspect.isfunction(value):
+                    found |= self.function(value, self_class=cls)
+                elif isinstance(getattr(value, "selector", None), str):
+                    # An Element declared from a selector constant of the same class.
+                    found |= {
+                        self.symbol(klass, other) for other, constant in vars(klass).items()
+                        if other.isupper() and constant == value.selector
+                    }
+                if hasattr(type(value), "__get__") and self.symbol(type(value)):
+                    # A project descriptor (Element): reading it runs its __get__, which
+                    # resolves the Locator through the page object's locator_for().
+                    found |= self.member(type(value), "__get__")
+                    found |= self.member(cls, "locator_for")
+                self.cache[key] = found
+                break
+        return self.cache[key]
+
+    def function(self, func, self_class: type = None) -> set[str]:
+        """Dependencies of a function, method or fixture body."""
+        func = inspect.unwrap(func)
+        key = (func, self_class)
+        if key in self.cache:
+            return self.cache[key]
+        own = self.symbol(func)
+        self.cache[key] = found = {own} if own else set()
+        if own is None:
+            # Fixtures and helpers of installed packages are not followed.
+            return found
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+        except (OSError, TypeError, SyntaxError):
+            return found
+        names = func.__globals__
+
+        def project_class(node):
+            value = names.get(node.id) if isinstance(node, ast.Name) else None
+            return value if inspect.isclass(value) and self.symbol(value) else None
+
+        # Variables holding page objects: login_page = LoginPage(page)
+        instances = {}
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+                cls = project_class(node.value.func)
+                if cls:
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            instances[target.id] = cls
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Call) and project_class(node.value.func):
+                # SmartLocator(page).get_locator(...)
+                found |= self.member(project_class(node.value.func), node.attr)
+            elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+                if node.value.id == "self" and self_class is not None:
+                    found |= self.member(self_class, node.attr)
+                elif node.value.id in instances:
+                    found |= self.member(instances[node.value.id], node.attr)
+                elif project_class(node.value):
+                    found |= self.member(project_class(node.value), node.attr)
+            elif isinstance(node, ast.Call) and project_class(node.func):
+                found |= self.member(project_class(node.func), "__init__")
+            elif isinstance(node, ast.Name) and self_class is not None and project_class(node):
+                # A collaborator of a page object or utility (e.g. SmartLocator's HealingCache)
+                # is usually kept on self, where its type is unknown: depend on the whole class.
+                found.add(self.symbol(project_class(node)))
+            elif isinstance(node, ast.Name) and node.id != "self":
+                value = names.get(node.id)
+                if inspect.isfunction(value) and value is not func and self.symbol(value):
+                    found |= self.function(value)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                # Imports inside functions, e.g. lazy imports in page objects.
+                try:
+                    module = importlib.import_module(node.module)
+                except ImportError:
+                    continue
+                for alias in node.names:
+                    value = getattr(module, alias.name, None)
+                    symbol = self.symbol(value) if inspect.isclass(value) or inspect.isfunction(value) else None
+                    if symbol:
+                        found.add(symbol)
+                        if inspect.isclass(value):
+                            found |= self.member(value, "__init__")
+        return found
+
+    def item(self, item) -> set[str]:
+        """Dependencies of a collected test: its own function plus every project fixture it uses."""
+        found = self.function(item.function)
+        # Not public, but present with the same shape in every pytest from 7.0 on.
+        for fixturedefs in item._fixtureinfo.name2fixturedefs.values():
+            for fixturedef in fixturedefs:
+                found |= self.function(fixturedef.func)
+        return found
+
+    def _module_file(self, module: str) -> str | None:
+        """Project file (relative path) of a dotted module name, or None outside the project."""
+        base = os.path.join(self.root, *module.split("."))
+        for path in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.exists(path):
+                return os.path.relpath(path, self.root).replace(os.sep, "/")
+        return None
+
+    def _direct_imports(self, path: str) -> set[str]:
+        """Project files imported by the module at 'path' (relative to the root)."""
+        try:
+            with open(os.path.join(self.root, path), encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+        except (OSError, SyntaxError):
+            return set()
+        package = os.path.dirname(path).replace("/", ".")
+        modules = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules += [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    parts = package.split(".") if package else []
+                    parts = parts[:len(parts) - node.level + 1]
+                    module = ".".join(parts + ([node.module] if node.module else []))
+                else:
+                    module = node.module or ""
+                # 'from utils import visual' imports utils/__init__.py and utils/visual.py.
+                modules += [module] + [f"{module}.{alias.name}" if module else alias.name for alias in node.names]
+        return {found for found in map(self._module_file, filter(None, modules)) if found and found != path}
+
+    def imports(self, path: str) -> set[str]:
+        """'path' and every project file it imports, directly or through other project modules."""
+        key = ("imports", path)
+        if key not in self.cache:
+            found, pending = {path}, [path]
+            while pending:
+                for imported in self._direct_imports(pending.pop()) - found:
+                    found.add(imported)
+                    pending.append(imported)
+            self.cache[key] = found
+        return self.cache[key]
+
+    def item_imports(self, item) -> set[str]:
+        """Project files loaded for a test: its module and the conftest.py files above it, with their imports."""
+        path = os.path.relpath(str(item.path), self.root).replace(os.sep, "/")
+        found = self.imports(path)
+        directory = os.path.dirname(path)
+        while True:
+            conftest = f"{directory}/conftest.py" if directory else "conftest.py"
+            if os.path.exists(os.path.join(self.root, conftest)):
+                found = found | self.imports(conftest)
+            if not directory:
+                return found
+            directory = os.path.dirname(directory)
+
+# ---------------------------------------------------------------------------
+# Runtime coverage
+
+class ImpactSink:
+    """
+    Instrumentation sink that remembers which page-object code each test really ran,
+    complementing the static index (e.g. methods reached through helpers).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.coverage = {}
+
+    def emit(self, span):
+        if span.test and span.code:
+            self.coverage.setdefault(span.test.split("[")[0], set()).add(span.code)
+
+    def save(self):
+        """Update the coverage file; tests that did not run this time keep their old coverage."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        coverage = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                coverage = json.load(f)
+        coverage.update({test: sorted(codes) for test, codes in self.coverage.items()})
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(coverage, f, indent=1, sort_keys=True)
+
+def load_runtime_coverage(index: DependencyIndex, impact_dir: str = IMPACT_DIR) -> dict[str, set[str]]:
+    """{test id without parameters: symbols} merged from every recorded coverage file."""
+    coverage = {}
+    for path in glob.glob(os.path.join(impact_dir, "*.json")):
+        with open(path, encoding="utf-8") as f:
+            for test, codes in json.load(f).items():
+                symbols = coverage.setdefault(test, set())
+                for code in codes:
+                    module_name, qualname = code.split(":", 1)
+                    try:
+                        owner = importlib.import_module(module_name)
+                        *path_parts, name = qualname.split(".")
+                        for part in path_parts:
+                            owner = getattr(owner, part)
+                    except (ImportError, AttributeError):
+                        continue
+                    found = index.member(owner, name) if inspect.isclass(owner) else {index.symbol(getattr(owner, name, None))}
+                    symbols |= {symbol for symbol in found if symbol}
+    return coverage
+
+# ---------------------------------------------------------------------------
+# Selection
+
+def select(items: list, changed: set[str], index: DependencyIndex, runtime: dict[str, set[str]]) -> tuple[list, list]:
+    """
+    Split items into (selected, deselected) by whether any of their dependencies changed.
+
+    The dependency index cannot see every call (e.g. methods of objects passed around as
+    arguments), so a changed symbol that no test depends on is not taken as unused: it
+    selects every test whose module or conftest.py imports its file, directly or not.
+    """
+    selected, deselected = [], []
+    unmatched = set(changed)
+    for item in items:
+        dependencies = index.item(item) | runtime.get(item.nodeid.split("[")[0], set())
+        hits = {change for change in changed if any(_matches(dep, change) for dep in dependencies)}
+        unmatched -= hits
+        (selected if hits else deselected).append(item)
+
+    unmatched_files = {change.split("::", 1)[0] for change in unmatched}
+    if unmatched_files:
+        reached = {id(item) for item in deselected if index.item_imports(item) & unmatched_files}
+        selected = [item for item in items if id(item) in reached or item in selected]
+        deselected = [item for item in deselected if id(item) not in reached]
+    return selected, deselected
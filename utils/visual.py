@@ -0,0 +1,205 @@
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+
+import allure
+
+# numpy and Pillow are only needed for visual checks; the rest of the suite runs without them.
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    np = Image = None
+
+# Baselines live next to the tests, one directory per browser (rendering differs between engines).
+SNAPSHOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "tests", "snapshots"))
+# Actual and diff images of failed comparisons.
+RESULTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "test-results", "visual"))
+
+def available() -> bool:
+    """True if numpy and Pillow are installed."""
+    return np is not None
+
+@dataclass
+class Baseline:
+    """A baseline image, decoded once per process."""
+    # SHA-1 of the PNG file, for the exact-match fast path.
+    digest: str
+    pixels: "np.ndarray"
+
+# {path: (mtime, Baseline)}; an updated file (e.g. --update-snapshots on another worker) is reloaded.
+_baselines = {}
+
+def _digest(png: bytes) -> str:
+    """Exact content hash of a PNG; equal digests mean byte-identical files."""
+    return hashlib.sha1(png).hexdigest()
+
+def decode(png: bytes) -> "np.ndarray":
+    """PNG bytes -> height x width x 4 uint8 array (RGBA)."""
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGBA"))
+
+def encode(pixels: "np.ndarray") -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def load_baseline(path: str) -> Baseline:
+    """Return the decoded baseline at 'path', from memory when the file has not changed."""
+    mtime = os.path.getmtime(path)
+    cached = _baselines.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "rb") as f:
+            png = f.read()
+        cached = _baselines[path] = (mtime, Baseline(_digest(png), decode(png)))
+    return cached[1]
+
+def save_baseline(path: str, png: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(png)
+    _baselines.pop(path, None)
+
+@dataclass
+class Comparison:
+    """Outcome of comparing a screenshot to its baseline."""
+    diff_pixels: int
+    total_pixels: int
+    size_mismatch: bool = False
+    # height x width booleans, True where a pixel differs.
+    changed: "np.ndarray" = None
+
+    @property
+    def diff_ratio(self) -> float:
+        return self.diff_pixels / self.total_pixels if self.total_pixels else 0.0
+
+def _neighbourhood(pixels: "np.ndarray", reduce) -> "np.ndarray":
+    """Per-channel min or max over the 3x3 neighbourhood of every pixel."""
+    padded = np.pad(pixels, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    height, width = pixels.shape[:2]
+    result = pixels.copy()
+    for dy in range(3):
+        for dx in range(3):
+            reduce(result, padded[dy:dy + height, dx:dx + width], out=result)
+    return result
+
+def _within(pixels: "np.ndarray", other: "np.ndarray", tolerance: int) -> "np.ndarray":
+    """True where every channel of 'pixels' lies in the range of the 3x3 neighbourhood of 'other'."""
+    pixels = pixels.astype(np.int16)
+    low = _neighbourhood(other, np.minimum).astype(np.int16) - tolerance
+    high = _neighbourhood(other, np.maximum).astype(np.int16) + tolerance
+    return ((pixels >= low) & (pixels <= high)).all(axis=2)
+
+def _bounding_box(changed: "np.ndarray"):
+    """Slices of the box around the True pixels, one pixel wider on each side; None if there are none."""
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not rows.size:
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    # The margin keeps the neighbourhoods at the edge of the box complete.
+    return np.s_[max(rows[0] - 1, 0):rows[-1] + 2, max(cols[0] - 1, 0):cols[-1] + 2]
+
+def compare(actual: "np.ndarray", expected: "np.ndarray", threshold: float = 0.1,
+            anti_aliasing: bool = True, regions: list[tuple[int, int, int, int]] = ()) -> Comparison:
+    """
+    Count the pixels that differ between two RGBA arrays of the same size.
+
+    A pixel differs when one of its channels is off by more than 'threshold' (0-1) of the
+    full range. With 'anti_aliasing', a differing pixel is forgiven when each image's value
+    also occurs in the 3x3 neighbourhood of the other: edges rendered a pixel apart and
+    smoothed fonts do not count, a new one-pixel line does. 'regions' are (x, y, width,
+    height) boxes to ignore. All of it is vectorized: whole pixels are compared as 32-bit
+    words first, and the per-channel and neighbourhood tests only run on the bounding box
+    of the pixels that changed at all.
+    """
+    if actual.shape != expected.shape:
+        return Comparison(diff_pixels=actual.shape[0] * actual.shape[1],
+                          total_pixels=actual.shape[0] * actual.shape[1], size_mismatch=True)
+    tolerance = int(threshold * 255)
+    height, width = actual.shape[:2]
+    actual, expected = np.ascontiguousarray(actual), np.ascontiguousarray(expected)
+    changed = actual.view(np.uint32).reshape(height, width) != expected.view(np.uint32).reshape(height, width)
+    for x, y, w, h in regions:
+        changed[max(y, 0):y + h, max(x, 0):x + w] = False
+
+    box = _bounding_box(changed)
+    if box and tolerance:
+        # |actual - expected| per channel, staying in uint8.
+        delta = np.maximum(actual[box], expected[box])
+        delta -= np.minimum(actual[box], expected[box])
+        changed[box] &= delta.max(axis=2) > tolerance
+        box = _bounding_box(changed)
+    if box and anti_aliasing:
+        shifted = _within(actual[box], expected[box], tolerance) & _within(expected[box], actual[box], tolerance)
+        changed[box] &= ~shifted
+
+    return Comparison(diff_pixels=int(changed.sum()), total_pixels=changed.size, changed=changed)
+
+def diff_image(actual: "np.ndarray", changed: "np.ndarray") -> "np.ndarray":
+    """Changed pixels in red over a faded grayscale copy of the actual image."""
+    gray = (actual[..., :3].mean(axis=2) * 0.3 + 178).astype(np.uint8)
+    image = np.dstack([gray, gray, gray, np.full_like(gray, 255)])
+    image[changed] = (255, 0, 0, 255)
+    return image
+
+def _save_results(baseline_path: str, images: dict[str, bytes]) -> str:
+    """
+    Write {kind: PNG} to RESULTS_DIR as <browser>-<name>-<kind>.png (e.g. chromium-cart_page-actual.png)
+    and attach them to the Allure report. Returns <browser>-<name>.
+    """
+    directory, filename = os.path.split(os.path.splitext(baseline_path)[0])
+    name = f"{os.path.basename(directory)}-{filename}"
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    for kind, data in images.items():
+        with open(os.path.join(RESULTS_DIR, f"{name}-{kind}.png"), "wb") as f:
+            f.write(data)
+        allure.attach(data, name=f"{name} ({kind})", attachment_type=allure.attachment_type.PNG)
+    return name
+
+def fail_missing(png: bytes, baseline_path: str):
+    """
+    Raise AssertionError for a check without a baseline, e.g. in CI where a baseline
+    saved on the fly would be thrown away with the checkout. The screenshot is kept in
+    RESULTS_DIR and the Allure report, ready to be reviewed and committed.
+    """
+    _save_results(baseline_path, {"actual": png})
+    raise AssertionError(
+        f"No baseline at {baseline_path}; the current screenshot is in {RESULTS_DIR}. "
+        "Record it with --update-snapshots (same browser and profile) and commit it."
+    )
+
+def assert_matches(png: bytes, baseline_path: str, threshold: float = 0.1, max_diff_pixels: int = 0,
+                   max_diff_ratio: float = 0.0, anti_aliasing: bool = True,
+                   regions: list[tuple[int, int, int, int]] = ()) -> Comparison | None:
+    """
+    Compare a PNG screenshot to the baseline at 'baseline_path'.
+
+    Byte-identical screenshots (the common case for an unchanged page) pass on an exact
+    SHA-1 of the PNG without being decoded; this is a fast path for exact matches, not a
+    perceptual hash, so any changed pixel falls through to the pixel comparison, which
+    decides. Otherwise the pixels are compared; if more differ than
+    allowed, the actual and diff images are written to RESULTS_DIR, attached to the
+    Allure report, and an AssertionError is raised.
+    """
+    baseline = load_baseline(baseline_path)
+    if _digest(png) == baseline.digest:
+        return None
+    actual = decode(png)
+    comparison = compare(actual, baseline.pixels, threshold, anti_aliasing, regions)
+    if not comparison.size_mismatch and (comparison.diff_pixels <= max_diff_pixels
+                                         or comparison.diff_ratio <= max_diff_ratio):
+        return comparison
+
+    attachments = {"actual": png}
+    if not comparison.size_mismatch:
+        attachments["diff"] = encode(diff_image(actual, comparison.changed))
+    name = _save_results(baseline_path, attachments)
+    with open(baseline_path, "rb") as f:
+        allure.attach(f.read(), name=f"{name} (expected)", attachment_type=allure.attachment_type.PNG)
+
+    if comparison.size_mismatch:
+        raise AssertionError(f"Screenshot size differs from baseline {baseline_path}; see {RESULTS_DIR}")
+    raise AssertionError(
+        f"{comparison.diff_pixels} pixels ({comparison.diff_ratio:.2%}) differ from baseline "
+        f"{baseline_path}; see {RESULTS_DIR}"
+    )
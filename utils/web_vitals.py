@@ -0,0 +1,155 @@
+import json
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import allure
+from playwright.sync_api import Page, Error as PlaywrightError
+
+# Budgets checked by default, next to pytest.ini.
+DEFAULT_BUDGETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "perf_budgets.json"))
+
+# Collects the performance data the browser already has, in one round trip.
+# 'since' is the [timeOrigin, now] mark taken before an action (or null after a
+# navigation). If the action stayed on the same document, only what happened
+# after the mark is reported; if it loaded a new document, everything is.
+#
+# LCP and layout shifts are not available through getEntriesByType, so they are
+# read with buffered PerformanceObservers (browsers without support report null).
+COLLECT_SCRIPT = """
+async (since) => {
+    const sameDocument = since !== null && since[0] === performance.timeOrigin;
+    const from = sameDocument ? since[1] : 0;
+
+    const observed = (type) => new Promise((resolve) => {
+        if (!(PerformanceObserver.supportedEntryTypes || []).includes(type)) {
+            resolve(null);
+            return;
+        }
+        const entries = [];
+        const observer = new PerformanceObserver((list) => entries.push(...list.getEntries()));
+        observer.observe({type, buffered: true});
+        // Buffered entries are delivered in a later task.
+        setTimeout(() => {
+            entries.push(...observer.takeRecords());
+            observer.disconnect();
+            resolve(entries);
+        }, 0);
+    });
+    const round = (value) => value === null || value === undefined ? null : Math.round(value * 10) / 10;
+
+    const metrics = {new_document: !sameDocument};
+    const navigation = performance.getEntriesByType("navigation")[0];
+    if (navigation && !sameDocument) {
+        metrics.ttfb = round(navigation.responseStart);
+        metrics.dom_content_loaded = round(navigation.domContentLoadedEventEnd);
+        metrics.load = round(navigation.loadEventEnd || null);
+        metrics.document_bytes = navigation.transferSize;
+    }
+    if (sameDocument) {
+        metrics.action_ms = round(performance.now() - from);
+    }
+
+    const paints = Object.fromEntries(performance.getEntriesByType("paint").map((e) => [e.name, e.startTime]));
+    metrics.fcp = sameDocument ? null : round(paints["first-contentful-paint"]);
+
+    const lcp = await observed("largest-contentful-paint");
+    const lcpEntries = lcp === null ? null : lcp.filter((e) => e.startTime >= from);
+    metrics.lcp = lcpEntries === null || !lcpEntries.length ? null : round(lcpEntries[lcpEntries.length - 1].startTime);
+
+    const shifts = await observed("layout-shift");
+    metrics.cls = shifts === null ? null : round(
+        shifts.filter((e) => e.startTime >= from && !e.hadRecentInput).reduce((sum, e) => sum + e.value, 0) * 1000
+    ) / 1000;
+
+    const resources = performance.getEntriesByType("resource").filter((e) => e.startTime >= from);
+    metrics.resource_count = resources.length;
+    metrics.transfer_bytes = resources.reduce((sum, e) => sum + (e.transferSize || 0), 0);
+    metrics.slowest_resource_ms = round(Math.max(0, ...resources.map((e) => e.duration)));
+    metrics.resources_by_type = {};
+    for (const e of resources) {
+        metrics.resources_by_type[e.initiatorType] = (metrics.resources_by_type[e.initiatorType] || 0) + 1;
+    }
+    return metrics;
+}
+"""
+
+@dataclass
+class Budget:
+    """
+    Upper limit for one metric. 'path' matches the end of the page path
+    ("" matches every page); 'user' and 'step' narrow the budget down when set.
+    """
+    metric: str
+    max: float
+    path: str = ""
+    user: str | None = None
+    step: str | None = None
+
+    def applies(self, record: dict) -> bool:
+        path = urlsplit(record["url"]).path
+        return (path.endswith("/" + self.path) if self.path else True) \
+            and self.user in (None, record["user"]) \
+            and self.step in (None, record["step"])
+
+def load_budgets(path: str = DEFAULT_BUDGETS_PATH) -> list[Budget]:
+    """Read budgets from a JSON list of Budget fields; a missing file means no budgets."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [Budget(**budget) for budget in json.load(f)]
+
+class WebVitalsCollector:
+    """
+    Captures navigation timing, paint timings (FCP/LCP), CLS and a resource summary
+    after navigations and key page-object actions, attaches them to the Allure report
+    and fails the test when a budget is exceeded.
+
+    One collector is used per test; 'user' is the role the test is running as and is
+    updated by LoginPage.login.
+    """
+
+    def __init__(self, budgets: list[Budget], user: str | None = None):
+        self.budgets = budgets
+        self.user = user
+        self.records = []
+
+    @contextmanager
+    def measure(self, page: Page, step: str):
+        """Capture the metrics of whatever the wrapped action does."""
+        mark = page.evaluate("() => [performance.timeOrigin, performance.now()]")
+        yield
+        self.capture(page, step, since=mark)
+
+    def capture(self, page: Page, step: str, since: list[float] = None) -> dict:
+        """Collect the metrics of the current page, attach them and check the budgets."""
+        page.wait_for_load_state("load")
+        try:
+            metrics = page.evaluate(COLLECT_SCRIPT, since)
+        except PlaywrightError:
+            # The action started a navigation that replaced the document mid-evaluate.
+            page.wait_for_load_state("load")
+            metrics = page.evaluate(COLLECT_SCRIPT, since)
+        record = {"step": step, "url": page.url, "user": self.user, **metrics}
+        self.records.append(record)
+        allure.attach(
+            json.dumps(record, indent=2),
+            name=f"Web vitals: {step} ({urlsplit(page.url).path})",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        self.check(record)
+        return record
+
+    def check(self, record: dict):
+        """Raise AssertionError listing every budget the record exceeds."""
+        exceeded = [
+            f"{budget.metric}={record[budget.metric]} > {budget.max}"
+            for budget in self.budgets
+            if budget.applies(record) and record.get(budget.metric) is not None and record[budget.metric] > budget.max
+        ]
+        if exceeded:
+            raise AssertionError(
+                f"Performance budget exceeded after {record['step']} on {record['url']} "
+                f"(user: {record['user']}): {', '.join(exceeded)}"
+            )